@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compares pytest-benchmark JSON results against committed baseline.
+
+Usage: `python benchmarks/compare.py RESULTS [--baseline PATH] [--threshold RATIO] [--update]`.
+
+Baseline keeps only minimal time of every benchmark, so it stays small and
+readable in diffs. Exits with non-zero status if any benchmark is slower than
+its baseline by more than the threshold.
+
+!!! warning
+    Baseline holds absolute timings, so it is only meaningful on the machine it
+    was recorded on. Regenerate it locally before looking for regressions:
+    run `nox -s benchmark -- --update` on the baseline revision (e.g. `main`),
+    then `nox -s benchmark` on your changes.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import sys
+import typing
+
+BASELINE_PATH: typing.Final[pathlib.Path] = pathlib.Path(__file__).with_name("baseline.json")
+"""Path to committed baseline."""
+
+DEFAULT_THRESHOLD: typing.Final[float] = 0.25
+"""Allowed slowdown ratio before benchmark is considered as regressed."""
+
+
+def load_timings(results_path: pathlib.Path) -> dict[str, float]:
+    """Returns minimal times of benchmarks from pytest-benchmark JSON results.
+
+    Parameters
+    ----------
+    results_path : pathlib.Path
+        Path to `--benchmark-json` output.
+
+    Returns
+    -------
+    dict[str, float]
+        Minimal time in seconds by benchmark full name.
+    """
+    results = json.loads(results_path.read_text())
+    return {bench["fullname"]: bench["stats"]["min"] for bench in results["benchmarks"]}
+
+
+def find_regressions(
+    timings: dict[str, float],
+    baseline: dict[str, float],
+    /,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> dict[str, float]:
+    """Finds benchmarks which became slower than baseline by more than threshold.
+
+    !!! note
+        Benchmarks that are missing in baseline are not considered as regressed.
+
+    Parameters
+    ----------
+    timings : dict[str, float], /
+        Current minimal times by benchmark name.
+    baseline : dict[str, float], /
+        Baseline minimal times by benchmark name.
+    threshold : float = DEFAULT_THRESHOLD, *
+        Allowed slowdown ratio.
+
+    Returns
+    -------
+    dict[str, float]
+        Slowdown ratio of every regressed benchmark by its name.
+    """
+    slowdowns = {name: timing / baseline[name] - 1 for name, timing in timings.items() if name in baseline}
+    return {name: slowdown for name, slowdown in slowdowns.items() if slowdown > threshold}
+
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("results", type=pathlib.Path, help="pytest-benchmark JSON results.")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--update", action="store_true", help="Overwrite baseline with results.")
+    args = parser.parse_args(argv)
+
+    timings = load_timings(args.results)
+    if args.update:
+        args.baseline.write_text(json.dumps(timings, indent=4, sort_keys=True) + "\n")
+        print(f"Baseline {args.baseline} updated with {len(timings)} benchmarks.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = find_regressions(timings, baseline, threshold=args.threshold)
+    for name, slowdown in sorted(regressions.items()):
+        print(f"REGRESSION {name}: {slowdown:+.1%} (threshold {args.threshold:.0%})")
+
+    for name in sorted(timings.keys() - baseline.keys()):
+        print(f"NEW {name}: no baseline")
+
+    print(f"{len(regressions)} of {len(timings)} benchmarks regressed.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks of core progressbar operations across progressbar lengths.
+
+Results are compared against `benchmarks/baseline.json` by `nox -s benchmark`.
+"""
+import itertools
+import typing
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from multibar.impl.clients import ProgressbarClient
+from multibar.impl.contracts import WRITE_PROGRESS_CONTRACT, ContractManager
+from multibar.impl.hooks import WRITER_HOOKS, Hooks
+from multibar.impl.writers import ProgressbarWriter
+
+LENGTHS = (10, 100, 1_000, 10_000, 100_000)
+END_VALUE = 1_000
+
+
+def _ticks() -> typing.Iterator[int]:
+    return itertools.cycle(range(END_VALUE + 1))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_write(benchmark: BenchmarkFixture, length: int) -> None:
+    writer, ticks = ProgressbarWriter(), _ticks()
+    benchmark(lambda: writer.write(next(ticks), END_VALUE, length=length))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_write_str(benchmark: BenchmarkFixture, length: int) -> None:
+    writer, ticks = ProgressbarWriter(), _ticks()
+    benchmark(lambda: writer.write_str(next(ticks), END_VALUE, length=length))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_get_progress(benchmark: BenchmarkFixture, length: int) -> None:
+    client, ticks = ProgressbarClient(), _ticks()
+    benchmark(lambda: client.get_progress(next(ticks), END_VALUE, length=length))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_get_progress_with_writer_hooks(benchmark: BenchmarkFixture, length: int) -> None:
+    hooks = Hooks()
+    hooks.update(WRITER_HOOKS)
+    client, ticks = ProgressbarClient(hooks=hooks), _ticks()
+    benchmark(lambda: client.get_progress(next(ticks), END_VALUE, length=length))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_get_progress_capped(benchmark: BenchmarkFixture, length: int) -> None:
+    client, ticks = ProgressbarClient(progress_writer=ProgressbarWriter(capped=True)), _ticks()
+    benchmark(lambda: client.get_progress(next(ticks), END_VALUE, length=length))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_compiled_get_progress(benchmark: BenchmarkFixture, length: int) -> None:
+    get_progress, ticks = ProgressbarClient().compile(), _ticks()
+    benchmark(lambda: get_progress(next(ticks), END_VALUE, length=length))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_compiled_get_progress_with_writer_hooks(benchmark: BenchmarkFixture, length: int) -> None:
+    hooks = Hooks()
+    hooks.update(WRITER_HOOKS)
+    get_progress, ticks = ProgressbarClient(hooks=hooks).compile(), _ticks()
+    benchmark(lambda: get_progress(next(ticks), END_VALUE, length=length))
+
+
+def test_check_contracts(benchmark: BenchmarkFixture) -> None:
+    # Contracts do not depend on progressbar length, so it is measured once.
+    writer = ProgressbarWriter()
+    contract_manager = ContractManager()
+    contract_manager.subscribe(WRITE_PROGRESS_CONTRACT)
+    metadata = {
+        "calculation_service_cls": writer.calculation_cls,
+        "progressbar": None,
+        "start_value": END_VALUE // 2,
+        "end_value": END_VALUE,
+        "length": 20,
+        "sig": writer.signature,
+    }
+    benchmark(lambda: contract_manager.check_contracts(writer, metadata=metadata))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_repr(benchmark: BenchmarkFixture, length: int) -> None:
+    progressbar = ProgressbarWriter().write(END_VALUE // 2, END_VALUE, length=length)
+    benchmark(lambda: repr(progressbar))
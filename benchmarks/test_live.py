@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks of drawing frames of many progressbars against printing them line by line.
+
+Run with `pytest benchmarks --benchmark-group-by=param:changed`.
+"""
+import io
+import itertools
+import typing
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from multibar.impl.signatures import SquareEmojiSignature
+from multibar.impl.writers import ProgressbarWriter
+from multibar.live import FrameCompositor
+
+BARS = 500
+FRAMES = 10
+CHANGED = (5, BARS)
+
+
+def _frames(changed: int) -> typing.Iterator[list[tuple[str, str, float]]]:
+    writer = ProgressbarWriter.from_signature(SquareEmojiSignature(), precompute_lengths=(20,))
+    frames = []
+    for tick in range(FRAMES):
+        progresses = [tick if i < changed else 0 for i in range(BARS)]
+        frames.append(
+            [
+                (f"shard-{i}", writer.write_str(progress, FRAMES, length=20), progress * 100 / FRAMES)
+                for i, progress in enumerate(progresses)
+            ]
+        )
+    return itertools.cycle(frames)
+
+
+def _bytes_per_frame(stream: io.StringIO, draw_frame: typing.Callable[[], typing.Any]) -> int:
+    for _ in range(FRAMES):
+        draw_frame()
+    return len(stream.getvalue()) // FRAMES
+
+
+@pytest.mark.parametrize("changed", CHANGED)
+def test_print_every_line(benchmark: BenchmarkFixture, changed: int) -> None:
+    stream, frames = io.StringIO(), _frames(changed)
+
+    def print_frame() -> None:
+        for label, progressbar, percentage in next(frames):
+            print(label, progressbar, f"{percentage:5.1f}%", file=stream)
+
+    benchmark.extra_info["bytes_per_frame"] = _bytes_per_frame(stream, print_frame)
+    benchmark(print_frame)
+
+
+@pytest.mark.parametrize("changed", CHANGED)
+def test_compositor_frame(benchmark: BenchmarkFixture, changed: int) -> None:
+    stream, frames = io.StringIO(), _frames(changed)
+    compositor = FrameCompositor(stream=stream)
+
+    def draw_frame() -> None:
+        compositor.draw(compositor.layout(next(frames)))
+
+    benchmark.extra_info["bytes_per_frame"] = _bytes_per_frame(stream, draw_frame)
+    benchmark(draw_frame)
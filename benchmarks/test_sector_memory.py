@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Memory benchmarks of progressbar sectors.
+
+Run with `pytest benchmarks -s` to see bytes per progressbar.
+"""
+import tracemalloc
+import typing
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from multibar.api.sectors import AbstractSector
+from multibar.impl.sectors import FrozenSector, Sector
+from multibar.impl.writers import ProgressbarWriter
+
+BARS_COUNT: typing.Final[int] = 1_000
+BAR_LENGTH: typing.Final[int] = 20
+
+
+class DictSector(Sector):
+    """Sector layout before `Sector.__slots__` was declared (with instance `__dict__`)."""
+
+
+def _bytes_per_bar(sector_cls: typing.Type[AbstractSector]) -> float:
+    writer = ProgressbarWriter(sector_cls=sector_cls)
+    # Warm-up, so interned sectors are not accounted.
+    warmup = writer.write(50, 100, length=BAR_LENGTH)
+
+    tracemalloc.start()
+    try:
+        snapshot_before = tracemalloc.take_snapshot()
+        bars = [writer.write(50, 100, length=BAR_LENGTH) for _ in range(BARS_COUNT)]
+        snapshot_after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, "filename"))
+    del bars, warmup
+    return allocated / BARS_COUNT
+
+
+@pytest.mark.parametrize("sector_cls", [DictSector, Sector, FrozenSector], ids=lambda cls: cls.__name__)
+def test_bytes_per_bar(benchmark: BenchmarkFixture, sector_cls: typing.Type[AbstractSector]) -> None:
+    benchmark.extra_info["bytes_per_bar"] = bytes_per_bar = _bytes_per_bar(sector_cls)
+    print(f"\n{sector_cls.__name__}: {bytes_per_bar:.0f} bytes per {BAR_LENGTH}-sector bar")
+
+    writer = ProgressbarWriter(sector_cls=sector_cls)
+    benchmark(writer.write, 50, 100, length=BAR_LENGTH)
+
+
+def test_frozen_sectors_save_memory() -> None:
+    assert _bytes_per_bar(FrozenSector) < _bytes_per_bar(Sector) < _bytes_per_bar(DictSector)
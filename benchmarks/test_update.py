@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks of in-place progressbar updating against writing new progressbar on every tick.
+
+Run with `pytest benchmarks --benchmark-group-by=param:length`.
+"""
+import itertools
+import typing
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from multibar.api.progressbars import ProgressbarAware
+from multibar.api.sectors import AbstractSector
+from multibar.impl.progressbars import CompactProgressbar
+from multibar.impl.signatures import SquareEmojiSignature
+from multibar.impl.writers import ProgressbarWriter
+
+LENGTHS = (1_000, 100_000)
+# Writer expects progressbar types parametrized with abstract sectors.
+COMPACT_PROGRESSBAR_CLS: typing.Final[typing.Type[ProgressbarAware[AbstractSector]]] = CompactProgressbar
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_write_every_tick(benchmark: BenchmarkFixture, length: int) -> None:
+    writer = ProgressbarWriter.from_signature(SquareEmojiSignature())
+    ticks = itertools.cycle(range(10_000))
+    benchmark(lambda: writer.write(next(ticks), 10_000, length=length))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_update_every_tick(benchmark: BenchmarkFixture, length: int) -> None:
+    writer = ProgressbarWriter.from_signature(SquareEmojiSignature())
+    progressbar = writer.write(0, 10_000, length=length)
+    ticks = itertools.cycle(range(10_000))
+    benchmark(lambda: writer.update(progressbar, next(ticks), 10_000, capped=True))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_update_compact_every_tick(benchmark: BenchmarkFixture, length: int) -> None:
+    writer = ProgressbarWriter(progressbar_cls=COMPACT_PROGRESSBAR_CLS)
+    progressbar = writer.write(0, 10_000, length=length)
+    ticks = itertools.cycle(range(10_000))
+    benchmark(lambda: writer.update(progressbar, next(ticks), 10_000, capped=True))
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks of batch progress writing against `ProgressbarWriter.write()` loop."""
+import random
+import typing
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from multibar.api.progressbars import ProgressbarAware
+from multibar.api.sectors import AbstractSector
+from multibar.impl.progressbars import CompactProgressbar
+from multibar.impl.sectors import FrozenSector
+from multibar.impl.writers import ProgressbarWriter
+
+ROWS_COUNT: typing.Final[int] = 10_000
+END_VALUE: typing.Final[int] = 1_000
+# Writer expects progressbar types parametrized with abstract sectors.
+COMPACT_PROGRESSBAR_CLS: typing.Final[typing.Type[ProgressbarAware[AbstractSector]]] = CompactProgressbar
+
+_random = random.Random(0)
+START_VALUES: typing.Final[list[int]] = [_random.randint(0, END_VALUE) for _ in range(ROWS_COUNT)]
+END_VALUES: typing.Final[list[int]] = [END_VALUE] * ROWS_COUNT
+
+WRITERS: typing.Final[dict[str, ProgressbarWriter]] = {
+    "default": ProgressbarWriter(),
+    "frozen_sectors": ProgressbarWriter(sector_cls=FrozenSector),
+    "compact_progressbars": ProgressbarWriter(progressbar_cls=COMPACT_PROGRESSBAR_CLS),
+}
+
+
+@pytest.mark.parametrize("writer_name", WRITERS)
+def test_write_loop(benchmark: BenchmarkFixture, writer_name: str) -> None:
+    write = WRITERS[writer_name].write
+    benchmark(lambda: [write(start, end) for start, end in zip(START_VALUES, END_VALUES)])
+
+
+@pytest.mark.parametrize("writer_name", WRITERS)
+def test_write_many(benchmark: BenchmarkFixture, writer_name: str) -> None:
+    benchmark(WRITERS[writer_name].write_many, START_VALUES, END_VALUES)
+
+
+def test_write_str_loop(benchmark: BenchmarkFixture) -> None:
+    write_str = WRITERS["default"].write_str
+    benchmark(lambda: [write_str(start, end) for start, end in zip(START_VALUES, END_VALUES)])
+
+
+def test_write_many_as_str(benchmark: BenchmarkFixture) -> None:
+    benchmark(WRITERS["default"].write_many, START_VALUES, END_VALUES, as_str=True)
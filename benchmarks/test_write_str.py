@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks of string-only progress writing against `ProgressbarWriter.write()`.
+
+Run with `pytest benchmarks --benchmark-group-by=param:length`.
+"""
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from multibar.impl.signatures import SquareEmojiSignature
+from multibar.impl.writers import ProgressbarWriter
+
+LENGTHS = (20, 1_000)
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_write(benchmark: BenchmarkFixture, length: int) -> None:
+    writer = ProgressbarWriter.from_signature(SquareEmojiSignature())
+    benchmark(lambda: repr(writer.write(50, 100, length=length)))
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_write_str(benchmark: BenchmarkFixture, length: int) -> None:
+    writer = ProgressbarWriter.from_signature(SquareEmojiSignature())
+    benchmark(writer.write_str, 50, 100, length=length)
+
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_write_str_with_render_table(benchmark: BenchmarkFixture, length: int) -> None:
+    writer = ProgressbarWriter.from_signature(SquareEmojiSignature(), precompute_lengths=(length,))
+    benchmark(writer.write_str, 50, 100, length=length)
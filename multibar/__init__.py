@@ -13,6 +13,61 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Main package."""
-from .api import *
-from .impl import *
+"""Main package.
+
+Names are imported on first access (PEP 562), so `import multibar`
+does not import any dependencies until they are needed.
+"""
+from __future__ import annotations
+
+import importlib
+import typing
+
+from . import api, impl
+
+if typing.TYPE_CHECKING:
+    from . import errors, live, output, settings, types, utils
+    from .api import *
+    from .impl import *
+    from .impl import (
+        caches,
+        calculation_service,
+        clients,
+        contracts,
+        diffs,
+        hooks,
+        metrics,
+        progressbars,
+        sectors,
+        signatures,
+        writers,
+    )
+
+if not typing.TYPE_CHECKING:
+    # Type checkers see names of star-imported submodules instead.
+    __all__ = (*api.__all__, *impl.__all__)
+
+_SUBMODULES: typing.Final[frozenset[str]] = frozenset(("errors", "live", "output", "settings", "types", "utils"))
+"""Submodules of the main package, that are imported on first access."""
+
+
+def __getattr__(name: str) -> typing.Any:
+    # Implementations shadow interfaces, as if they were star-imported after them.
+    for package in (impl, api):
+        if name in package._EXPORTS:
+            value = getattr(package, name)
+            break
+    else:
+        if name in impl._EXPORTS.values():
+            value = importlib.import_module(f".impl.{name}", __name__)
+        elif name in _SUBMODULES:
+            value = importlib.import_module(f".{name}", __name__)
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *api._EXPORTS, *impl._EXPORTS, *_SUBMODULES})
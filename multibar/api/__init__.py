@@ -13,12 +13,67 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Package with Python-Multibar interfaces."""
-from .calculation_service import *
-from .clients import *
-from .contracts import *
-from .hooks import *
-from .progressbars import *
-from .sectors import *
-from .signatures import *
-from .writers import *
+"""Package with Python-Multibar interfaces.
+
+Submodules are imported on first access to their names (PEP 562).
+"""
+from __future__ import annotations
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .caches import *
+    from .calculation_service import *
+    from .clients import *
+    from .contracts import *
+    from .diffs import *
+    from .hooks import *
+    from .metrics import *
+    from .progressbars import *
+    from .sectors import *
+    from .signatures import *
+    from .writers import *
+
+_EXPORTS: typing.Final[dict[str, str]] = {
+    "CacheStats": "caches",
+    "RenderCacheAware": "caches",
+    "AbstractCalculationService": "calculation_service",
+    "ProgressbarClientAware": "clients",
+    "AsyncProgressbarClientAware": "clients",
+    "ContractAware": "contracts",
+    "ContractCheck": "contracts",
+    "ContractManagerAware": "contracts",
+    "SectorChange": "diffs",
+    "ProgressbarDifferAware": "diffs",
+    "HookStats": "hooks",
+    "HooksAware": "hooks",
+    "HistogramSnapshot": "metrics",
+    "MetricsSinkAware": "metrics",
+    "ProgressbarAware": "progressbars",
+    "AbstractSector": "sectors",
+    "GlyphMetrics": "signatures",
+    "SignatureSegmentProtocol": "signatures",
+    "ProgressbarSignatureProtocol": "signatures",
+    "ProgressbarWriterAware": "writers",
+}
+"""Public names by submodules that define them."""
+
+if not typing.TYPE_CHECKING:
+    # Type checkers see names of star-imported submodules instead.
+    __all__ = tuple(_EXPORTS)
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        submodule = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Next access will not call __getattr__.
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Interfaces for progressbar render caches."""
+from __future__ import annotations
+
+__all__ = (
+    "CacheStats",
+    "RenderCacheAware",
+)
+
+import abc
+import dataclasses
+import typing
+
+_KeyT = typing.TypeVar("_KeyT", bound=typing.Hashable)
+_ValueT = typing.TypeVar("_ValueT")
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of render cache statistics."""
+
+    hits: int
+    """Count of successful lookups."""
+
+    misses: int
+    """Count of failed lookups."""
+
+    evictions: int
+    """Count of entries that were evicted to respect `maxsize`."""
+
+    maxsize: int
+    """Maximum count of entries in the cache."""
+
+    currsize: int
+    """Current count of entries in the cache."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Ratio of hits to all lookups, or 0.0 if there were no lookups.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RenderCacheAware(abc.ABC, typing.Generic[_KeyT, _ValueT]):
+    """Interface for bounded render cache implementations."""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Current count of entries in the cache.
+        """
+        ...
+
+    @abc.abstractmethod
+    def __contains__(self, key: typing.Any, /) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True if key is stored in the cache. Does not affect statistics.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get(self, key: _KeyT, /) -> typing.Optional[_ValueT]:
+        """Returns cached value by key and registers a hit or a miss.
+
+        Parameters
+        ----------
+        key : _KeyT, /
+            Key to look up.
+
+        Returns
+        -------
+        typing.Optional[_ValueT]
+            Cached value or None, if key is not stored in the cache.
+        """
+        ...
+
+    @abc.abstractmethod
+    def put(self, key: _KeyT, value: _ValueT, /) -> _ValueT:
+        """Stores value in the cache, evicting entries if needed.
+
+        Parameters
+        ----------
+        key : _KeyT, /
+            Key to store value by.
+        value : _ValueT, /
+            Value to store.
+
+        Returns
+        -------
+        _ValueT
+            Stored value to allow fluent-style.
+        """
+        ...
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes all entries and resets statistics.
+
+        Returns
+        -------
+        None
+        """
+        ...
+
+    @abc.abstractmethod
+    def stats(self) -> CacheStats:
+        """Returns snapshot of cache statistics.
+
+        Returns
+        -------
+        CacheStats
+            Immutable statistics snapshot.
+        """
+        ...
+
+    @property
+    @abc.abstractmethod
+    def maxsize(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Maximum count of entries in the cache.
+        """
+        ...
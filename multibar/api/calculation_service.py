@@ -62,6 +62,20 @@ class AbstractCalculationService(abc.ABC):
         """
         ...
 
+    def filled_count(self) -> int:
+        """Returns count of progressbar filled sectors.
+
+        !!! info
+            Default implementation exhausts `calculate_filled_indexes()`,
+            implementations are welcome to override it with closed form.
+
+        Returns
+        -------
+        int
+            Count of filled sectors.
+        """
+        return sum(1 for _ in self.calculate_filled_indexes())
+
     @abc.abstractmethod
     def calculate_unfilled_indexes(self) -> collections.abc.Iterator[int]:
         """Returns iterator over progressbar unfilled sector indexes.
@@ -16,11 +16,13 @@
 """Interfaces for progressbar clients."""
 from __future__ import annotations
 
-__all__ = ("ProgressbarClientAware",)
+__all__ = ("ProgressbarClientAware", "AsyncProgressbarClientAware")
 
 import abc
+import collections.abc
 import typing
 
+from multibar import utils
 from multibar.api import progressbars, sectors, writers
 
 from . import contracts
@@ -82,6 +84,284 @@ class ProgressbarClientAware(abc.ABC):
         """
         ...
 
+    def get_progress_str(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> str:
+        """Generates string representation of progressbar, can be a wrapper
+        for ProgressWriterAware.write_str() to implement hooks and various kinds of checks.
+
+        !!! info
+            Default implementation returns string representation of `get_progress()` result.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress) for progressbar math operations.
+        end_value : int, /
+            End value (needed progress) for progressbar math operations.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Returns
+        -------
+        str
+            String representation of progressbar.
+        """
+        return repr(self.get_progress(start_value, end_value, length=length))
+
+    @typing.overload
+    def get_progress_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[progressbars.ProgressbarAware[sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def get_progress_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def get_progress_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]:
+        """Generates a batch of progressbars, can be a wrapper for ProgressWriterAware.write_many()
+        to implement hooks and various kinds of checks in a single pass.
+
+        !!! info
+            Default implementation calls `get_progress()` or `get_progress_str()`
+            for every progress, so hooks and checks run once per progress.
+
+        Parameters
+        ----------
+        start_values : collections.abc.Iterable[int], /
+            Start values (current progresses) for progressbar math operations.
+        end_values : collections.abc.Iterable[int], /
+            End values (needed progresses), paired with start values.
+        length : int = 20, *
+            Length of progressbars for progressbar math operations.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        if as_str:
+            return [self.get_progress_str(start, end, length=length) for start, end in zip(start_values, end_values)]
+        return [self.get_progress(start, end, length=length) for start, end in zip(start_values, end_values)]
+
+    def get_progress_ratio(
+        self,
+        ratio: float,
+        /,
+        *,
+        length: int = 20,
+    ) -> progressbars.ProgressbarAware[sectors.AbstractSector]:
+        """Generates a progressbar from ratio, can be a wrapper for
+        ProgressWriterAware.write_ratio() to implement hooks and various kinds of checks.
+
+        !!! info
+            Default implementation generates `round(ratio * length)` of `length`
+            progress by `get_progress()`, ratio is clamped to `[0, 1]`.
+
+        Parameters
+        ----------
+        ratio : float, /
+            Progress ratio, from 0 to 1.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar instance.
+        """
+        start_value, end_value = utils.ratio_progress(ratio, length)
+        return self.get_progress(start_value, end_value, length=length)
+
+    def get_progress_percent(
+        self,
+        percent: float,
+        /,
+        *,
+        length: int = 20,
+    ) -> progressbars.ProgressbarAware[sectors.AbstractSector]:
+        """Generates a progressbar from percentage, can be a wrapper for
+        ProgressWriterAware.write_percent() to implement hooks and various kinds of checks.
+
+        !!! info
+            Default implementation generates `percent / 100` ratio by `get_progress_ratio()`.
+
+        Parameters
+        ----------
+        percent : float, /
+            Progress percentage, from 0 to 100.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar instance.
+        """
+        return self.get_progress_ratio(percent / 100, length=length)
+
+    @typing.overload
+    def get_progress_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[progressbars.ProgressbarAware[sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def get_progress_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def get_progress_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]:
+        """Generates a batch of progressbars from ratios, can be a wrapper for
+        ProgressWriterAware.write_ratio_many() to implement hooks and various kinds of checks
+        in a single pass.
+
+        !!! info
+            Default implementation converts ratios to start & end values same as
+            `get_progress_ratio()` and generates them by `get_progress_many()`.
+
+        Parameters
+        ----------
+        ratios : collections.abc.Iterable[float], /
+            Progress ratios, arrays are supported as well.
+        length : int = 20, *
+            Length of progressbars for progressbar math operations.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        progresses = [utils.ratio_progress(ratio, length) for ratio in ratios]
+        start_values = [start_value for start_value, _ in progresses]
+        end_values = [end_value for _, end_value in progresses]
+        if as_str:
+            return self.get_progress_many(start_values, end_values, length=length, as_str=True)
+        return self.get_progress_many(start_values, end_values, length=length)
+
+    @typing.overload
+    def get_progress_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[progressbars.ProgressbarAware[sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def get_progress_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def get_progress_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]:
+        """Generates a batch of progressbars from percentages, can be a wrapper for
+        ProgressWriterAware.write_percent_many() to implement hooks and various kinds of checks
+        in a single pass.
+
+        !!! info
+            Default implementation converts percentages to start & end values same as
+            `get_progress_ratio()` and generates them by `get_progress_many()`.
+
+        Parameters
+        ----------
+        percents : collections.abc.Iterable[float], /
+            Progress percentages, arrays are supported as well.
+        length : int = 20, *
+            Length of progressbars for progressbar math operations.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        progresses = [utils.ratio_progress(percent / 100, length) for percent in percents]
+        start_values = [start_value for start_value, _ in progresses]
+        end_values = [end_value for _, end_value in progresses]
+        if as_str:
+            return self.get_progress_many(start_values, end_values, length=length, as_str=True)
+        return self.get_progress_many(start_values, end_values, length=length)
+
+    def compile(self) -> collections.abc.Callable[..., progressbars.ProgressbarAware[sectors.AbstractSector]]:
+        """Compiles `get_progress()` specialized for current client configuration.
+
+        !!! info
+            Default implementation returns bound `get_progress()` as is.
+
+        Returns
+        -------
+        collections.abc.Callable[..., progressbars.ProgressbarAware[sectors.AbstractSector]]
+            Callable with `get_progress()` signature, that is rebuilt
+            automatically when hooks or contracts of the client change.
+        """
+        return self.get_progress
+
     @abc.abstractmethod
     def set_hooks(self, hooks: hooks_.HooksAware, /) -> ProgressbarClientAware:
         """Sets hooks to the client.
@@ -146,3 +426,131 @@ class ProgressbarClientAware(abc.ABC):
             Progressbar writer for progress generating.
         """
         ...
+
+
+class AsyncProgressbarClientAware(abc.ABC):
+    """Interface for implementing an asynchronous progress client
+    that awaits asynchronous hooks and contracts."""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    async def get_progress(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> progressbars.ProgressbarAware[sectors.AbstractSector]:
+        """Generates a progressbar, can be a wrapper for ProgressWriterAware.write()
+        to implement asynchronous hooks and various kinds of checks.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress) for progressbar math operations.
+        end_value : int, /
+            End value (needed progress) for progressbar math operations.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar instance.
+        """
+        ...
+
+    @abc.abstractmethod
+    async def get_progress_str(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> str:
+        """Generates string representation of progressbar, can be a wrapper
+        for ProgressWriterAware.write_str() to implement asynchronous hooks and various kinds of checks.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress) for progressbar math operations.
+        end_value : int, /
+            End value (needed progress) for progressbar math operations.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Returns
+        -------
+        str
+            String representation of progressbar.
+        """
+        ...
+
+    @abc.abstractmethod
+    def set_hooks(self, hooks: hooks_.HooksAware, /) -> AsyncProgressbarClientAware:
+        """Sets hooks to the client.
+
+        Parameters
+        ----------
+        hooks : hooks_.HooksAware
+            Any hooks to set.
+
+        Returns
+        -------
+        Self
+            AsyncProgressbarClient object to allow fluent-style.
+        """
+        ...
+
+    @abc.abstractmethod
+    def update_hooks(self, hooks: hooks_.HooksAware, /) -> AsyncProgressbarClientAware:
+        """Updates hooks for the client.
+
+        Parameters
+        ----------
+        hooks : hooks_.HooksAware
+            Any hooks to update.
+
+        Returns
+        -------
+        Self
+            AsyncProgressbarClient object to allow fluent-style.
+        """
+        ...
+
+    @property
+    @abc.abstractmethod
+    def hooks(self) -> hooks_.HooksAware:
+        """
+        Returns
+        -------
+        hooks_.HooksAware
+            Client hooks.
+        """
+        ...
+
+    @property
+    @abc.abstractmethod
+    def contract_manager(self) -> contracts.ContractManagerAware:
+        """
+        Returns
+        -------
+        contracts.ContractManagerAware
+            Client contract manager for checks.
+        """
+        ...
+
+    @property
+    @abc.abstractmethod
+    def writer(self) -> writers.ProgressbarWriterAware:
+        """
+        Returns
+        -------
+        writers.ProgressbarWriterAware[sectors.AbstractSector]
+            Progressbar writer for progress generating.
+        """
+        ...
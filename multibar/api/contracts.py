@@ -31,6 +31,9 @@ from returns.io import impure
 
 from multibar import utils
 
+if typing.TYPE_CHECKING:
+    from multibar import types
+
 
 @dataclasses.dataclass
 class ContractCheck:
@@ -122,6 +125,66 @@ class ContractAware(abc.ABC):
         """
         ...
 
+    def check_many(self, *args: typing.Any, **kwargs: typing.Any) -> ContractCheck:
+        """Checks contract for errors and warnings for a batch of progresses.
+
+        !!! info
+            By default, splits batch metadata and calls `check()` for every item,
+            implementations can override it to check whole batch in one pass.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to check.
+        **kwargs : typing.Any
+            Keyword arguments to check.
+
+        Returns
+        -------
+        ContractCheck
+            First broken contract response or kept contract response.
+        """
+        batch_metadata = typing.cast(typing.MutableMapping[typing.Any, typing.Any], kwargs.pop("metadata", {}))
+        if not batch_metadata:
+            return self.check(*args, **kwargs)
+
+        shared_metadata = {
+            key: value
+            for key, value in batch_metadata.items()
+            if key not in ("start_values", "end_values", "progressbars")
+        }
+        for start_value, end_value in zip(batch_metadata["start_values"], batch_metadata["end_values"]):
+            contract_check = self.check(
+                *args,
+                metadata={
+                    **shared_metadata,
+                    "start_value": start_value,
+                    "end_value": end_value,
+                    "progressbar": None,
+                },
+                **kwargs,
+            )
+            if not contract_check.kept:
+                return contract_check
+
+        return ContractCheck.done(metadata=batch_metadata)
+
+    def compile_check(self) -> typing.Optional[types.ContractGuardType]:
+        """Returns predicate that checks contract for a single progress
+        without metadata, used by compiled client pipelines.
+
+        !!! info
+            By default returns None, so compiled pipelines check contract
+            with metadata on every call.
+
+        Returns
+        -------
+        typing.Optional[types.ContractGuardType]
+            Predicate of `(start_value, end_value, length)`, that returns True
+            if contract is kept, or None if contract needs metadata to be checked.
+        """
+        return None
+
     @impure
     @abc.abstractmethod
     def render_terminated_contract(
@@ -195,6 +258,39 @@ class ContractManagerAware(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    def check_contracts_many(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Checks all contracts for a batch of progresses.
+
+        *args: typing.Any
+            Arguments to contracts check.
+        **kwargs: typing.Any
+            Keyword arguments to contracts check.
+
+        Returns
+        -------
+        None
+        """
+        ...
+
+    @abc.abstractmethod
+    def gather_contracts(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Optional[typing.Awaitable[None]]:
+        """Checks all contracts, synchronous contracts are checked immediately,
+        awaitable checks returned by asynchronous ones are gathered.
+
+        *args: typing.Any
+            Arguments to contracts check.
+        **kwargs: typing.Any
+            Keyword arguments to contracts check.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[None]]
+            Awaitable that runs asynchronous checks concurrently,
+            or None if there is nothing to await.
+        """
+        ...
+
     @abc.abstractmethod
     def subscribe(self, contract: ContractAware, /) -> None:
         """Subscribes for contract.
@@ -273,3 +369,15 @@ class ContractManagerAware(abc.ABC):
             Raise errors boolean value.
         """
         ...
+
+    @property
+    @abc.abstractmethod
+    def revision(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Counter of contract subscriptions and terminations,
+            compiled client pipelines are rebuilt when it changes.
+        """
+        ...
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Interfaces for progressbar diffs."""
+from __future__ import annotations
+
+__all__ = (
+    "SectorChange",
+    "ProgressbarDifferAware",
+)
+
+import abc
+import dataclasses
+import typing
+
+if typing.TYPE_CHECKING:
+    from multibar.api import progressbars, sectors
+
+
+@dataclasses.dataclass(frozen=True)
+class SectorChange:
+    """Run of consecutive sectors that got the same new state."""
+
+    positions: range
+    """Positions of changed sectors."""
+
+    name: str
+    """New display name of changed sectors."""
+
+    is_filled: bool
+    """New filled state of changed sectors."""
+
+
+class ProgressbarDifferAware(abc.ABC):
+    """Interface for progressbar differ implementations."""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def diff(
+        self,
+        old: progressbars.ProgressbarAware[sectors.AbstractSector],
+        new: progressbars.ProgressbarAware[sectors.AbstractSector],
+        /,
+    ) -> tuple[SectorChange, ...]:
+        """Compares two progressbar states.
+
+        Parameters
+        ----------
+        old : progressbars.ProgressbarAware[sectors.AbstractSector], /
+            Previous progressbar state.
+        new : progressbars.ProgressbarAware[sectors.AbstractSector], /
+            Current progressbar state.
+
+        Returns
+        -------
+        tuple[SectorChange, ...]
+            Changes ordered by position, empty if nothing changed.
+        """
+        ...
@@ -16,10 +16,14 @@
 """Interfaces for progressbar hooks."""
 from __future__ import annotations
 
-__all__ = ("HooksAware",)
+__all__ = (
+    "HookStats",
+    "HooksAware",
+)
 
 import abc
 import collections.abc
+import dataclasses
 import typing
 
 if typing.TYPE_CHECKING:
@@ -28,6 +32,36 @@ if typing.TYPE_CHECKING:
     from . import clients
 
 
+@dataclasses.dataclass(frozen=True)
+class HookStats:
+    """Latency statistics of a single hook callback."""
+
+    callback: types.HookSignatureType
+    """Profiled callback."""
+
+    stage: str
+    """Trigger stage of callback: `pre_execution`, `post_execution` or `on_error`."""
+
+    calls: int
+    """Number of callback calls."""
+
+    total_ns: int
+    """Cumulative latency of callback calls in nanoseconds."""
+
+    max_ns: int
+    """Maximal latency of a single callback call in nanoseconds."""
+
+    @property
+    def mean_ns(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Mean latency of a single callback call in nanoseconds.
+        """
+        return self.total_ns / self.calls
+
+
 class HooksAware(abc.ABC):
     """Interface to progress hooks implementation."""
 
@@ -44,12 +78,16 @@ class HooksAware(abc.ABC):
         ...
 
     @abc.abstractmethod
-    def add_to_client(self, client: clients.ProgressbarClientAware, /) -> HooksAware:
+    def add_to_client(
+        self,
+        client: typing.Union[clients.ProgressbarClientAware, clients.AsyncProgressbarClientAware],
+        /,
+    ) -> HooksAware:
         """Adds hooks to the client.
 
         Parameters
         ----------
-        client : clients.ProgressbarClientAware, /
+        client : typing.Union[clients.ProgressbarClientAware, clients.AsyncProgressbarClientAware], /
             Client to add.
 
         Returns
@@ -157,6 +195,48 @@ class HooksAware(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    def trigger_post_execution_many(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Triggers all post-execution callbacks for a batch of progressbars.
+
+        !!! info
+            Callbacks are invoked once with batch metadata, except the
+            per-item ones, that are invoked once per every progressbar.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        None
+        """
+        ...
+
+    @abc.abstractmethod
+    def trigger_pre_execution_many(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Triggers all pre-execution callbacks for a batch of progressbars.
+
+        !!! info
+            Callbacks are invoked once with batch metadata, except the
+            per-item ones, that are invoked once per every progressbar.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        None
+        """
+        ...
+
     @abc.abstractmethod
     def trigger_on_error(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         """Triggers all on-error callbacks.
@@ -174,6 +254,81 @@ class HooksAware(abc.ABC):
         """
         ...
 
+    @abc.abstractmethod
+    def gather_post_execution(
+        self, *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Optional[typing.Awaitable[typing.Any]]:
+        """Triggers all post-execution callbacks, synchronous callbacks are called
+        immediately, awaitables returned by asynchronous ones are gathered.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[typing.Any]]
+            Awaitable that runs asynchronous callbacks concurrently,
+            or None if there is nothing to await.
+        """
+        ...
+
+    @abc.abstractmethod
+    def gather_pre_execution(
+        self, *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Optional[typing.Awaitable[typing.Any]]:
+        """Triggers all pre-execution callbacks, synchronous callbacks are called
+        immediately, awaitables returned by asynchronous ones are gathered.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[typing.Any]]
+            Awaitable that runs asynchronous callbacks concurrently,
+            or None if there is nothing to await.
+        """
+        ...
+
+    @abc.abstractmethod
+    def gather_on_error(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Optional[typing.Awaitable[typing.Any]]:
+        """Triggers all on-error callbacks, synchronous callbacks are called
+        immediately, awaitables returned by asynchronous ones are gathered.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[typing.Any]]
+            Awaitable that runs asynchronous callbacks concurrently,
+            or None if there is nothing to await.
+        """
+        ...
+
+    @abc.abstractmethod
+    def stats(self) -> tuple[HookStats, ...]:
+        """Returns snapshot of hook latency statistics.
+
+        Returns
+        -------
+        tuple[HookStats, ...]
+            Statistics of every called hook, slowest by cumulative latency first.
+        """
+        ...
+
     @property
     @abc.abstractmethod
     def pre_execution_hooks(self) -> collections.abc.Sequence[types.HookSignatureType]:
@@ -206,3 +361,15 @@ class HooksAware(abc.ABC):
             Sequence of on-error hooks.
         """
         ...
+
+    @property
+    @abc.abstractmethod
+    def revision(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Counter of hooks changes, compiled client pipelines
+            are rebuilt when it changes.
+        """
+        ...
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Interfaces for metrics sinks."""
+from __future__ import annotations
+
+__all__ = (
+    "HistogramSnapshot",
+    "MetricsSinkAware",
+)
+
+import abc
+import dataclasses
+import typing
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+
+@dataclasses.dataclass(frozen=True)
+class HistogramSnapshot:
+    """Snapshot of histogram observations."""
+
+    buckets: tuple[float, ...]
+    """Upper bounds of histogram buckets, in ascending order."""
+
+    cumulative_counts: tuple[int, ...]
+    """Count of observations less than or equal to every bucket bound,
+    followed by count of all observations."""
+
+    sum: float
+    """Sum of all observed values."""
+
+    @property
+    def count(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Count of all observations.
+        """
+        return self.cumulative_counts[-1]
+
+
+class MetricsSinkAware(abc.ABC):
+    """Interface for sinks of counters and latency observations."""
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def increment(
+        self,
+        name: str,
+        /,
+        amount: int = 1,
+        *,
+        labels: typing.Optional[collections.abc.Mapping[str, str]] = None,
+    ) -> None:
+        """Increments counter.
+
+        Parameters
+        ----------
+        name : str, /
+            Counter name.
+        amount : int = 1
+            Amount to add.
+        labels : typing.Optional[collections.abc.Mapping[str, str]] = None, *
+            Labels of counter.
+
+        Returns
+        -------
+        None
+        """
+        ...
+
+    @abc.abstractmethod
+    def observe(
+        self,
+        name: str,
+        value: float,
+        /,
+        *,
+        labels: typing.Optional[collections.abc.Mapping[str, str]] = None,
+    ) -> None:
+        """Records observation to histogram.
+
+        Parameters
+        ----------
+        name : str, /
+            Histogram name.
+        value : float, /
+            Observed value, latencies are observed in seconds.
+        labels : typing.Optional[collections.abc.Mapping[str, str]] = None, *
+            Labels of histogram.
+
+        Returns
+        -------
+        None
+        """
+        ...
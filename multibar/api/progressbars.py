@@ -24,7 +24,7 @@ import typing
 
 from returns.primitives.hkt import Kind1
 
-from . import sectors
+from . import sectors, signatures
 
 SectorT = typing.TypeVar("SectorT", bound=sectors.AbstractSector)
 _NewValueType = typing.TypeVar("_NewValueType", bound=sectors.AbstractSector)
@@ -219,6 +219,29 @@ class ProgressbarAware(abc.ABC, typing.Generic[SectorT]):
         """
         ...
 
+    def replace_sector(self, sector_pos: int, sector: sectors.AbstractSector, /) -> ProgressbarAware[SectorT]:
+        """Replaces sector object.
+
+        !!! info
+            Default implementation replaces sector in `sectors` sequence,
+            implementations that keep any state derived from sectors
+            should override it.
+
+        Parameters
+        ----------
+        sector_pos : int, /
+            To find sector by index to replace.
+        sector : SectorT, /
+            New sector object.
+
+        Returns
+        -------
+        Self
+            The progressbar object to allow fluent-style.
+        """
+        self.sectors[sector_pos] = typing.cast(SectorT, sector)
+        return self
+
     @property
     @abc.abstractmethod
     def length(self) -> int:
@@ -240,3 +263,38 @@ class ProgressbarAware(abc.ABC, typing.Generic[SectorT]):
             Sequence of sectors.
         """
         ...
+
+    @property
+    @abc.abstractmethod
+    def glyph_metrics(self) -> signatures.GlyphMetrics:
+        """
+        !!! info
+            Implementations may derive it from sizes of signature chars
+            instead of measuring string representation of progressbar.
+
+        Returns
+        -------
+        signatures.GlyphMetrics
+            Sizes of progressbar string representation.
+        """
+        ...
+
+    @property
+    def display_width(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Count of terminal cells, that progressbar takes.
+        """
+        return self.glyph_metrics.display_width
+
+    @property
+    def encoded_size(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Count of bytes in UTF-8 encoded progressbar.
+        """
+        return self.glyph_metrics.encoded_size
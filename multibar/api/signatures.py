@@ -17,13 +17,33 @@
 from __future__ import annotations
 
 __all__ = (
+    "GlyphMetrics",
     "SignatureSegmentProtocol",
     "ProgressbarSignatureProtocol",
 )
 
+import dataclasses
 import typing
 
 
+@dataclasses.dataclass(frozen=True)
+class GlyphMetrics:
+    """Sizes of progressbar text in terminal cells, UTF-8 bytes and chars.
+
+    !!! info
+        Text is measured by `multibar.impl.signatures.glyph_metrics()`.
+    """
+
+    display_width: int
+    """Count of terminal cells, that text takes."""
+
+    encoded_size: int
+    """Count of bytes in UTF-8 encoded text."""
+
+    char_count: int
+    """Count of chars (code points) in text."""
+
+
 @typing.runtime_checkable
 class SignatureSegmentProtocol(typing.Protocol):
     """Signature segment protocol (protocol for one char, that has two states).
@@ -19,8 +19,11 @@ from __future__ import annotations
 __all__ = ("ProgressbarWriterAware",)
 
 import abc
+import collections.abc
 import typing
 
+from multibar import utils
+
 from . import calculation_service as math_operations
 from . import progressbars, sectors, signatures
 
@@ -96,6 +99,308 @@ class ProgressbarWriterAware(abc.ABC):
         """
         ...
 
+    def update(
+        self,
+        progressbar: progressbars.ProgressbarAware[sectors.AbstractSector],
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        capped: typing.Optional[bool] = None,
+    ) -> range:
+        """Updates written progressbar in-place without any hooks or checks.
+
+        !!! info
+            Default implementation writes new progressbar of the same length by
+            `write()` and replaces only changed sectors, so it takes `O(length)` time
+            and `capped` is ignored. Implementations can update it in `O(delta)`.
+
+        Parameters
+        ----------
+        progressbar : progressbars.ProgressbarAware[sectors.AbstractSector], /
+            Progressbar to update.
+        start_value : int, /
+            New start value (current progress).
+        end_value : int, /
+            New end value (needed progress).
+        capped : typing.Optional[bool] = None, *
+            If True, re-applies progressbar `start` & `end` chars.
+            If None, writer `capped` mode is used.
+
+        Returns
+        -------
+        range
+            Range of changed sector positions.
+        """
+        new_progressbar = self.write(start_value, end_value, length=len(progressbar))
+        changed = [
+            position
+            for position, (old_sector, new_sector) in enumerate(zip(progressbar.sectors, new_progressbar.sectors))
+            if (old_sector.name, old_sector.is_filled) != (new_sector.name, new_sector.is_filled)
+        ]
+        for position in changed:
+            progressbar.replace_sector(position, new_progressbar[position])
+
+        return range(changed[0], changed[-1] + 1) if changed else range(0)
+
+    def write_str(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> str:
+        """Writes progress straight to string without any hooks or checks.
+        Unlike `write()`, does not allocate any sector or progressbar objects.
+
+        !!! info
+            Default implementation returns string representation of `write()`
+            result, implementations can render it without any objects.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress).
+        end_value : int, /
+            End value (needed progress).
+        length : int, *
+            Length of progressbar.
+
+        Returns
+        -------
+        str
+            String representation of progressbar.
+        """
+        return repr(self.write(start_value, end_value, length=length))
+
+    @typing.overload
+    def write_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[progressbars.ProgressbarAware[sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def write_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def write_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]:
+        """Writes batch of progresses without any hooks or checks.
+
+        !!! info
+            Default implementation calls `write()` or `write_str()` for every
+            progress, implementations can share work between rows.
+
+        Parameters
+        ----------
+        start_values : collections.abc.Iterable[int], /
+            Start values (current progresses).
+        end_values : collections.abc.Iterable[int], /
+            End values (needed progresses), paired with start values.
+        length : int, *
+            Length of progressbars.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        if as_str:
+            return [self.write_str(start, end, length=length) for start, end in zip(start_values, end_values)]
+        return [self.write(start, end, length=length) for start, end in zip(start_values, end_values)]
+
+    def write_ratio(
+        self,
+        ratio: float,
+        /,
+        *,
+        length: int = 20,
+    ) -> progressbars.ProgressbarAware[sectors.AbstractSector]:
+        """Writes progress from ratio without any hooks or checks.
+
+        !!! info
+            Default implementation writes `round(ratio * length)` of `length`
+            progress by `write()`, ratio is clamped to `[0, 1]`.
+
+        Parameters
+        ----------
+        ratio : float, /
+            Progress ratio, from 0 to 1.
+        length : int, *
+            Length of progressbar.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar object.
+        """
+        start_value, end_value = utils.ratio_progress(ratio, length)
+        return self.write(start_value, end_value, length=length)
+
+    def write_percent(
+        self,
+        percent: float,
+        /,
+        *,
+        length: int = 20,
+    ) -> progressbars.ProgressbarAware[sectors.AbstractSector]:
+        """Writes progress from percentage without any hooks or checks.
+
+        !!! info
+            Default implementation writes `percent / 100` ratio by `write_ratio()`.
+
+        Parameters
+        ----------
+        percent : float, /
+            Progress percentage, from 0 to 100.
+        length : int, *
+            Length of progressbar.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar object.
+        """
+        return self.write_ratio(percent / 100, length=length)
+
+    @typing.overload
+    def write_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[progressbars.ProgressbarAware[sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def write_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def write_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]:
+        """Writes batch of progresses from ratios without any hooks or checks.
+
+        !!! info
+            Default implementation converts ratios to start & end values same as
+            `write_ratio()` and writes them by `write_many()`.
+
+        Parameters
+        ----------
+        ratios : collections.abc.Iterable[float], /
+            Progress ratios, arrays are supported as well.
+        length : int, *
+            Length of progressbars.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        progresses = [utils.ratio_progress(ratio, length) for ratio in ratios]
+        start_values = [start_value for start_value, _ in progresses]
+        end_values = [end_value for _, end_value in progresses]
+        if as_str:
+            return self.write_many(start_values, end_values, length=length, as_str=True)
+        return self.write_many(start_values, end_values, length=length)
+
+    @typing.overload
+    def write_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[progressbars.ProgressbarAware[sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def write_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def write_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]:
+        """Writes batch of progresses from percentages without any hooks or checks.
+
+        !!! info
+            Default implementation converts percentages to start & end values same as
+            `write_ratio()` and writes them by `write_many()`.
+
+        Parameters
+        ----------
+        percents : collections.abc.Iterable[float], /
+            Progress percentages, arrays are supported as well.
+        length : int, *
+            Length of progressbars.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        progresses = [utils.ratio_progress(percent / 100, length) for percent in percents]
+        start_values = [start_value for start_value, _ in progresses]
+        end_values = [end_value for _, end_value in progresses]
+        if as_str:
+            return self.write_many(start_values, end_values, length=length, as_str=True)
+        return self.write_many(start_values, end_values, length=length)
+
     @abc.abstractmethod
     def bind_signature(self, signature: signatures.ProgressbarSignatureProtocol, /) -> ProgressbarWriterAware:
         """Sets new progressbar signature.
@@ -155,3 +460,17 @@ class ProgressbarWriterAware(abc.ABC):
             Calculation cls.
         """
         ...
+
+    @property
+    def capped(self) -> bool:
+        """
+        !!! info
+            Default implementation returns False, writers without capped
+            mode leave `start` & `end` chars to `multibar.WRITER_HOOKS`.
+
+        Returns
+        -------
+        bool
+            Whether progressbar `start` & `end` chars are rendered by writer.
+        """
+        return False
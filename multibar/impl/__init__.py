@@ -13,12 +13,89 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Package with implementations of multibar/api interfaces."""
-from .calculation_service import *
-from .clients import *
-from .contracts import *
-from .hooks import *
-from .progressbars import *
-from .sectors import *
-from .signatures import *
-from .writers import *
+"""Package with implementations of multibar/api interfaces.
+
+Submodules are imported on first access to their names (PEP 562).
+"""
+from __future__ import annotations
+
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .caches import *
+    from .calculation_service import *
+    from .clients import *
+    from .contracts import *
+    from .diffs import *
+    from .hooks import *
+    from .metrics import *
+    from .progressbars import *
+    from .sectors import *
+    from .signatures import *
+    from .writers import *
+
+_EXPORTS: typing.Final[dict[str, str]] = {
+    "LRURenderCache": "caches",
+    "RenderSnapshot": "caches",
+    "RenderTable": "caches",
+    "RENDER_TABLES": "caches",
+    "compile_render_function": "caches",
+    "RENDER_FUNCTIONS": "caches",
+    "ProgressbarCalculationService": "calculation_service",
+    "ExactCalculationService": "calculation_service",
+    "VectorizedCalculationService": "calculation_service",
+    "ProgressbarClient": "clients",
+    "AsyncProgressbarClient": "clients",
+    "ContractManager": "contracts",
+    "WriteProgressContract": "contracts",
+    "WRITE_PROGRESS_CONTRACT": "contracts",
+    "INPUT_VALUES_CONTRACT": "contracts",
+    "ProgressRangeContract": "contracts",
+    "PROGRESS_RANGE_CONTRACT": "contracts",
+    "ProgressbarDiffer": "diffs",
+    "Hooks": "hooks",
+    "WRITER_HOOKS": "hooks",
+    "per_item_hook": "hooks",
+    "InMemoryMetricsSink": "metrics",
+    "to_prometheus_text": "metrics",
+    "DEFAULT_LATENCY_BUCKETS": "metrics",
+    "CLIENT_STAGE_SECONDS": "metrics",
+    "CONTRACT_TERMINATIONS_TOTAL": "metrics",
+    "ON_ERROR_INVOCATIONS_TOTAL": "metrics",
+    "Progressbar": "progressbars",
+    "CompactProgressbar": "progressbars",
+    "Sector": "sectors",
+    "FrozenSector": "sectors",
+    "SimpleSignature": "signatures",
+    "SignatureSegment": "signatures",
+    "SquareEmojiSignature": "signatures",
+    "FrozenSignatureSegment": "signatures",
+    "FrozenSimpleSignature": "signatures",
+    "FrozenSquareEmojiSignature": "signatures",
+    "SignatureRegistry": "signatures",
+    "SIGNATURES": "signatures",
+    "signature_key": "signatures",
+    "glyph_metrics": "signatures",
+    "ProgressbarWriter": "writers",
+}
+"""Public names by submodules that define them."""
+
+if not typing.TYPE_CHECKING:
+    # Type checkers see names of star-imported submodules instead.
+    __all__ = tuple(_EXPORTS)
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        submodule = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value  # Next access will not call __getattr__.
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
@@ -0,0 +1,656 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Implementations of progressbar render caches."""
+from __future__ import annotations
+
+__all__ = (
+    "LRURenderCache",
+    "RenderSnapshot",
+    "RenderTable",
+    "RENDER_TABLES",
+    "compile_render_function",
+    "RENDER_FUNCTIONS",
+)
+
+import collections
+import threading
+import typing
+
+from multibar import utils
+from multibar.api import caches
+
+from . import calculation_service as math_operations
+from . import hooks
+from . import signatures as signatures_
+
+if typing.TYPE_CHECKING:
+    from multibar import types as progress_types
+    from multibar.api import calculation_service as abc_math_operations
+    from multibar.api import sectors as abc_sectors
+    from multibar.api import signatures
+
+_KeyT = typing.TypeVar("_KeyT", bound=typing.Hashable)
+_ValueT = typing.TypeVar("_ValueT")
+
+
+class RenderSnapshot:
+    """Immutable snapshot of rendered progressbar.
+
+    Stores sector display names, filled count and optionally frozen sectors,
+    so it can be safely shared between any number of consumers.
+    """
+
+    __slots__ = ("_signature", "_names", "_filled", "_sectors", "_rendered")
+
+    def __init__(
+        self,
+        signature: signatures.ProgressbarSignatureProtocol,
+        names: tuple[str, ...],
+        filled: int,
+        sectors: tuple[abc_sectors.AbstractSector, ...] = (),
+    ) -> None:
+        """
+        Parameters
+        ----------
+        signature : signatures.ProgressbarSignatureProtocol
+            Signature that snapshot was rendered with.
+        names : tuple[str, ...]
+            Sector display names.
+        filled : int
+            Count of filled sectors.
+        sectors : tuple[abc_sectors.AbstractSector, ...] = ()
+            Frozen sectors, that are shared between progressbars.
+        """
+        self._signature = signature
+        self._names = names
+        self._filled = filled
+        self._sectors = sectors
+        self._rendered = "".join(names)
+
+    @classmethod
+    def from_signature(
+        cls,
+        signature: signatures.ProgressbarSignatureProtocol,
+        /,
+        *,
+        length: int,
+        filled: int,
+        sector_cls: typing.Optional[typing.Type[abc_sectors.AbstractSector]] = None,
+    ) -> RenderSnapshot:
+        """Alternative constructor that renders middle signature segment.
+
+        Parameters
+        ----------
+        signature : signatures.ProgressbarSignatureProtocol, /
+            Signature to render.
+        length : int, *
+            Length of progressbar.
+        filled : int, *
+            Count of filled sectors.
+        sector_cls : typing.Optional[typing.Type[abc_sectors.AbstractSector]] = None, *
+            Frozen sector cls to build shared sectors with. If None, only
+            sector names are rendered.
+
+        Returns
+        -------
+        RenderSnapshot
+            Rendered snapshot.
+        """
+        middle = signature.middle
+        names = (middle.on_filled,) * filled + (middle.on_unfilled,) * (length - filled)
+        if sector_cls is None:
+            return cls(signature, names, filled)
+
+        # Frozen sectors do not depend on their position, so only two of them are built.
+        filled_sector = sector_cls(middle.on_filled, True, -1)
+        unfilled_sector = sector_cls(middle.on_unfilled, False, -1)
+        sectors = (filled_sector,) * filled + (unfilled_sector,) * (length - filled)
+        return cls(signature, names, filled, sectors)
+
+    def __len__(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Sectors count.
+        """
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        """Returns string representation of rendered progressbar."""
+        return self._rendered
+
+    @property
+    def signature(self) -> signatures.ProgressbarSignatureProtocol:
+        """
+        Returns
+        -------
+        signatures.ProgressbarSignatureProtocol
+            Signature that snapshot was rendered with.
+        """
+        return self._signature
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """
+        Returns
+        -------
+        tuple[str, ...]
+            Sector display names.
+        """
+        return self._names
+
+    @property
+    def filled(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Count of filled sectors.
+        """
+        return self._filled
+
+    @property
+    def sectors(self) -> tuple[abc_sectors.AbstractSector, ...]:
+        """
+        Returns
+        -------
+        tuple[abc_sectors.AbstractSector, ...]
+            Shared frozen sectors or empty tuple, if snapshot stores only names.
+        """
+        return self._sectors
+
+
+class LRURenderCache(caches.RenderCacheAware[_KeyT, _ValueT]):
+    """Implementation of caches.RenderCacheAware with least-recently-used eviction.
+
+    !!! note
+        Documentation duplicated for mkdocs auto-reference
+        plugin.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import multibar
+        ...
+        >>> writer = multibar.ProgressbarWriter(
+        ...     sector_cls=multibar.FrozenSector,
+        ...     render_cache=multibar.LRURenderCache(maxsize=64),
+        ... )
+        >>> for start in range(1_000):
+        ...     writer.write(start, 1_000)
+        ...
+        >>> writer.render_cache.stats().misses  # Bar of length 20 has only 21 states.
+        21
+        ```
+    """
+
+    __slots__ = ("_entries", "_maxsize", "_hits", "_misses", "_evictions", "_lock")
+
+    def __init__(self, *, maxsize: int = 256) -> None:
+        """
+        Parameters
+        ----------
+        maxsize : int = 256
+            Maximum count of entries in the cache.
+
+        Raises
+        ------
+        ValueError
+            If `maxsize` is less than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache `maxsize` must be more than 0.")
+
+        self._entries: collections.OrderedDict[_KeyT, _ValueT] = collections.OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Current count of entries in the cache.
+        """
+        return len(self._entries)
+
+    def __contains__(self, key: typing.Any, /) -> bool:
+        """
+        Returns
+        -------
+        bool
+            True if key is stored in the cache. Does not affect statistics.
+        """
+        return key in self._entries
+
+    def get(self, key: _KeyT, /) -> typing.Optional[_ValueT]:
+        """Returns cached value by key and registers a hit or a miss.
+
+        Parameters
+        ----------
+        key : _KeyT, /
+            Key to look up.
+
+        Returns
+        -------
+        typing.Optional[_ValueT]
+            Cached value or None, if key is not stored in the cache.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: _KeyT, value: _ValueT, /) -> _ValueT:
+        """Stores value in the cache, evicting least recently used entries if needed.
+
+        Parameters
+        ----------
+        key : _KeyT, /
+            Key to store value by.
+        value : _ValueT, /
+            Value to store.
+
+        Returns
+        -------
+        _ValueT
+            Stored value to allow fluent-style.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return value
+
+    def clear(self) -> None:
+        """Removes all entries and resets statistics.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> caches.CacheStats:
+        """Returns snapshot of cache statistics.
+
+        Returns
+        -------
+        caches.CacheStats
+            Immutable statistics snapshot.
+        """
+        return caches.CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            maxsize=self._maxsize,
+            currsize=len(self._entries),
+        )
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Maximum count of entries in the cache.
+        """
+        return self._maxsize
+
+
+class RenderTable:
+    """Precomputed table of all renders of progressbar with fixed signature and length.
+
+    Progressbar of length `L` can only be rendered in `L + 1` ways, so the table
+    stores every plain render and every render with `start` & `end` chars, that
+    WRITER_HOOKS would apply. Every lookup after that is a single index operation.
+
+    !!! info
+        Filled counts out of `[0, L]` range are clamped, so negative progress
+        is rendered empty and overfilled progress is rendered full.
+
+    !!! warning
+        Table stores `5 * (L + 1)` strings of length `L`, so it is meant for
+        short progressbars that are rendered many times.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import multibar
+        ...
+        >>> writer = multibar.ProgressbarWriter.from_signature(
+        ...     multibar.SquareEmojiSignature(),
+        ...     precompute_lengths=(20,),
+        ... )
+        >>> writer.render_tables[20].render(50, 100)  # Same as client with WRITER_HOOKS.
+        ```
+    """
+
+    __slots__ = ("_signature", "_length", "_calculation_cls", "_plain", "_capped")
+
+    def __init__(
+        self,
+        signature: signatures.ProgressbarSignatureProtocol,
+        /,
+        *,
+        length: int,
+        calculation_cls: typing.Optional[typing.Type[abc_math_operations.AbstractCalculationService]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        signature : signatures.ProgressbarSignatureProtocol, /
+            Signature to render.
+        length : int, *
+            Length of progressbar.
+        calculation_cls : typing.Optional[typing.Type[AbstractCalculationService]] = None
+            Math operations for start & end values lookups.
+
+        Raises
+        ------
+        ValueError
+            If `length` is less than 1.
+        """
+        if length < 1:
+            raise ValueError("Length of progress bar must be more than 0.")
+
+        self._signature = signature
+        self._length = length
+        self._calculation_cls = utils.none_or(math_operations.ProgressbarCalculationService, calculation_cls)
+
+        start, end, middle = signature.start, signature.end, signature.middle
+        plain: list[str] = []
+        capped: list[str] = []
+
+        for filled in range(length + 1):
+            names = [middle.on_filled] * filled + [middle.on_unfilled] * (length - filled)
+            plain.append("".join(names))
+
+            # Index layout: filled << 2 | start_filled << 1 | end_filled.
+            for start_name in (start.on_unfilled, start.on_filled):
+                for end_name in (end.on_unfilled, end.on_filled):
+                    names[0] = start_name
+                    names[-1] = end_name
+                    capped.append("".join(names))
+
+        self._plain = tuple(plain)
+        self._capped = tuple(capped)
+
+    @classmethod
+    def for_signature(
+        cls,
+        signature: signatures.ProgressbarSignatureProtocol,
+        /,
+        *,
+        length: int,
+        calculation_cls: typing.Optional[typing.Type[abc_math_operations.AbstractCalculationService]] = None,
+    ) -> RenderTable:
+        """Alternative constructor that shares tables through `RENDER_TABLES`,
+        so every table is built once per process.
+
+        !!! info
+            Equal frozen signatures share one table, see `signatures.signature_key()`.
+
+        Parameters
+        ----------
+        signature : signatures.ProgressbarSignatureProtocol, /
+            Signature to render.
+        length : int, *
+            Length of progressbar.
+        calculation_cls : typing.Optional[typing.Type[AbstractCalculationService]] = None
+            Math operations for start & end values lookups.
+
+        Returns
+        -------
+        RenderTable
+            Shared render table.
+        """
+        calculation_cls = utils.none_or(math_operations.ProgressbarCalculationService, calculation_cls)
+        key = (signatures_.signature_key(signature), length, id(calculation_cls))
+        table = RENDER_TABLES.get(key)
+        if table is None:
+            table = RENDER_TABLES.put(key, cls(signature, length=length, calculation_cls=calculation_cls))
+        return table
+
+    def __len__(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Count of plain renders (`length + 1`).
+        """
+        return len(self._plain)
+
+    def get(self, filled: int, /) -> str:
+        """Returns plain render without `start` & `end` chars.
+
+        Parameters
+        ----------
+        filled : int, /
+            Count of filled sectors.
+
+        Returns
+        -------
+        str
+            Rendered progressbar.
+        """
+        return self._plain[min(max(filled, 0), self._length)]
+
+    def get_capped(self, filled: int, /, *, start_filled: bool, end_filled: bool) -> str:
+        """Returns render with `start` & `end` chars.
+
+        Parameters
+        ----------
+        filled : int, /
+            Count of filled sectors.
+        start_filled : bool, *
+            If True, `start` char will be filled.
+        end_filled : bool, *
+            If True, `end` char will be filled.
+
+        Returns
+        -------
+        str
+            Rendered progressbar.
+        """
+        return self._capped[min(max(filled, 0), self._length) << 2 | start_filled << 1 | end_filled]
+
+    def render(self, start_value: int, end_value: int, /, *, capped: bool = True) -> str:
+        """Renders progress by start & end values.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress).
+        end_value : int, /
+            End value (needed progress).
+        capped : bool = True, *
+            If True, `start` & `end` chars will be rendered like WRITER_HOOKS does.
+
+        Returns
+        -------
+        str
+            Rendered progressbar.
+        """
+        calculation_service = self._calculation_cls(start_value, end_value, self._length)
+        filled = min(max(calculation_service.filled_count(), 0), self._length)
+        if not capped:
+            return self._plain[filled]
+
+        percentage = calculation_service.progress_percents
+        return self._capped[filled << 2 | (percentage >= hooks.FIRST_FILL) << 1 | (percentage >= hooks.LAST_FILL)]
+
+    @property
+    def signature(self) -> signatures.ProgressbarSignatureProtocol:
+        """
+        Returns
+        -------
+        signatures.ProgressbarSignatureProtocol
+            Signature that table was rendered with.
+        """
+        return self._signature
+
+    @property
+    def length(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Length of progressbar.
+        """
+        return self._length
+
+
+RENDER_TABLES: LRURenderCache[tuple[int, int, int], RenderTable] = LRURenderCache(maxsize=128)
+"""Process-wide registry of render tables, that used by `RenderTable.for_signature()`.
+
+!!! warning
+    Tables are keyed by signature identity, so if you mutate
+    signature in-place, you should clear the registry manually.
+"""
+
+
+_RENDER_FUNCTION_TEMPLATE: typing.Final[
+    str
+] = """
+def render(start_value, end_value, /):
+    filled = {filled_count}
+    if 0 <= filled <= {length}:
+        return RENDERS[{start} - {filled_offset}:{stop} - {unfilled_offset}]
+    return ON_FILLED * filled + ON_UNFILLED * ({length} - filled)
+"""
+"""Source of render function, that slices every render out of a single string
+`on_filled * length + on_unfilled * length`."""
+
+
+def _scaled(width: int, /) -> str:
+    return "filled" if width == 1 else f"filled * {width}"
+
+
+def _build_render_function(
+    signature: signatures.ProgressbarSignatureProtocol,
+    /,
+    *,
+    length: int,
+    calculation_cls: typing.Type[abc_math_operations.AbstractCalculationService],
+) -> progress_types.RenderFunctionType:
+    on_filled, on_unfilled = signature.middle.on_filled, signature.middle.on_unfilled
+    if calculation_cls is math_operations.ProgressbarCalculationService:
+        # Inlined `ProgressbarCalculationService.filled_count()`, keeps the same
+        # order of float operations, so rounding is exactly the same.
+        filled_count = f"round(start_value / end_value * 100 / {100 / length!r})"
+    else:
+        filled_count = f"CALCULATION_CLS(start_value, end_value, {length}).filled_count()"
+
+    source = _RENDER_FUNCTION_TEMPLATE.format(
+        filled_count=filled_count,
+        length=length,
+        # Render with `filled` sectors starts at `(length - filled) * len(on_filled)`.
+        start=length * len(on_filled),
+        filled_offset=_scaled(len(on_filled)),
+        stop=length * (len(on_filled) + len(on_unfilled)),
+        unfilled_offset=_scaled(len(on_unfilled)),
+    )
+    namespace: dict[str, typing.Any] = {
+        "RENDERS": on_filled * length + on_unfilled * length,
+        "ON_FILLED": on_filled,
+        "ON_UNFILLED": on_unfilled,
+        "CALCULATION_CLS": calculation_cls,
+        # Keeps signature alive while function is registered, so its id cannot be reused.
+        "SIGNATURE": signature,
+    }
+    exec(compile(source, f"<multibar render length={length}>", "exec"), namespace)
+    return typing.cast("progress_types.RenderFunctionType", namespace["render"])
+
+
+def compile_render_function(
+    signature: signatures.ProgressbarSignatureProtocol,
+    /,
+    *,
+    length: int,
+    calculation_cls: typing.Optional[typing.Type[abc_math_operations.AbstractCalculationService]] = None,
+) -> progress_types.RenderFunctionType:
+    """Generates and compiles render function specialized for signature, length
+    and calculation cls. Functions are shared through `RENDER_FUNCTIONS`, so
+    every function is compiled once per process.
+
+    Every render is a single slice of precomputed `on_filled * length + on_unfilled * length`
+    string, so unlike `RenderTable` it takes `O(length)` memory.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import multibar
+        ...
+        >>> render = multibar.compile_render_function(multibar.SimpleSignature(), length=6)
+        >>> render(50, 100)
+        '+++---'
+        ```
+
+    Parameters
+    ----------
+    signature : signatures.ProgressbarSignatureProtocol, /
+        Signature to render.
+    length : int, *
+        Length of progressbar.
+    calculation_cls : typing.Optional[typing.Type[AbstractCalculationService]] = None
+        Math operations for filled count, default one is inlined into function.
+
+    Raises
+    ------
+    ValueError
+        If `length` is less than 1.
+
+    Returns
+    -------
+    progress_types.RenderFunctionType
+        Function of `(start_value, end_value)`, that returns same string as
+        `ProgressbarWriter.write_str()`.
+    """
+    if length < 1:
+        raise ValueError("Length of progress bar must be more than 0.")
+
+    calculation_cls = utils.none_or(math_operations.ProgressbarCalculationService, calculation_cls)
+    key = (signatures_.signature_key(signature), length, id(calculation_cls))
+    render = RENDER_FUNCTIONS.get(key)
+    if render is None:
+        render = RENDER_FUNCTIONS.put(
+            key,
+            _build_render_function(signature, length=length, calculation_cls=calculation_cls),
+        )
+    return render
+
+
+RENDER_FUNCTIONS: LRURenderCache[tuple[int, int, int], progress_types.RenderFunctionType] = LRURenderCache(maxsize=128)
+"""Process-wide registry of compiled render functions, that used by `compile_render_function()`.
+
+!!! warning
+    Functions are keyed by signature identity, so if you mutate
+    signature in-place, you should clear the registry manually.
+"""
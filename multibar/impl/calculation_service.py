@@ -16,13 +16,19 @@
 """Implementations of Python-Multibar math operations."""
 from __future__ import annotations
 
-__all__ = ("ProgressbarCalculationService",)
+__all__ = ("ProgressbarCalculationService", "ExactCalculationService", "VectorizedCalculationService")
 
 import collections.abc
 import typing
 
 from multibar.api import calculation_service
 
+if typing.TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+
+    from multibar import types as progress_types
+
 
 class ProgressbarCalculationService(calculation_service.AbstractCalculationService):
     """Implementation of calculation_service.AbstractCalculationService.
@@ -42,8 +48,17 @@ class ProgressbarCalculationService(calculation_service.AbstractCalculationServi
         collections.abc.Iterator[int]
             Iterator over progressbar filled sector indexes.
         """
-        filled_range = range(round(self.progress_percents / (100 / self._length)))
-        return iter(filled_range)
+        return iter(range(self.filled_count()))
+
+    def filled_count(self) -> int:
+        """Returns count of progressbar filled sectors.
+
+        Returns
+        -------
+        int
+            Count of filled sectors.
+        """
+        return round(self.progress_percents / (100 / self._length))
 
     def calculate_unfilled_indexes(self) -> collections.abc.Iterator[int]:
         """Returns iterator over progressbar unfilled sector indexes.
@@ -55,7 +70,7 @@ class ProgressbarCalculationService(calculation_service.AbstractCalculationServi
         collections.abc.Iterator[int]
             Iterator over progressbar unfilled sector indexes.
         """
-        filled_range_len = len(tuple(self.calculate_filled_indexes()))
+        filled_range_len = self.filled_count()
         unfilled_range = range(self._length - filled_range_len)
         return map(lambda i: i + filled_range_len, unfilled_range)
 
@@ -82,3 +97,288 @@ class ProgressbarCalculationService(calculation_service.AbstractCalculationServi
             Float progress percentage.
         """
         return self.get_progress_percentage(self._start_value, self._end_value)
+
+
+def _exact_ratio(
+    numerator: progress_types.ExactNumberType,
+    denominator: progress_types.ExactNumberType,
+    /,
+) -> tuple[int, int]:
+    # Integers are passed as is, other values are split into integer ratios,
+    # so neither of them is converted to float.
+    if type(numerator) is int and type(denominator) is int:
+        top, bottom = numerator, denominator
+    else:
+        numerator_top, numerator_bottom = numerator.as_integer_ratio()
+        denominator_top, denominator_bottom = denominator.as_integer_ratio()
+        top, bottom = numerator_top * denominator_bottom, numerator_bottom * denominator_top
+
+    if not bottom:
+        raise ZeroDivisionError("division by zero")
+    if bottom < 0:
+        return -top, -bottom
+    return top, bottom
+
+
+class ExactCalculationService(calculation_service.AbstractCalculationService):
+    """Implementation of calculation_service.AbstractCalculationService
+    with exact integer arithmetic.
+
+    Filled count is computed by a single `divmod()` of integers and rounded
+    half to even, so it never drifts for huge counters (for example byte
+    counts above `2 ** 53`), where float division loses precision.
+    `fractions.Fraction` & `decimal.Decimal` values are supported
+    without float conversion as well.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> from fractions import Fraction
+        >>> from multibar import ExactCalculationService
+        ...
+        >>> ExactCalculationService(2 ** 60 + 1, 2 ** 61, 20).filled_count()
+        10
+        >>> ExactCalculationService(Fraction(1, 3), Fraction(2, 3), 20).filled_count()
+        10
+        ```
+
+    !!! info
+        Rounding is the same as `ProgressbarCalculationService` has,
+        except cases, where float division of the latter is inexact.
+    """
+
+    def __init__(
+        self,
+        start_value: progress_types.ExactNumberType,
+        end_value: progress_types.ExactNumberType,
+        length: int,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        start_value : progress_types.ExactNumberType
+            Start value (current progress) for progressbar math operations.
+        end_value : progress_types.ExactNumberType
+            End value (needed progress) for progressbar math operations.
+        length : int
+            Length of progressbar for progressbar math operations.
+        """
+        super().__init__(start_value, end_value, length)  # type: ignore[arg-type]
+
+    def calculate_filled_indexes(self) -> collections.abc.Iterator[int]:
+        """Returns iterator over progressbar filled sector indexes.
+        This method is implemented for a more comfortable calculation
+        of the position of the sector in the progress bar.
+
+        Returns
+        -------
+        collections.abc.Iterator[int]
+            Iterator over progressbar filled sector indexes.
+        """
+        return iter(range(self.filled_count()))
+
+    def filled_count(self) -> int:
+        """Returns count of progressbar filled sectors.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If end value equals to zero.
+
+        Returns
+        -------
+        int
+            Count of filled sectors, rounded half to even.
+        """
+        start_value, end_value = self._start_value, self._end_value
+        if type(start_value) is int and type(end_value) is int and end_value > 0:
+            top, bottom = start_value, end_value
+        else:
+            top, bottom = _exact_ratio(start_value, end_value)
+
+        filled, remainder = divmod(top * self._length, bottom)
+        # Half to even: remainder is compared with a half of divisor without division.
+        doubled_remainder = remainder * 2
+        if doubled_remainder > bottom or (doubled_remainder == bottom and filled & 1):
+            filled += 1
+        return filled
+
+    def calculate_unfilled_indexes(self) -> collections.abc.Iterator[int]:
+        """Returns iterator over progressbar unfilled sector indexes.
+        This method is implemented for a more comfortable calculation
+        of the position of the sector in the progress bar.
+
+        Returns
+        -------
+        collections.abc.Iterator[int]
+            Iterator over progressbar unfilled sector indexes.
+        """
+        return iter(range(self.filled_count(), self._length))
+
+    @staticmethod
+    def get_progress_percentage(start: typing.Union[int, float], end: typing.Union[int, float], /) -> float:
+        """Alternative staticmethod to get progress percentage.
+
+        !!! info
+            Percentage is computed exactly and rounded to float only once.
+
+        Parameters
+        -----------
+        start : typing.Union[int, float]
+            Start value (current progress) for progressbar math operations.
+        end : typing.Union[int, float]
+            End value (needed progress) for progressbar math operations.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If end value equals to zero.
+        """
+        top, bottom = _exact_ratio(start, end)
+        return top * 100 / bottom
+
+    @property
+    def progress_percents(self) -> float:
+        """Returns current progress percentage.
+
+        Returns
+        -------
+        float
+            Float progress percentage.
+        """
+        return self.get_progress_percentage(self._start_value, self._end_value)
+
+
+class VectorizedCalculationService:
+    """Math operations over arrays of start & end values.
+
+    Computes filled counts of many progressbars in one vectorized expression,
+    rounding exactly like `ProgressbarCalculationService.filled_count()`
+    (half to even, same order of float operations).
+
+    !!! warning
+        Requires `numpy`, that can be installed as extra:
+        `#!bash pip install python-multibar[numpy]`.
+
+        Values are converted to `float64` before division, so for integers
+        above `2 ** 53` results may differ from scalar service.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import numpy
+        >>> from multibar import VectorizedCalculationService
+        ...
+        >>> service = VectorizedCalculationService(numpy.arange(0, 101, 25), numpy.full(5, 100), 4)
+        >>> service.filled_counts()
+        array([0, 1, 2, 3, 4])
+        ```
+    """
+
+    __slots__ = ("_start_values", "_end_values", "_length")
+
+    def __init__(self, start_values: npt.ArrayLike, end_values: npt.ArrayLike, length: int) -> None:
+        """
+        Parameters
+        ----------
+        start_values : npt.ArrayLike
+            Start values (current progresses) for progressbar math operations.
+        end_values : npt.ArrayLike
+            End values (needed progresses) for progressbar math operations.
+        length : int
+            Length of progressbars for progressbar math operations.
+
+        Raises
+        ------
+        ImportError
+            If `numpy` is not installed.
+        """
+        try:
+            import numpy
+        except ImportError as exc:
+            raise ImportError(
+                "VectorizedCalculationService requires numpy, install it with `pip install python-multibar[numpy]`."
+            ) from exc
+
+        self._start_values = numpy.asarray(start_values)
+        self._end_values = numpy.asarray(end_values)
+        self._length = length
+
+    @staticmethod
+    def get_progress_percentage(start: npt.ArrayLike, end: npt.ArrayLike, /) -> numpy.ndarray[typing.Any, typing.Any]:
+        """Alternative staticmethod to get progress percentages.
+
+        Parameters
+        -----------
+        start : npt.ArrayLike
+            Start values (current progresses) for progressbar math operations.
+        end : npt.ArrayLike
+            End values (needed progresses) for progressbar math operations.
+
+        Raises
+        ------
+        ZeroDivisionError
+            If any of end values equals to zero, like scalar service does.
+
+        Returns
+        -------
+        numpy.ndarray
+            Float progress percentages.
+        """
+        import numpy
+
+        start, end = numpy.asarray(start), numpy.asarray(end)
+        if not numpy.all(end):
+            raise ZeroDivisionError("division by zero")
+        return numpy.true_divide(start, end) * 100
+
+    def filled_counts(self) -> numpy.ndarray[typing.Any, typing.Any]:
+        """Returns counts of progressbar filled sectors.
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer array of filled sector counts.
+        """
+        import numpy
+
+        return numpy.rint(self.progress_percents / (100 / self._length)).astype(numpy.int64)
+
+    @property
+    def progress_percents(self) -> numpy.ndarray[typing.Any, typing.Any]:
+        """Returns current progress percentages.
+
+        Returns
+        -------
+        numpy.ndarray
+            Float progress percentages.
+        """
+        return self.get_progress_percentage(self._start_values, self._end_values)
+
+    @property
+    def start_values(self) -> numpy.ndarray[typing.Any, typing.Any]:
+        """
+        Returns
+        -------
+        numpy.ndarray
+            Start values (current progresses) for progressbar math operations.
+        """
+        return self._start_values
+
+    @property
+    def end_values(self) -> numpy.ndarray[typing.Any, typing.Any]:
+        """
+        Returns
+        -------
+        numpy.ndarray
+            End values (needed progresses) for progressbar math operations.
+        """
+        return self._end_values
+
+    @property
+    def length_value(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Length of progressbars for progressbar math operations.
+        """
+        return self._length
@@ -16,8 +16,10 @@
 """Implementations of Python-Multibar clients."""
 from __future__ import annotations
 
-__all__ = ("ProgressbarClient",)
+__all__ = ("ProgressbarClient", "AsyncProgressbarClient")
 
+import collections.abc
+import time
 import typing
 
 from multibar import types as progress_types
@@ -25,16 +27,244 @@ from multibar import utils
 from multibar.api import clients as abc_clients
 from multibar.impl import contracts
 from multibar.impl import hooks as hooks_
+from multibar.impl import metrics as metrics_
 from multibar.impl import writers
 
 if typing.TYPE_CHECKING:
     from multibar.api import contracts as abc_contracts
     from multibar.api import hooks as abc_hooks
+    from multibar.api import metrics as abc_metrics
     from multibar.api import progressbars as abc_progressbars
     from multibar.api import sectors as abc_sectors
     from multibar.api import writers as abc_writers
 
 
+_NumberT = typing.TypeVar("_NumberT", int, float)
+
+
+def _as_sequence(values: collections.abc.Iterable[_NumberT], /) -> collections.abc.Sequence[_NumberT]:
+    # Arrays are kept as is for vectorized checks and calculations.
+    if isinstance(values, collections.abc.Sequence) or hasattr(values, "__array__"):
+        return typing.cast(collections.abc.Sequence[_NumberT], values)
+    return list(values)
+
+
+def _scales_of(values: collections.abc.Sequence[float], scale: int, /) -> collections.abc.Sequence[int]:
+    # End values of scaled progresses, arrays get array of scales for vectorized checks.
+    if hasattr(values, "__array__"):
+        import numpy
+
+        return typing.cast(collections.abc.Sequence[int], numpy.full(len(values), scale))
+    return [scale] * len(values)
+
+
+_ResultT = typing.TypeVar("_ResultT")
+
+_STAGE_LABELS: typing.Final[tuple[dict[str, str], ...]] = tuple(
+    {"stage": stage} for stage in ("metadata", "contracts", "pre_hooks", "write", "post_hooks")
+)
+"""Labels of `ProgressbarClient` pipeline stages in order of execution,
+prebuilt to not allocate them per call."""
+
+
+def _no_clock() -> int:
+    # Clock of clients without metrics, so stages are not measured.
+    return 0
+
+
+def _call_metadata(
+    writer: abc_writers.ProgressbarWriterAware,
+    start_value: float,
+    end_value: float,
+    length: int,
+    /,
+) -> progress_types.ProgressMetadataType:
+    return {
+        "calculation_service_cls": writer.calculation_cls,
+        "progressbar": None,
+        "start_value": start_value,
+        "end_value": end_value,
+        "length": length,
+        "sig": writer.signature,
+    }
+
+
+def _batch_metadata(
+    writer: abc_writers.ProgressbarWriterAware,
+    start_values: collections.abc.Sequence[float],
+    end_values: collections.abc.Sequence[float],
+    length: int,
+    /,
+) -> progress_types.ProgressBatchMetadataType:
+    return {
+        "calculation_service_cls": writer.calculation_cls,
+        "progressbars": None,
+        "start_values": start_values,
+        "end_values": end_values,
+        "length": length,
+        "sig": writer.signature,
+    }
+
+
+def _is_never_kept(start_value: int, end_value: int, length: int, /) -> bool:
+    return False
+
+
+def _fuse_hooks(
+    callbacks: collections.abc.Sequence[progress_types.HookSignatureType], /
+) -> typing.Optional[progress_types.HookSignatureType]:
+    if not callbacks:
+        return None
+
+    if len(callbacks) == 1:
+        return callbacks[0]
+
+    fused_callbacks = tuple(callbacks)
+
+    def trigger(*args: typing.Any, **kwargs: typing.Any) -> None:
+        for hook in fused_callbacks:
+            hook(*args, **kwargs)
+
+    return trigger
+
+
+def _fuse_contracts(
+    contract_manager: abc_contracts.ContractManagerAware, /
+) -> typing.Optional[progress_types.ContractGuardType]:
+    guards = [contract.compile_check() for contract in contract_manager.contracts]
+    if not guards:
+        return None
+
+    if any(guard is None for guard in guards):
+        # Some contract needs metadata, so all contracts are checked with it.
+        return _is_never_kept
+
+    fused_guards = typing.cast(tuple[progress_types.ContractGuardType, ...], tuple(guards))
+    if len(fused_guards) == 1:
+        return fused_guards[0]
+
+    def guard(start_value: int, end_value: int, length: int, /) -> bool:
+        return all(guard(start_value, end_value, length) for guard in fused_guards)
+
+    return guard
+
+
+class CompiledPipeline:
+    """`ProgressbarClient.get_progress()` specialized for current client configuration.
+
+    Empty hook lists are eliminated and hooks are called without dispatching.
+    Contracts that provide `ContractAware.compile_check()` are checked by their
+    predicates, and only broken ones are checked with metadata, so errors are
+    reported same as by `get_progress()`. Metadata is not built at all, if there
+    are no hooks and contracts are kept.
+
+    !!! info
+        Pipeline is rebuilt on the next call after client hooks are set or changed,
+        or contracts are subscribed or terminated. Clients with metrics or hooks
+        stats are not specialized, so their measurements stay complete.
+    """
+
+    __slots__ = ("_client", "_hooks", "_hooks_revision", "_contract_manager", "_contracts_revision", "_pipeline")
+
+    def __init__(self, client: ProgressbarClient, /) -> None:
+        """
+        Parameters
+        ----------
+        client : ProgressbarClient, /
+            Client to compile.
+        """
+        self._client = client
+        self._build()
+
+    def __call__(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+        """Generates a progressbar same as `ProgressbarClient.get_progress()`.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress) for progressbar math operations.
+        end_value : int, /
+            End value (needed progress) for progressbar math operations.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar instance.
+        """
+        hooks = self._client.hooks
+        if (
+            hooks is not self._hooks
+            or hooks.revision != self._hooks_revision
+            or self._contract_manager.revision != self._contracts_revision
+        ):
+            self._build()
+
+        return self._pipeline(start_value, end_value, length)
+
+    def _build(self) -> None:
+        client = self._client
+        hooks, contract_manager, writer = client.hooks, client.contract_manager, client.writer
+        self._hooks, self._hooks_revision = hooks, hooks.revision
+        self._contract_manager, self._contracts_revision = contract_manager, contract_manager.revision
+
+        self._pipeline: typing.Callable[[int, int, int], abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]]
+        if client.metrics is not None or getattr(hooks, "collect_stats", False):
+            self._pipeline = lambda start_value, end_value, length: client.get_progress(
+                start_value, end_value, length=length
+            )
+            return
+
+        guard = _fuse_contracts(contract_manager)
+        pre_hooks = _fuse_hooks(hooks.pre_execution_hooks)
+        post_hooks = _fuse_hooks(hooks.post_execution_hooks)
+        validate, write = client._validate_contracts, writer.write
+
+        if pre_hooks is None and post_hooks is None:
+            if guard is None:
+                self._pipeline = lambda start_value, end_value, length: write(start_value, end_value, length=length)
+                return
+
+            is_kept = guard
+
+            def pipeline(
+                start_value: int, end_value: int, length: int
+            ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+                if not is_kept(start_value, end_value, length):
+                    validate(writer, metadata=_call_metadata(writer, start_value, end_value, length))
+                return write(start_value, end_value, length=length)
+
+            self._pipeline = pipeline
+            return
+
+        def hooked_pipeline(
+            start_value: int, end_value: int, length: int
+        ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+            call_metadata = _call_metadata(writer, start_value, end_value, length)
+            if guard is not None and not guard(start_value, end_value, length):
+                validate(writer, metadata=call_metadata)
+
+            if pre_hooks is not None:
+                pre_hooks(client, metadata=call_metadata)
+
+            progressbar = write(start_value, end_value, length=length)
+            if post_hooks is not None:
+                call_metadata["progressbar"] = progressbar
+                post_hooks(client, metadata=call_metadata)
+
+            return progressbar
+
+        self._pipeline = hooked_pipeline
+
+
 class ProgressbarClient(abc_clients.ProgressbarClientAware):
     """Implementation of abc_clients.ProgressbarClientAware.
 
@@ -43,7 +273,7 @@ class ProgressbarClient(abc_clients.ProgressbarClientAware):
         plugin.
     """
 
-    __slots__ = ("_hooks", "_writer", "_contract_manager")
+    __slots__ = ("_hooks", "_writer", "_contract_manager", "_metrics")
 
     def __init__(
         self,
@@ -51,6 +281,7 @@ class ProgressbarClient(abc_clients.ProgressbarClientAware):
         hooks: typing.Optional[abc_hooks.HooksAware] = None,
         progress_writer: typing.Optional[abc_writers.ProgressbarWriterAware] = None,
         contract_manager: typing.Optional[abc_contracts.ContractManagerAware] = None,
+        metrics: typing.Optional[abc_metrics.MetricsSinkAware] = None,
     ) -> None:
         """
         Parameters
@@ -61,16 +292,26 @@ class ProgressbarClient(abc_clients.ProgressbarClientAware):
             Writer for progressbar generation.
         contract_manager : typing.Optional[ContractManagerAware] = None
             Contract manager for any progress checks.
+        metrics : typing.Optional[MetricsSinkAware] = None
+            Sink for latencies of `get_progress*()` stages and counts of on-error
+            hooks triggers, also passed to the default contract manager.
         """
         self._hooks = utils.none_or(hooks_.Hooks(), hooks)
         self._writer = utils.none_or(writers.ProgressbarWriter(), progress_writer)
+        self._metrics = metrics
 
         if contract_manager is None:
-            contract_manager = contracts.ContractManager()
+            contract_manager = contracts.ContractManager(metrics=metrics)
             contract_manager.subscribe(contracts.WRITE_PROGRESS_CONTRACT)
 
         self._contract_manager: abc_contracts.ContractManagerAware = contract_manager
 
+    def _trigger_on_error(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        if self._metrics is not None and self._hooks.on_error_hooks:
+            self._metrics.increment(metrics_.ON_ERROR_INVOCATIONS_TOTAL)
+
+        self._hooks.trigger_on_error(*args, **kwargs)
+
     def _validate_contracts(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         """Triggers on-error hooks if broken contract raise error.
 
@@ -88,7 +329,149 @@ class ProgressbarClient(abc_clients.ProgressbarClientAware):
         try:
             self._contract_manager.check_contracts(*args, **kwargs)
         except Exception as exc:
-            self._hooks.trigger_on_error(*args, exc, **kwargs)
+            self._trigger_on_error(*args, exc, **kwargs)
+
+    def _validate_contracts_many(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Triggers on-error hooks if broken contract raise error
+        while checking a batch of progresses.
+
+        Parameters
+        ----------
+        *args: typing.Any
+            Arguments to contract check.
+
+        **kwargs: typing.Any
+            Keyword arguments to contract check.
+        """
+        try:
+            self._contract_manager.check_contracts_many(*args, **kwargs)
+        except Exception as exc:
+            self._trigger_on_error(*args, exc, **kwargs)
+
+    def _observe_stages(self, *timestamps: int) -> None:
+        # Stages that were not executed have no finish timestamp and are skipped.
+        if self._metrics is not None:
+            for labels, stage_started, stage_finished in zip(_STAGE_LABELS, timestamps, timestamps[1:]):
+                self._metrics.observe(
+                    metrics_.CLIENT_STAGE_SECONDS,
+                    (stage_finished - stage_started) / 1e9,
+                    labels=labels,
+                )
+
+    def _execute(
+        self,
+        start_value: float,
+        end_value: float,
+        length: int,
+        write: typing.Callable[[], _ResultT],
+        /,
+        *,
+        post_execution: bool = True,
+    ) -> _ResultT:
+        """Checks contracts, triggers hooks around `write` and measures every stage
+        if client has metrics sink.
+
+        Parameters
+        ----------
+        start_value : float, /
+            Start value, ratio or percentage passed to contracts and hooks.
+        end_value : float, /
+            End value, 1 or 100 passed to contracts and hooks.
+        length : int, /
+            Length of progressbar.
+        write : typing.Callable[[], _ResultT], /
+            Writes progressbar or its string representation.
+        post_execution : bool = True, *
+            If False, post-execution hooks are not triggered, so `write` may return string.
+
+        Returns
+        -------
+        _ResultT
+            Result of `write`.
+        """
+        clock = _no_clock if self._metrics is None else time.perf_counter_ns
+        started = clock()
+
+        call_metadata = _call_metadata(self._writer, start_value, end_value, length)
+        metadata_built = clock()
+
+        self._validate_contracts(self._writer, metadata=call_metadata)
+        contracts_checked = clock()
+
+        self._hooks.trigger_pre_execution(self, metadata=call_metadata)
+        pre_hooks_triggered = clock()
+
+        result = write()
+        written = clock()
+
+        if not post_execution:
+            self._observe_stages(started, metadata_built, contracts_checked, pre_hooks_triggered, written)
+            return result
+
+        # Post-execution hooks are triggered only for progressbar objects.
+        call_metadata["progressbar"] = typing.cast(
+            "abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]", result
+        )
+        self._hooks.trigger_post_execution(self, metadata=call_metadata)
+        self._observe_stages(started, metadata_built, contracts_checked, pre_hooks_triggered, written, clock())
+        return result
+
+    def _execute_many(
+        self,
+        start_values: collections.abc.Sequence[float],
+        end_values: collections.abc.Sequence[float],
+        length: int,
+        write: typing.Callable[[], _ResultT],
+        /,
+        *,
+        post_execution: bool = True,
+    ) -> _ResultT:
+        """Batch version of `_execute()`, checks contracts and triggers hooks once.
+
+        Parameters
+        ----------
+        start_values : collections.abc.Sequence[float], /
+            Start values, ratios or percentages passed to contracts and hooks.
+        end_values : collections.abc.Sequence[float], /
+            End values, 1 or 100 passed to contracts and hooks.
+        length : int, /
+            Length of progressbars.
+        write : typing.Callable[[], _ResultT], /
+            Writes progressbars or their string representations.
+        post_execution : bool = True, *
+            If False, post-execution hooks are not triggered, so `write` may return strings.
+
+        Returns
+        -------
+        _ResultT
+            Result of `write`.
+        """
+        clock = _no_clock if self._metrics is None else time.perf_counter_ns
+        started = clock()
+
+        call_metadata = _batch_metadata(self._writer, start_values, end_values, length)
+        metadata_built = clock()
+
+        self._validate_contracts_many(self._writer, metadata=call_metadata)
+        contracts_checked = clock()
+
+        self._hooks.trigger_pre_execution_many(self, metadata=call_metadata)
+        pre_hooks_triggered = clock()
+
+        result = write()
+        written = clock()
+
+        if not post_execution:
+            self._observe_stages(started, metadata_built, contracts_checked, pre_hooks_triggered, written)
+            return result
+
+        # Post-execution hooks are triggered only for progressbar objects.
+        call_metadata["progressbars"] = typing.cast(
+            "list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]]", result
+        )
+        self._hooks.trigger_post_execution_many(self, metadata=call_metadata)
+        self._observe_stages(started, metadata_built, contracts_checked, pre_hooks_triggered, written, clock())
+        return result
 
     def get_progress(
         self,
@@ -131,23 +514,426 @@ class ProgressbarClient(abc_clients.ProgressbarClientAware):
             Progressbar instance.
         """
         writer = self._writer
-        call_metadata: progress_types.ProgressMetadataType = {
-            "calculation_service_cls": writer.calculation_cls,
-            "progressbar": None,
-            "start_value": start_value,
-            "end_value": end_value,
-            "length": length,
-            "sig": writer.signature,
-        }
+        return self._execute(
+            start_value, end_value, length, lambda: writer.write(start_value, end_value, length=length)
+        )
 
-        self._validate_contracts(self._writer, metadata=call_metadata)
-        self._hooks.trigger_pre_execution(self, metadata=call_metadata)
+    def get_progress_str(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> str:
+        """Generates string representation of progressbar, can be a wrapper
+        for ProgressWriterAware.write_str() to implement hooks and various kinds of checks.
 
-        progressbar = self._writer.write(start_value, end_value, length=length)
-        call_metadata["progressbar"] = progressbar
+        !!! info
+            Post-execution hooks may transform progressbar object, so if any of them
+            is set, progressbar will be generated via `get_progress()`. Otherwise, no
+            sector or progressbar objects will be allocated.
 
-        self._hooks.trigger_post_execution(self, metadata=call_metadata)
-        return progressbar
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress) for progressbar math operations.
+        end_value : int, /
+            End value (needed progress) for progressbar math operations.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Raises
+        ------
+        errors.TerminatedContractError
+            See `get_progress()` for details.
+
+        Returns
+        -------
+        str
+            String representation of progressbar.
+        """
+        if self._hooks.post_execution_hooks:
+            return repr(self.get_progress(start_value, end_value, length=length))
+
+        writer = self._writer
+        return self._execute(
+            start_value,
+            end_value,
+            length,
+            lambda: writer.write_str(start_value, end_value, length=length),
+            post_execution=False,
+        )
+
+    @typing.overload
+    def get_progress_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def get_progress_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def get_progress_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]], list[str]]:
+        """Generates a batch of progressbars, can be a wrapper for ProgressWriterAware.write_many()
+        to implement hooks and various kinds of checks in a single pass.
+
+        !!! info
+            Contracts are checked once for the whole batch and hooks are triggered
+            once with `ProgressBatchMetadataType` metadata. Hooks marked with
+            `per_item_hook` are invoked once per every progressbar instead.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> client = multibar.ProgressbarClient()
+            >>> client.get_progress_many([25, 50, 75], [100, 100, 100], length=4, as_str=True)
+            ['+---', '++--', '+++-']
+            ```
+
+        Parameters
+        ----------
+        start_values : collections.abc.Iterable[int], /
+            Start values (current progresses) for progressbar math operations.
+        end_values : collections.abc.Iterable[int], /
+            End values (needed progresses), paired with start values.
+        length : int = 20, *
+            Length of progressbars for progressbar math operations.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Raises
+        ------
+        errors.TerminatedContractError
+            See `get_progress()` for details.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        writer = self._writer
+        starts, ends = _as_sequence(start_values), _as_sequence(end_values)
+        if as_str and not self._hooks.post_execution_hooks:
+            return self._execute_many(
+                starts,
+                ends,
+                length,
+                lambda: writer.write_many(starts, ends, length=length, as_str=True),
+                post_execution=False,
+            )
+
+        progressbars = self._execute_many(starts, ends, length, lambda: writer.write_many(starts, ends, length=length))
+        if as_str:
+            return [repr(progressbar) for progressbar in progressbars]
+
+        return progressbars
+
+    def get_progress_ratio(
+        self,
+        ratio: float,
+        /,
+        *,
+        length: int = 20,
+    ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+        """Generates a progressbar from ratio, can be a wrapper for
+        ProgressWriterAware.write_ratio() to implement hooks and various kinds of checks.
+
+        !!! info
+            Hooks and contracts get ratio as `start_value` and 1 as `end_value`,
+            so `WRITE_PROGRESS_CONTRACT` checks that ratio is not more than 1.
+            Subscribe `PROGRESS_RANGE_CONTRACT` to reject negative progress as well,
+            otherwise writer clamps it to empty progressbar.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> client = multibar.ProgressbarClient()
+            >>> client.get_progress_ratio(0.5, length=4)
+            ++--
+            ```
+
+        Parameters
+        ----------
+        ratio : float, /
+            Progress ratio, from 0 to 1.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Raises
+        ------
+        errors.TerminatedContractError
+            See `get_progress()` for details.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar instance.
+        """
+        writer = self._writer
+        return self._execute(ratio, 1, length, lambda: writer.write_ratio(ratio, length=length))
+
+    def get_progress_percent(
+        self,
+        percent: float,
+        /,
+        *,
+        length: int = 20,
+    ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+        """Generates a progressbar from percentage, can be a wrapper for
+        ProgressWriterAware.write_percent() to implement hooks and various kinds of checks.
+
+        !!! info
+            Hooks and contracts get percentage as `start_value` and 100 as `end_value`,
+            so `WRITE_PROGRESS_CONTRACT` checks that percentage is not more than 100.
+            Subscribe `PROGRESS_RANGE_CONTRACT` to reject negative progress as well,
+            otherwise writer clamps it to empty progressbar.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> client = multibar.ProgressbarClient()
+            >>> client.get_progress_percent(50, length=4)
+            ++--
+            ```
+
+        Parameters
+        ----------
+        percent : float, /
+            Progress percentage, from 0 to 100.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Raises
+        ------
+        errors.TerminatedContractError
+            See `get_progress()` for details.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar instance.
+        """
+        writer = self._writer
+        return self._execute(percent, 100, length, lambda: writer.write_percent(percent, length=length))
+
+    @typing.overload
+    def get_progress_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def get_progress_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def get_progress_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]], list[str]]:
+        """Generates a batch of progressbars from ratios, can be a wrapper for
+        ProgressWriterAware.write_ratio_many() to implement hooks and various kinds of checks
+        in a single pass.
+
+        !!! info
+            Contracts & hooks get ratios as `start_values` and 1 as `end_values`,
+            see `get_progress_many()` for details.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> client = multibar.ProgressbarClient()
+            >>> client.get_progress_ratio_many([0.25, 0.5, 0.75], length=4, as_str=True)
+            ['+---', '++--', '+++-']
+            ```
+
+        Parameters
+        ----------
+        ratios : collections.abc.Iterable[float], /
+            Progress ratios, arrays are checked and computed in vectorized expressions.
+        length : int = 20, *
+            Length of progressbars for progressbar math operations.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Raises
+        ------
+        errors.TerminatedContractError
+            See `get_progress()` for details.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        writer = self._writer
+        values = _as_sequence(ratios)
+        if as_str and not self._hooks.post_execution_hooks:
+            return self._execute_many(
+                values,
+                _scales_of(values, 1),
+                length,
+                lambda: writer.write_ratio_many(values, length=length, as_str=True),
+                post_execution=False,
+            )
+
+        progressbars = self._execute_many(
+            values, _scales_of(values, 1), length, lambda: writer.write_ratio_many(values, length=length)
+        )
+        if as_str:
+            return [repr(progressbar) for progressbar in progressbars]
+
+        return progressbars
+
+    @typing.overload
+    def get_progress_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def get_progress_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def get_progress_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]], list[str]]:
+        """Generates a batch of progressbars from percentages, can be a wrapper for
+        ProgressWriterAware.write_percent_many() to implement hooks and various kinds of checks
+        in a single pass.
+
+        !!! info
+            Contracts & hooks get percentages as `start_values` and 100 as `end_values`,
+            see `get_progress_many()` for details.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> client = multibar.ProgressbarClient()
+            >>> client.get_progress_percent_many([25, 50, 75], length=4, as_str=True)
+            ['+---', '++--', '+++-']
+            ```
+
+        Parameters
+        ----------
+        percents : collections.abc.Iterable[float], /
+            Progress percentages, arrays are checked and computed in vectorized expressions.
+        length : int = 20, *
+            Length of progressbars for progressbar math operations.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Raises
+        ------
+        errors.TerminatedContractError
+            See `get_progress()` for details.
+
+        Returns
+        -------
+        typing.Union[list[progressbars.ProgressbarAware[sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        writer = self._writer
+        values = _as_sequence(percents)
+        if as_str and not self._hooks.post_execution_hooks:
+            return self._execute_many(
+                values,
+                _scales_of(values, 100),
+                length,
+                lambda: writer.write_percent_many(values, length=length, as_str=True),
+                post_execution=False,
+            )
+
+        progressbars = self._execute_many(
+            values, _scales_of(values, 100), length, lambda: writer.write_percent_many(values, length=length)
+        )
+        if as_str:
+            return [repr(progressbar) for progressbar in progressbars]
+
+        return progressbars
+
+    def compile(self) -> CompiledPipeline:
+        """Compiles `get_progress()` specialized for current client configuration.
+
+        ??? example "Expand example of usage"
+            ```py
+            import multibar
+
+            client = multibar.ProgressbarClient()
+            get_progress = client.compile()
+
+            for progress in range(101):
+                print(get_progress(progress, 100))
+            ```
+
+        Returns
+        -------
+        CompiledPipeline
+            Callable with `get_progress()` signature, that is rebuilt
+            automatically when hooks or contracts of the client change.
+        """
+        return CompiledPipeline(self)
 
     def set_hooks(self, hooks: abc_hooks.HooksAware, /) -> ProgressbarClient:
         """Sets hooks to the client.
@@ -210,3 +996,274 @@ class ProgressbarClient(abc_clients.ProgressbarClientAware):
             Progressbar writer for progress generating.
         """
         return self._writer
+
+    @property
+    def metrics(self) -> typing.Optional[abc_metrics.MetricsSinkAware]:
+        """
+        Returns
+        -------
+        typing.Optional[MetricsSinkAware]
+            Client metrics sink, if any.
+        """
+        return self._metrics
+
+
+class AsyncProgressbarClient(abc_clients.AsyncProgressbarClientAware):
+    """Implementation of abc_clients.AsyncProgressbarClientAware.
+
+    !!! info
+        Hooks and contracts may be coroutine functions, independent ones
+        are awaited concurrently via `asyncio.gather`. If none of them is
+        asynchronous, progress is generated without any awaits.
+
+    ??? example "Expand example of usage"
+        ```py
+        import multibar
+
+        async def on_progress(*_, metadata):
+            await send_message(repr(metadata["progressbar"]))
+
+        client = multibar.AsyncProgressbarClient()
+        client.hooks.add_post_execution(on_progress)
+
+        progressbar = await client.get_progress(50, 100)
+        ```
+
+    !!! note
+        Documentation duplicated for mkdocs auto-reference
+        plugin.
+    """
+
+    __slots__ = ("_hooks", "_writer", "_contract_manager")
+
+    def __init__(
+        self,
+        *,
+        hooks: typing.Optional[abc_hooks.HooksAware] = None,
+        progress_writer: typing.Optional[abc_writers.ProgressbarWriterAware] = None,
+        contract_manager: typing.Optional[abc_contracts.ContractManagerAware] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        hooks : typing.Optional[HooksAware] = None
+            Progressbar client hooks.
+        progress_writer : typing.Optional[ProgressbarWriterAware[AbstractSector]] = None
+            Writer for progressbar generation.
+        contract_manager : typing.Optional[ContractManagerAware] = None
+            Contract manager for any progress checks.
+        """
+        self._hooks = utils.none_or(hooks_.Hooks(), hooks)
+        self._writer = utils.none_or(writers.ProgressbarWriter(), progress_writer)
+
+        if contract_manager is None:
+            contract_manager = contracts.ContractManager()
+            contract_manager.subscribe(contracts.WRITE_PROGRESS_CONTRACT)
+
+        self._contract_manager: abc_contracts.ContractManagerAware = contract_manager
+
+    def _validate_contracts(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Optional[typing.Awaitable[None]]:
+        """Triggers on-error hooks if broken contract raise error.
+
+        !!! warning
+            It will not handle broken contract, if contract.raise_errors equals to False.
+
+        Parameters
+        ----------
+        *args: typing.Any
+            Arguments to contract check.
+
+        **kwargs: typing.Any
+            Keyword arguments to contract check.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[None]]
+            Awaitable with asynchronous checks or hooks, or None if there is nothing to await.
+        """
+        try:
+            pending = self._contract_manager.gather_contracts(*args, **kwargs)
+        except Exception as exc:
+            return self._hooks.gather_on_error(*args, exc, **kwargs)
+
+        if pending is None:
+            return None
+
+        return self._await_contracts(pending, args, kwargs)
+
+    async def _await_contracts(
+        self,
+        pending: typing.Awaitable[None],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+        /,
+    ) -> None:
+        try:
+            await pending
+        except Exception as exc:
+            on_error = self._hooks.gather_on_error(*args, exc, **kwargs)
+            if on_error is not None:
+                await on_error
+
+    async def get_progress(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+        """Generates a progressbar, can be a wrapper for ProgressWriterAware.write()
+        to implement asynchronous hooks and various kinds of checks.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress) for progressbar math operations.
+        end_value : int, /
+            End value (needed progress) for progressbar math operations.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Raises
+        ------
+        errors.TerminatedContractError
+            See `ProgressbarClient.get_progress()` for details.
+
+        Returns
+        -------
+        progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar instance.
+        """
+        writer = self._writer
+        call_metadata = _call_metadata(writer, start_value, end_value, length)
+
+        pending = self._validate_contracts(writer, metadata=call_metadata)
+        if pending is not None:
+            await pending
+
+        pending = self._hooks.gather_pre_execution(self, metadata=call_metadata)
+        if pending is not None:
+            await pending
+
+        progressbar = writer.write(start_value, end_value, length=length)
+        call_metadata["progressbar"] = progressbar
+
+        pending = self._hooks.gather_post_execution(self, metadata=call_metadata)
+        if pending is not None:
+            await pending
+
+        return progressbar
+
+    async def get_progress_str(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> str:
+        """Generates string representation of progressbar, can be a wrapper
+        for ProgressWriterAware.write_str() to implement asynchronous hooks and various kinds of checks.
+
+        !!! info
+            Post-execution hooks may transform progressbar object, so if any of them
+            is set, progressbar will be generated via `get_progress()`. Otherwise, no
+            sector or progressbar objects will be allocated.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress) for progressbar math operations.
+        end_value : int, /
+            End value (needed progress) for progressbar math operations.
+        length : int = 20, *
+            Length of progressbar for progressbar math operations.
+
+        Raises
+        ------
+        errors.TerminatedContractError
+            See `ProgressbarClient.get_progress()` for details.
+
+        Returns
+        -------
+        str
+            String representation of progressbar.
+        """
+        if self._hooks.post_execution_hooks:
+            return repr(await self.get_progress(start_value, end_value, length=length))
+
+        writer = self._writer
+        call_metadata = _call_metadata(writer, start_value, end_value, length)
+
+        pending = self._validate_contracts(writer, metadata=call_metadata)
+        if pending is not None:
+            await pending
+
+        pending = self._hooks.gather_pre_execution(self, metadata=call_metadata)
+        if pending is not None:
+            await pending
+
+        return writer.write_str(start_value, end_value, length=length)
+
+    def set_hooks(self, hooks: abc_hooks.HooksAware, /) -> AsyncProgressbarClient:
+        """Sets hooks to the client.
+
+        Parameters
+        ----------
+        hooks : hooks_.HooksAware
+            Any hooks to set.
+
+        Returns
+        -------
+        Self
+            AsyncProgressbarClient object to allow fluent-style.
+        """
+        self._hooks = hooks
+        return self
+
+    def update_hooks(self, hooks: abc_hooks.HooksAware, /) -> AsyncProgressbarClient:
+        """Updates hooks for the client.
+
+        Parameters
+        ----------
+        hooks : hooks_.HooksAware
+            Any hooks to update.
+
+        Returns
+        -------
+        Self
+            AsyncProgressbarClient object to allow fluent-style.
+        """
+        self._hooks.update(hooks)
+        return self
+
+    @property
+    def hooks(self) -> abc_hooks.HooksAware:
+        """
+        Returns
+        -------
+        hooks_.HooksAware
+            Client hooks.
+        """
+        return self._hooks
+
+    @property
+    def contract_manager(self) -> abc_contracts.ContractManagerAware:
+        """
+        Returns
+        -------
+        contracts.ContractManagerAware
+            Client contract manager for checks.
+        """
+        return self._contract_manager
+
+    @property
+    def writer(self) -> abc_writers.ProgressbarWriterAware:
+        """
+        Returns
+        -------
+        writers.ProgressbarWriterAware[sectors.AbstractSector]
+            Progressbar writer for progress generating.
+        """
+        return self._writer
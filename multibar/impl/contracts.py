@@ -19,16 +19,24 @@ from __future__ import annotations
 __all__ = (
     "ContractManager",
     "WriteProgressContract",
+    "ProgressRangeContract",
     "WRITE_PROGRESS_CONTRACT",
     "INPUT_VALUES_CONTRACT",
+    "PROGRESS_RANGE_CONTRACT",
 )
 
+import collections.abc
 import typing
 
 from returns.io import IO, impure
 
-from multibar import errors, output
+from multibar import errors, utils
 from multibar.api import contracts
+from multibar.impl import metrics as metrics_
+
+if typing.TYPE_CHECKING:
+    from multibar import types as ptypes
+    from multibar.api import metrics as abc_metrics
 
 
 class ContractManager(contracts.ContractManagerAware):
@@ -39,21 +47,44 @@ class ContractManager(contracts.ContractManagerAware):
         plugin.
     """
 
-    __slots__ = ("_contracts", "_raise_errors")
+    __slots__ = ("_contracts", "_raise_errors", "_metrics")
 
-    def __init__(self, *, raise_errors: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        raise_errors: bool = True,
+        metrics: typing.Optional[abc_metrics.MetricsSinkAware] = None,
+    ) -> None:
         """
         Parameters
         ----------
         raise_errors : bool = True
             If True, will raise errors when contract is broken.
+        metrics : typing.Optional[MetricsSinkAware] = None
+            Sink that counts broken contract checks.
         """
-        self._contracts: list[contracts.ContractAware] = []
+        # List counts its changes, so contracts changed through property bump revision too.
+        self._contracts: utils.TrackedList[contracts.ContractAware] = utils.TrackedList()
         self._raise_errors = raise_errors
+        self._metrics = metrics
 
     def _agreed_with_manager(self, contract: contracts.ContractAware, /) -> bool:
         return contract in self._contracts
 
+    def _render_terminated_contract(
+        self,
+        contract: contracts.ContractAware,
+        contract_check: contracts.ContractCheck,
+        /,
+    ) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(
+                metrics_.CONTRACT_TERMINATIONS_TOTAL,
+                labels={"contract": type(contract).__name__},
+            )
+
+        contract.render_terminated_contract(contract_check, raise_errors=self._raise_errors)
+
     def set_raise_errors(self, value: bool, /) -> None:
         """Render broken contract may contain IO operations
         if raise_errors is False. Otherwise, it returns nothing,
@@ -87,6 +118,70 @@ class ContractManager(contracts.ContractManagerAware):
         for contract in self._contracts:
             self.check_contract(contract, *args, **kwargs)
 
+    def check_contracts_many(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Checks all contracts for a batch of progresses.
+
+        Parameters
+        ----------
+        *args: typing.Any
+            Arguments to contracts check.
+        **kwargs: typing.Any
+            Keyword arguments to contracts check.
+
+        Returns
+        -------
+        None
+        """
+        for contract in self._contracts:
+            # Contracts are taken from the manager itself, so
+            # there is no need to check the signing for each one.
+            contract_check = contract.check_many(*args, **kwargs)
+            if not contract_check.kept:
+                self._render_terminated_contract(contract, contract_check)
+
+    def gather_contracts(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Optional[typing.Awaitable[None]]:
+        """Checks all contracts, synchronous contracts are checked immediately,
+        awaitable checks returned by asynchronous ones are gathered.
+
+        Parameters
+        ----------
+        *args: typing.Any
+            Arguments to contracts check.
+        **kwargs: typing.Any
+            Keyword arguments to contracts check.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[None]]
+            Awaitable that runs asynchronous checks concurrently,
+            or None if there is nothing to await.
+        """
+        pending: list[tuple[contracts.ContractAware, typing.Awaitable[contracts.ContractCheck]]] = []
+        for contract in self._contracts:
+            contract_check: typing.Any = contract.check(*args, **kwargs)
+            if isinstance(contract_check, collections.abc.Awaitable):
+                pending.append((contract, contract_check))
+            elif not contract_check.kept:
+                self._render_terminated_contract(contract, contract_check)
+
+        if not pending:
+            return None
+
+        return self._check_pending_contracts(pending)
+
+    async def _check_pending_contracts(
+        self,
+        pending: collections.abc.Sequence[tuple[contracts.ContractAware, typing.Awaitable[contracts.ContractCheck]]],
+        /,
+    ) -> None:
+        # Imported on demand, because only asynchronous contracts need it.
+        import asyncio
+
+        contract_checks = await asyncio.gather(*(contract_check for _, contract_check in pending))
+        for (contract, _), contract_check in zip(pending, contract_checks):
+            if not contract_check.kept:
+                self._render_terminated_contract(contract, contract_check)
+
     def check_contract(
         self,
         contract: contracts.ContractAware,
@@ -119,10 +214,7 @@ class ContractManager(contracts.ContractManagerAware):
 
         contract_check = contract.check(*args, **kwargs)
         if not contract_check.kept:
-            contract.render_terminated_contract(
-                contract_check,
-                raise_errors=self._raise_errors,
-            )
+            self._render_terminated_contract(contract, contract_check)
 
     def subscribe(self, contract: contracts.ContractAware, /) -> None:
         """Subscribes for contract.
@@ -181,12 +273,31 @@ class ContractManager(contracts.ContractManagerAware):
         """
         return self._raise_errors
 
+    @property
+    def revision(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Counter of contract subscriptions, terminations and changes
+            of `contracts` list, compiled client pipelines are rebuilt when it changes.
+        """
+        return self._contracts.revision
+
 
 ####################
 # WRITER CONTRACTS #
 ####################
 
 
+def _is_write_progress_kept(start_value: int, end_value: int, length: int, /) -> bool:
+    return start_value <= end_value and length > 0
+
+
+def _is_progress_range_kept(start_value: int, end_value: int, length: int, /) -> bool:
+    return 0 <= start_value <= end_value and length > 0
+
+
 class WriteProgressContract(contracts.ContractAware):
     """Implementation of contracts.ContractAware.
 
@@ -234,6 +345,75 @@ class WriteProgressContract(contracts.ContractAware):
             metadata=call_metadata,
         )
 
+    def check_many(self, *args: typing.Any, **kwargs: typing.Any) -> contracts.ContractCheck:
+        """Checks contract for errors and warnings for a batch of progresses
+        in a single pass.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to check.
+        **kwargs : typing.Any
+            Keyword arguments to check.
+
+        Returns
+        -------
+        contracts.ContractCheck
+            Contract response.
+        """
+        call_metadata = meta = typing.cast(typing.MutableMapping[typing.Any, typing.Any], kwargs.pop("metadata", {}))
+        if not call_metadata:
+            return contracts.ContractCheck.terminated(
+                errors=["Needs metadata argument."],
+                metadata=call_metadata,
+            )
+
+        starts, ends, length = meta["start_values"], meta["end_values"], meta["length"]
+        if hasattr(starts, "__array__") and hasattr(ends, "__array__"):
+            # Elementwise comparison of arrays, no Python-level loop.
+            start_overflows = bool((starts > ends).any())
+        else:
+            start_overflows = any(start > end for start, end in zip(starts, ends))
+
+        if start_overflows:
+            return contracts.ContractCheck.terminated(
+                errors=["`Start` value cannot be more than `End` value."],
+                metadata=call_metadata,
+            )
+
+        if length <= 0:
+            return contracts.ContractCheck.terminated(
+                errors=["Length of progress bar must be more than 0."],
+                metadata=call_metadata,
+            )
+
+        return contracts.ContractCheck.done(
+            metadata=call_metadata,
+        )
+
+    def compile_check(self) -> typing.Optional[ptypes.ContractGuardType]:
+        """Returns predicate that checks contract for a single progress
+        without metadata, used by compiled client pipelines.
+
+        !!! info
+            Metadata presence check is eliminated, because compiled
+            pipelines always pass metadata to full check.
+
+        !!! warning
+            Subclasses that override `check()` get None, so their checks
+            are not skipped by compiled pipelines.
+
+        Returns
+        -------
+        typing.Optional[ptypes.ContractGuardType]
+            Predicate of `(start_value, end_value, length)`, that returns True
+            if contract is kept.
+        """
+        if type(self).check is not WriteProgressContract.check:
+            return None
+
+        return _is_write_progress_kept
+
     @typing.overload
     def render_terminated_contract(
         self,
@@ -298,17 +478,22 @@ class WriteProgressContract(contracts.ContractAware):
         if raise_errors:
             raise errors.TerminatedContractError(check)
 
-        self_module = self.__module__ + "." + "WriteProgressContract"
-        output.print_heading(f"{self_module} was broken", level=1, indent=False)
-        output.print(f"Warnings: {len(check.warnings)}", bold=True)
+        # Imported on demand, because console output is needed only for broken contracts.
+        from multibar import output
+
+        self_module = self.__module__ + "." + type(self).__name__
+        # Whole report is flushed at once by buffered printers.
+        with output.batch():
+            output.print_heading(f"{self_module} was broken", level=1, indent=False)
+            output.print(f"Warnings: {len(check.warnings)}", bold=True)
 
-        for warning in check.warnings:
-            output.print_warning(warning)
+            for warning in check.warnings:
+                output.print_warning(warning)
 
-        output.print(f"Errors: {len(check.errors)}", bold=True)
+            output.print(f"Errors: {len(check.errors)}", bold=True)
 
-        for error in check.errors:
-            output.print_error(error)
+            for error in check.errors:
+                output.print_error(error)
 
         return IO(None)
 
@@ -324,3 +509,102 @@ and if `length` is more that zero.
 
 INPUT_VALUES_CONTRACT = WRITE_PROGRESS_CONTRACT
 """Alias to WRITE_PROGRESS_CONTRACT."""
+
+
+class ProgressRangeContract(WriteProgressContract):
+    """Implementation of contracts.ContractAware, that validates progress range.
+
+    Besides `WriteProgressContract` checks, progress cannot be negative,
+    so ratios are kept within `[0, 1]` and percentages within `[0, 100]`
+    by clients `get_progress_ratio()` & `get_progress_percent()` methods.
+
+    ??? example "Expand example of usage"
+        ```py
+        import multibar
+
+        client = multibar.ProgressbarClient()
+        client.contract_manager.terminate(multibar.WRITE_PROGRESS_CONTRACT)
+        client.contract_manager.subscribe(multibar.PROGRESS_RANGE_CONTRACT)
+        ```
+    """
+
+    def check(self, *args: typing.Any, **kwargs: typing.Any) -> contracts.ContractCheck:
+        """Checks contract for errors and warnings.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to check.
+        **kwargs : typing.Any
+            Keyword arguments to check.
+
+        Returns
+        -------
+        contracts.ContractCheck
+            Contract response.
+        """
+        call_metadata = typing.cast(typing.MutableMapping[typing.Any, typing.Any], kwargs.get("metadata", {}))
+        if call_metadata and call_metadata["start_value"] < 0:
+            return contracts.ContractCheck.terminated(
+                errors=["`Start` value cannot be less than zero."],
+                metadata=call_metadata,
+            )
+
+        return super().check(*args, **kwargs)
+
+    def check_many(self, *args: typing.Any, **kwargs: typing.Any) -> contracts.ContractCheck:
+        """Checks contract for errors and warnings for a batch of progresses
+        in a single pass.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to check.
+        **kwargs : typing.Any
+            Keyword arguments to check.
+
+        Returns
+        -------
+        contracts.ContractCheck
+            Contract response.
+        """
+        call_metadata = typing.cast(typing.MutableMapping[typing.Any, typing.Any], kwargs.get("metadata", {}))
+        if call_metadata:
+            starts = call_metadata["start_values"]
+            if hasattr(starts, "__array__"):
+                start_underflows = bool((starts < 0).any())
+            else:
+                start_underflows = any(start < 0 for start in starts)
+
+            if start_underflows:
+                return contracts.ContractCheck.terminated(
+                    errors=["`Start` value cannot be less than zero."],
+                    metadata=call_metadata,
+                )
+
+        return super().check_many(*args, **kwargs)
+
+    def compile_check(self) -> typing.Optional[ptypes.ContractGuardType]:
+        """Returns predicate that checks contract for a single progress
+        without metadata, used by compiled client pipelines.
+
+        Returns
+        -------
+        typing.Optional[ptypes.ContractGuardType]
+            Predicate of `(start_value, end_value, length)`, that returns True
+            if contract is kept.
+        """
+        if type(self).check is not ProgressRangeContract.check:
+            return None
+
+        return _is_progress_range_kept
+
+
+PROGRESS_RANGE_CONTRACT = ProgressRangeContract()
+"""Contract that checks if `start_value` is within `[0, end_value]`
+and if `length` is more that zero.
+
+!!! warning
+    For subscribing or unsubscribing of `ProgressRangeContract` its recommended
+    to use this variable, because this methods depends on object `id`.
+"""
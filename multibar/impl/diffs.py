@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Implementation of progressbar diffs."""
+from __future__ import annotations
+
+__all__ = ("ProgressbarDiffer",)
+
+import typing
+
+from multibar.api import diffs
+
+from . import progressbars
+
+if typing.TYPE_CHECKING:
+    from multibar.api import progressbars as abc_progressbars
+    from multibar.api import sectors as abc_sectors
+
+
+class ProgressbarDiffer(diffs.ProgressbarDifferAware):
+    """Implementation of diffs.ProgressbarDifferAware.
+
+    Compact progressbars of the same signature and length are compared
+    by their filled counts and replaced names (e.g. `start` & `end` chars)
+    only, without walking through sectors. Other progressbars (including
+    reversed compact ones) are compared sector by sector.
+
+    !!! info
+        Diff cost does not depend on progressbar length only for `CompactProgressbar`,
+        because it tracks every replaced name. Any sector of `Progressbar` may be
+        renamed or replaced, so even progressbars written by `ProgressbarWriter` are
+        compared in `O(length)`. Use `#!py ProgressbarWriter(progressbar_cls=CompactProgressbar)`
+        to diff long progressbars.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import multibar
+        ...
+        >>> writer = multibar.ProgressbarWriter(progressbar_cls=multibar.CompactProgressbar)
+        >>> differ = multibar.ProgressbarDiffer()
+        >>> differ.diff(writer.write(25, 100, length=4), writer.write(75, 100, length=4))
+        (SectorChange(positions=range(1, 3), name='+', is_filled=True),)
+        ```
+
+    !!! note
+        Documentation duplicated for mkdocs auto-reference
+        plugin.
+    """
+
+    __slots__ = ()
+
+    def diff(
+        self,
+        old: abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector],
+        new: abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector],
+        /,
+    ) -> tuple[diffs.SectorChange, ...]:
+        """Compares two progressbar states.
+
+        !!! info
+            If lengths of progressbars differ, changes cover every
+            position of the `new` progressbar.
+
+        Parameters
+        ----------
+        old : abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector], /
+            Previous progressbar state.
+        new : abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector], /
+            Current progressbar state.
+
+        Returns
+        -------
+        tuple[diffs.SectorChange, ...]
+            Changes ordered by position, empty if nothing changed.
+        """
+        if (
+            isinstance(old, progressbars.CompactProgressbar)
+            and isinstance(new, progressbars.CompactProgressbar)
+            and old.length == new.length
+            and old.signature == new.signature
+            and not (old.is_reversed or new.is_reversed)
+        ):
+            return self._diff_compact(old, new)
+
+        return self._diff_sectors(old, new)
+
+    @staticmethod
+    def _diff_compact(
+        old: progressbars.CompactProgressbar[typing.Any],
+        new: progressbars.CompactProgressbar[typing.Any],
+        /,
+    ) -> tuple[diffs.SectorChange, ...]:
+        # Only flipped range and replaced names may differ, so work
+        # does not depend on progressbar length.
+        replaced = sorted(old.overrides.keys() | new.overrides.keys())
+        low, high = sorted((old.filled, new.filled))
+        changes: list[diffs.SectorChange] = []
+
+        if low != high:
+            # Flipped range is split by replaced names, which are compared separately.
+            is_filled = new.filled > old.filled
+            start = low
+            for position in replaced:
+                if position >= high:
+                    break
+                if start < position:
+                    changes.append(diffs.SectorChange(range(start, position), new[start].name, is_filled))
+                start = max(start, position + 1)
+            if start < high:
+                changes.append(diffs.SectorChange(range(start, high), new[start].name, is_filled))
+
+        for position in replaced:
+            old_sector, new_sector = old[position], new[position]
+            if (old_sector.name, old_sector.is_filled) != (new_sector.name, new_sector.is_filled):
+                changes.append(diffs.SectorChange(range(position, position + 1), new_sector.name, new_sector.is_filled))
+
+        changes.sort(key=lambda change: change.positions.start)
+        return tuple(changes)
+
+    @staticmethod
+    def _diff_sectors(
+        old: abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector],
+        new: abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector],
+        /,
+    ) -> tuple[diffs.SectorChange, ...]:
+        changes: list[diffs.SectorChange] = []
+        same_length = len(old) == len(new)
+        run_start = 0
+        run_state: typing.Optional[tuple[str, bool]] = None
+
+        for position, new_sector in enumerate(new.sectors):
+            state: typing.Optional[tuple[str, bool]] = (new_sector.name, new_sector.is_filled)
+            if same_length:
+                old_sector = old[position]
+                if (old_sector.name, old_sector.is_filled) == state:
+                    state = None
+
+            if state != run_state:
+                if run_state is not None:
+                    changes.append(diffs.SectorChange(range(run_start, position), *run_state))
+                run_start, run_state = position, state
+
+        if run_state is not None:
+            changes.append(diffs.SectorChange(range(run_start, len(new)), *run_state))
+
+        return tuple(changes)
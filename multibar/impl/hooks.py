@@ -19,17 +19,160 @@ from __future__ import annotations
 __all__ = (
     "Hooks",
     "WRITER_HOOKS",
+    "per_item_hook",
 )
 
+import collections.abc
+import time
 import typing
 
 from multibar import types as ptypes
+from multibar import utils
 from multibar.api import hooks
 
 if typing.TYPE_CHECKING:
     from multibar.api import clients
 
 
+_PER_ITEM_ATTRIBUTE: typing.Final[str] = "__multibar_per_item__"
+
+
+def per_item_hook(callback: ptypes.HookSignatureType, /) -> ptypes.HookSignatureType:
+    """Marks hook as per-item, so batch triggers will invoke it once
+    per every progressbar with `ProgressMetadataType` metadata instead of
+    a single call with `ProgressBatchMetadataType` metadata.
+
+    Parameters
+    ----------
+    callback : ptypes.HookSignatureType, /
+        Hook callback to mark.
+
+    Returns
+    -------
+    ptypes.HookSignatureType
+        The same callback.
+
+    ??? example "Expand example of usage"
+        ```py
+        import multibar
+
+        @multibar.per_item_hook
+        def log_progress(*_, metadata):
+            print(metadata["start_value"], metadata["end_value"])
+
+        hooks = multibar.Hooks().add_pre_execution(log_progress)
+        ```
+    """
+    setattr(callback, _PER_ITEM_ATTRIBUTE, True)
+    return callback
+
+
+def _split_batch_metadata(
+    metadata: ptypes.ProgressBatchMetadataType,
+    /,
+) -> collections.abc.Iterator[ptypes.ProgressMetadataType]:
+    progressbars = metadata["progressbars"]
+    for i, (start_value, end_value) in enumerate(zip(metadata["start_values"], metadata["end_values"])):
+        yield {
+            "calculation_service_cls": metadata["calculation_service_cls"],
+            "progressbar": None if progressbars is None else progressbars[i],
+            "start_value": start_value,
+            "end_value": end_value,
+            "length": metadata["length"],
+            "sig": metadata["sig"],
+        }
+
+
+def _trigger_many(
+    callbacks: collections.abc.Sequence[ptypes.HookSignatureType],
+    stage: str,
+    records: typing.Optional[dict[tuple[str, int], list[typing.Any]]],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+    /,
+) -> None:
+    items: typing.Optional[list[ptypes.ProgressMetadataType]] = None
+    for hook in callbacks:
+        if not getattr(hook, _PER_ITEM_ATTRIBUTE, False):
+            if records is None:
+                hook(*args, **kwargs)
+            else:
+                _call_profiled(hook, stage, records, args, kwargs)
+            continue
+
+        if items is None:
+            items = list(_split_batch_metadata(kwargs["metadata"]))
+
+        for item_metadata in items:
+            if records is None:
+                hook(*args, **{**kwargs, "metadata": item_metadata})
+            else:
+                _call_profiled(hook, stage, records, args, {**kwargs, "metadata": item_metadata})
+
+
+def _gather(
+    callbacks: collections.abc.Sequence[ptypes.HookSignatureType],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+    /,
+) -> typing.Optional[typing.Awaitable[typing.Any]]:
+    awaitables: list[typing.Awaitable[typing.Any]] = []
+    try:
+        for hook in callbacks:
+            result = hook(*args, **kwargs)
+            if isinstance(result, collections.abc.Awaitable):
+                awaitables.append(result)
+    except BaseException:
+        # Coroutines of earlier hooks are never awaited, so they are closed without warnings.
+        for awaitable in awaitables:
+            if isinstance(awaitable, collections.abc.Coroutine):
+                awaitable.close()
+        raise
+
+    if not awaitables:
+        return None
+
+    # Imported on demand, because only asynchronous callbacks need it.
+    import asyncio
+
+    return asyncio.gather(*awaitables)
+
+
+def _call_profiled(
+    hook: ptypes.HookSignatureType,
+    stage: str,
+    records: dict[tuple[str, int], list[typing.Any]],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+    /,
+) -> None:
+    started = time.perf_counter_ns()
+    try:
+        hook(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter_ns() - started
+        # Keyed by identity, because callbacks are not required to be hashable.
+        record = records.get((stage, id(hook)))
+        if record is None:
+            records[stage, id(hook)] = [hook, 1, elapsed, elapsed]
+        else:
+            record[1] += 1
+            record[2] += elapsed
+            record[3] = max(record[3], elapsed)
+
+
+def _trigger_profiled(
+    callbacks: collections.abc.Sequence[ptypes.HookSignatureType],
+    stage: str,
+    records: dict[tuple[str, int], list[typing.Any]],
+    args: tuple[typing.Any, ...],
+    kwargs: dict[str, typing.Any],
+    /,
+) -> None:
+    for hook in callbacks:
+        _call_profiled(hook, stage, records, args, kwargs)
+
+
 class Hooks(hooks.HooksAware):
     """Implementation of hooks.HooksAware.
 
@@ -38,12 +181,23 @@ class Hooks(hooks.HooksAware):
         plugin.
     """
 
-    __slots__ = ("_on_error_hooks", "_pre_execution_hooks", "_post_execution_hooks")
+    __slots__ = ("_on_error_hooks", "_pre_execution_hooks", "_post_execution_hooks", "_stats_records", "_revision")
 
-    def __init__(self) -> None:
-        self._on_error_hooks: list[ptypes.HookSignatureType] = []
-        self._pre_execution_hooks: list[ptypes.HookSignatureType] = []
-        self._post_execution_hooks: list[ptypes.HookSignatureType] = []
+    def __init__(self, *, collect_stats: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        collect_stats : bool = False, *
+            Whether to record latency of every callback call, see `Hooks.stats()`.
+        """
+        # Lists count their changes, so hooks changed through properties bump revision too.
+        self._on_error_hooks: utils.TrackedList[ptypes.HookSignatureType] = utils.TrackedList()
+        self._pre_execution_hooks: utils.TrackedList[ptypes.HookSignatureType] = utils.TrackedList()
+        self._post_execution_hooks: utils.TrackedList[ptypes.HookSignatureType] = utils.TrackedList()
+        # Records are [callback, calls, total_ns, max_ns] by (stage, id(callback)),
+        # None while stats are disabled.
+        self._stats_records: typing.Optional[dict[tuple[str, int], list[typing.Any]]] = {} if collect_stats else None
+        self._revision = 0
 
     def __len__(self) -> int:
         """
@@ -54,12 +208,16 @@ class Hooks(hooks.HooksAware):
         """
         return len(self._on_error_hooks + self._pre_execution_hooks + self._post_execution_hooks)
 
-    def add_to_client(self, client: clients.ProgressbarClientAware, /) -> Hooks:
+    def add_to_client(
+        self,
+        client: typing.Union[clients.ProgressbarClientAware, clients.AsyncProgressbarClientAware],
+        /,
+    ) -> Hooks:
         """Adds hooks to the client.
 
         Parameters
         ----------
-        client : clients.ProgressbarClientAware, /
+        client : typing.Union[clients.ProgressbarClientAware, clients.AsyncProgressbarClientAware], /
             Client to add.
 
         Returns
@@ -154,6 +312,10 @@ class Hooks(hooks.HooksAware):
         -------
         None
         """
+        if self._stats_records is not None:
+            _trigger_profiled(self._post_execution_hooks, "post_execution", self._stats_records, args, kwargs)
+            return
+
         for hook in self._post_execution_hooks:
             hook(*args, **kwargs)
 
@@ -171,9 +333,53 @@ class Hooks(hooks.HooksAware):
         -------
         None
         """
+        if self._stats_records is not None:
+            _trigger_profiled(self._pre_execution_hooks, "pre_execution", self._stats_records, args, kwargs)
+            return
+
         for hook in self._pre_execution_hooks:
             hook(*args, **kwargs)
 
+    def trigger_post_execution_many(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Triggers all post-execution callbacks for a batch of progressbars.
+
+        !!! info
+            Callbacks are invoked once with batch metadata, except the
+            per-item ones, that are invoked once per every progressbar.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        None
+        """
+        _trigger_many(self._post_execution_hooks, "post_execution", self._stats_records, args, kwargs)
+
+    def trigger_pre_execution_many(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        """Triggers all pre-execution callbacks for a batch of progressbars.
+
+        !!! info
+            Callbacks are invoked once with batch metadata, except the
+            per-item ones, that are invoked once per every progressbar.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        None
+        """
+        _trigger_many(self._pre_execution_hooks, "pre_execution", self._stats_records, args, kwargs)
+
     def trigger_on_error(self, *args: typing.Any, **kwargs: typing.Any) -> None:
         """Triggers all on-error callbacks.
 
@@ -191,10 +397,169 @@ class Hooks(hooks.HooksAware):
         if not self._on_error_hooks:
             raise
 
+        elif self._stats_records is not None:
+            _trigger_profiled(self._on_error_hooks, "on_error", self._stats_records, args, kwargs)
+
         else:
             for hook in self._on_error_hooks:
                 hook(*args, **kwargs)
 
+    def gather_post_execution(
+        self, *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Optional[typing.Awaitable[typing.Any]]:
+        """Triggers all post-execution callbacks, synchronous callbacks are called
+        immediately, awaitables returned by asynchronous ones are gathered.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[typing.Any]]
+            Awaitable that runs asynchronous callbacks concurrently,
+            or None if there is nothing to await.
+        """
+        return _gather(self._post_execution_hooks, args, kwargs)
+
+    def gather_pre_execution(
+        self, *args: typing.Any, **kwargs: typing.Any
+    ) -> typing.Optional[typing.Awaitable[typing.Any]]:
+        """Triggers all pre-execution callbacks, synchronous callbacks are called
+        immediately, awaitables returned by asynchronous ones are gathered.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[typing.Any]]
+            Awaitable that runs asynchronous callbacks concurrently,
+            or None if there is nothing to await.
+        """
+        return _gather(self._pre_execution_hooks, args, kwargs)
+
+    def gather_on_error(self, *args: typing.Any, **kwargs: typing.Any) -> typing.Optional[typing.Awaitable[typing.Any]]:
+        """Triggers all on-error callbacks, synchronous callbacks are called
+        immediately, awaitables returned by asynchronous ones are gathered.
+
+        Parameters
+        ----------
+        *args : typing.Any
+            Arguments to trigger.
+        **kwargs : typing.Any
+            Keyword arguments to trigger.
+
+        Returns
+        -------
+        typing.Optional[typing.Awaitable[typing.Any]]
+            Awaitable that runs asynchronous callbacks concurrently,
+            or None if there is nothing to await.
+        """
+        if not self._on_error_hooks:
+            raise
+
+        return _gather(self._on_error_hooks, args, kwargs)
+
+    def enable_stats(self) -> Hooks:
+        """Starts recording call count, cumulative and maximal latency of every
+        callback called by `trigger_pre_execution()`, `trigger_post_execution()`,
+        their batch versions and `trigger_on_error()`.
+
+        !!! info
+            Per-item callbacks of batch triggers are recorded once per every progressbar.
+
+        !!! info
+            While stats are disabled, triggers are not instrumented at all.
+
+        Returns
+        -------
+        Self
+            The hook object to allow fluent-style.
+        """
+        if self._stats_records is None:
+            self._stats_records = {}
+            self._revision += 1
+
+        return self
+
+    def disable_stats(self) -> Hooks:
+        """Stops recording latency of callbacks and drops recorded stats.
+
+        Returns
+        -------
+        Self
+            The hook object to allow fluent-style.
+        """
+        if self._stats_records is not None:
+            self._stats_records = None
+            self._revision += 1
+
+        return self
+
+    def stats(self) -> tuple[hooks.HookStats, ...]:
+        """Returns snapshot of hook latency statistics.
+
+        ??? example "Expand example of usage"
+            ```py
+            import multibar
+
+            hooks = multibar.Hooks(collect_stats=True)
+            client = multibar.ProgressbarClient(hooks=hooks.update(multibar.WRITER_HOOKS))
+            client.get_progress(50, 100)
+
+            slowest = hooks.stats()[0]
+            print(slowest.callback, slowest.calls, slowest.max_ns)
+            ```
+
+        Returns
+        -------
+        tuple[hooks.HookStats, ...]
+            Statistics of every called hook, slowest by cumulative latency first,
+            empty if stats are disabled.
+        """
+        if not self._stats_records:
+            return ()
+
+        snapshot = (
+            hooks.HookStats(callback=callback, stage=stage, calls=calls, total_ns=total_ns, max_ns=max_ns)
+            for (stage, _), (callback, calls, total_ns, max_ns) in self._stats_records.items()
+        )
+        return tuple(sorted(snapshot, key=lambda hook_stats: hook_stats.total_ns, reverse=True))
+
+    @property
+    def collect_stats(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            Whether latency of callbacks is recorded.
+        """
+        return self._stats_records is not None
+
+    @property
+    def revision(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Counter of hooks changes made by `add_*()`, `update()`, stats switching
+            and changes of hook lists, compiled client pipelines are rebuilt when it changes.
+        """
+        return (
+            self._revision
+            + self._on_error_hooks.revision
+            + self._pre_execution_hooks.revision
+            + self._post_execution_hooks.revision
+        )
+
     @property
     def pre_execution_hooks(self) -> list[ptypes.HookSignatureType]:
         """
@@ -226,10 +591,15 @@ class Hooks(hooks.HooksAware):
         return self._on_error_hooks
 
 
-def _progress_writer_hook(*_: typing.Any, **kwargs: typing.Any) -> None:
-    FIRST_FILL: typing.Literal[3] = 3
-    LAST_FILL: typing.Literal[97] = 97
+FIRST_FILL: typing.Final[int] = 3
+"""Progress percentage from which WRITER_HOOKS fills progressbar `start` char."""
+
+LAST_FILL: typing.Final[int] = 97
+"""Progress percentage from which WRITER_HOOKS fills progressbar `end` char."""
 
+
+@per_item_hook
+def _progress_writer_hook(*_: typing.Any, **kwargs: typing.Any) -> None:
     metadata = typing.cast(ptypes.ProgressMetadataType, kwargs["metadata"])
     process_percentage = metadata["calculation_service_cls"].get_progress_percentage(
         metadata["start_value"], metadata["end_value"]
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Implementations of metrics sinks and exporters."""
+from __future__ import annotations
+
+__all__ = (
+    "InMemoryMetricsSink",
+    "to_prometheus_text",
+    "DEFAULT_LATENCY_BUCKETS",
+    "CLIENT_STAGE_SECONDS",
+    "CONTRACT_TERMINATIONS_TOTAL",
+    "ON_ERROR_INVOCATIONS_TOTAL",
+)
+
+import bisect
+import itertools
+import threading
+import typing
+
+from multibar.api import metrics
+
+if typing.TYPE_CHECKING:
+    import collections.abc
+
+LabelsKey = tuple[tuple[str, str], ...]
+"""Labels of metric sorted by their names."""
+
+MetricKey = tuple[str, LabelsKey]
+"""Metric name with its labels."""
+
+DEFAULT_LATENCY_BUCKETS: typing.Final[tuple[float, ...]] = (
+    0.000_001,
+    0.000_005,
+    0.000_01,
+    0.000_05,
+    0.000_1,
+    0.000_5,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
+"""Default histogram buckets in seconds, from a microsecond to a second."""
+
+CLIENT_STAGE_SECONDS: typing.Final[str] = "client_stage_seconds"
+"""Histogram of `ProgressbarClient` pipeline stage latencies of every `get_progress*()` method, labeled by `stage`."""
+
+CONTRACT_TERMINATIONS_TOTAL: typing.Final[str] = "contract_terminations_total"
+"""Counter of broken contract checks, labeled by `contract` class name."""
+
+ON_ERROR_INVOCATIONS_TOTAL: typing.Final[str] = "on_error_invocations_total"
+"""Counter of on-error hooks triggers by client."""
+
+
+def _labels_key(labels: typing.Optional[collections.abc.Mapping[str, str]], /) -> LabelsKey:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+class InMemoryMetricsSink(metrics.MetricsSinkAware):
+    """Thread-safe sink that keeps counters and histograms in memory.
+
+    ??? example "Expand example of usage"
+        ```py
+        import multibar
+
+        sink = multibar.InMemoryMetricsSink()
+        client = multibar.ProgressbarClient(metrics=sink)
+        client.get_progress(50, 100)
+
+        print(multibar.to_prometheus_text(sink))
+        ```
+    """
+
+    __slots__ = ("_buckets", "_counters", "_histograms", "_sums", "_lock")
+
+    def __init__(self, *, buckets: collections.abc.Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Parameters
+        ----------
+        buckets : collections.abc.Sequence[float] = DEFAULT_LATENCY_BUCKETS, *
+            Upper bounds of histogram buckets.
+
+        Raises
+        ------
+        ValueError
+            If `buckets` are empty or not in ascending order.
+        """
+        if not buckets or any(lower >= upper for lower, upper in zip(buckets, buckets[1:])):
+            raise ValueError("Histogram `buckets` must be non-empty and in ascending order.")
+
+        self._buckets = tuple(buckets)
+        self._counters: dict[MetricKey, int] = {}
+        # Histograms are counts per bucket, followed by count above all buckets.
+        self._histograms: dict[MetricKey, list[int]] = {}
+        self._sums: dict[MetricKey, float] = {}
+        self._lock = threading.Lock()
+
+    def increment(
+        self,
+        name: str,
+        /,
+        amount: int = 1,
+        *,
+        labels: typing.Optional[collections.abc.Mapping[str, str]] = None,
+    ) -> None:
+        """Increments counter.
+
+        Parameters
+        ----------
+        name : str, /
+            Counter name.
+        amount : int = 1
+            Amount to add.
+        labels : typing.Optional[collections.abc.Mapping[str, str]] = None, *
+            Labels of counter.
+
+        Returns
+        -------
+        None
+        """
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        /,
+        *,
+        labels: typing.Optional[collections.abc.Mapping[str, str]] = None,
+    ) -> None:
+        """Records observation to histogram.
+
+        Parameters
+        ----------
+        name : str, /
+            Histogram name.
+        value : float, /
+            Observed value, latencies are observed in seconds.
+        labels : typing.Optional[collections.abc.Mapping[str, str]] = None, *
+            Labels of histogram.
+
+        Returns
+        -------
+        None
+        """
+        key = (name, _labels_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self._buckets) + 1)
+
+            histogram[bisect.bisect_left(self._buckets, value)] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def counters(self) -> dict[MetricKey, int]:
+        """Returns snapshot of counters.
+
+        Returns
+        -------
+        dict[MetricKey, int]
+            Counter values by counter names and labels.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def histograms(self) -> dict[MetricKey, metrics.HistogramSnapshot]:
+        """Returns snapshot of histograms.
+
+        Returns
+        -------
+        dict[MetricKey, metrics.HistogramSnapshot]
+            Histogram snapshots by histogram names and labels.
+        """
+        with self._lock:
+            return {
+                key: metrics.HistogramSnapshot(
+                    buckets=self._buckets,
+                    cumulative_counts=tuple(itertools.accumulate(histogram)),
+                    sum=self._sums[key],
+                )
+                for key, histogram in self._histograms.items()
+            }
+
+    def clear(self) -> None:
+        """Drops all recorded metrics.
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._sums.clear()
+
+
+def _escape_label_value(value: str, /) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(labels: LabelsKey, /) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + "}"
+
+
+def to_prometheus_text(sink: InMemoryMetricsSink, /, *, namespace: str = "multibar") -> str:
+    """Exports metrics of in-memory sink in Prometheus text format.
+
+    Parameters
+    ----------
+    sink : InMemoryMetricsSink, /
+        Sink to export.
+    namespace : str = "multibar", *
+        Prefix of every metric name, omitted if empty.
+
+    Returns
+    -------
+    str
+        Metrics in Prometheus text exposition format.
+    """
+    prefix = f"{namespace}_" if namespace else ""
+    lines: list[str] = []
+
+    counters: dict[str, list[tuple[LabelsKey, int]]] = {}
+    for (name, labels), value in sorted(sink.counters().items()):
+        counters.setdefault(name, []).append((labels, value))
+
+    for name, samples in counters.items():
+        lines.append(f"# TYPE {prefix}{name} counter")
+        lines.extend(f"{prefix}{name}{_format_labels(labels)} {value}" for labels, value in samples)
+
+    histograms: dict[str, list[tuple[LabelsKey, metrics.HistogramSnapshot]]] = {}
+    for (name, labels), snapshot in sorted(sink.histograms().items(), key=lambda item: item[0]):
+        histograms.setdefault(name, []).append((labels, snapshot))
+
+    for name, histogram_samples in histograms.items():
+        lines.append(f"# TYPE {prefix}{name} histogram")
+        for labels, snapshot in histogram_samples:
+            bounds = [repr(bucket) for bucket in snapshot.buckets] + ["+Inf"]
+            for bound, cumulative_count in zip(bounds, snapshot.cumulative_counts):
+                bucket_labels = _format_labels((*labels, ("le", bound)))
+                lines.append(f"{prefix}{name}_bucket{bucket_labels} {cumulative_count}")
+
+            lines.append(f"{prefix}{name}_sum{_format_labels(labels)} {snapshot.sum!r}")
+            lines.append(f"{prefix}{name}_count{_format_labels(labels)} {snapshot.count}")
+
+    return "\n".join(lines) + "\n" if lines else ""
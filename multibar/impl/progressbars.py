@@ -16,18 +16,36 @@
 """Implementation of progressbar interfaces."""
 from __future__ import annotations
 
-__all__ = ("Progressbar",)
+__all__ = ("Progressbar", "CompactProgressbar")
 
+import collections
 import typing
 
 from returns.primitives.hkt import Kind1, SupportsKind1
 
+from multibar import utils
 from multibar.api import progressbars as abc_progressbars
 from multibar.api import sectors as abc_sectors
+from multibar.api import signatures
+
+from . import sectors as sectors_
+from . import signatures as signatures_
 
 SectorT = typing.TypeVar("SectorT", bound=abc_sectors.AbstractSector)
 _NewValueType = typing.TypeVar("_NewValueType", bound=abc_sectors.AbstractSector)
 _InstanceKind = typing.TypeVar("_InstanceKind", bound="Progressbar[typing.Any]")
+_CompactInstanceKind = typing.TypeVar("_CompactInstanceKind", bound="CompactProgressbar[typing.Any]")
+
+
+def _sum_glyph_metrics(name_counts: typing.Iterable[tuple[str, int]], /) -> signatures.GlyphMetrics:
+    # Every distinct name is measured once, then multiplied by its count.
+    display_width = encoded_size = char_count = 0
+    for name, count in name_counts:
+        metrics = signatures_.glyph_metrics(name)
+        display_width += metrics.display_width * count
+        encoded_size += metrics.encoded_size * count
+        char_count += metrics.char_count * count
+    return signatures.GlyphMetrics(display_width, encoded_size, char_count)
 
 
 class Progressbar(SupportsKind1["Progressbar[typing.Any]", SectorT], abc_progressbars.ProgressbarAware[SectorT]):
@@ -226,7 +244,27 @@ class Progressbar(SupportsKind1["Progressbar[typing.Any]", SectorT], abc_progres
         Self
             The progressbar object to allow fluent-style.
         """
-        self._storage[sector_pos].change_name(new_display_name)
+        # Immutable sectors return new object instead of changing themselves.
+        sector = self._storage[sector_pos].change_name(new_display_name)
+        self._storage[sector_pos] = typing.cast(SectorT, sector)
+        return self
+
+    def replace_sector(self, sector_pos: int, sector: abc_sectors.AbstractSector, /) -> Progressbar[SectorT]:
+        """Replaces sector object.
+
+        Parameters
+        ----------
+        sector_pos : int, /
+            To find sector by index to replace.
+        sector : SectorT, /
+            New sector object.
+
+        Returns
+        -------
+        Self
+            The progressbar object to allow fluent-style.
+        """
+        self._storage[sector_pos] = typing.cast(SectorT, sector)
         return self
 
     @property
@@ -239,6 +277,23 @@ class Progressbar(SupportsKind1["Progressbar[typing.Any]", SectorT], abc_progres
         """
         return len(self._storage)
 
+    @property
+    def glyph_metrics(self) -> signatures.GlyphMetrics:
+        """
+        !!! info
+            Sizes are summed by distinct sector names, so every name is measured
+            once per call without building string representation. Sectors may be
+            changed in place, so sizes are not cached, `CompactProgressbar`
+            derives them in constant time instead.
+
+        Returns
+        -------
+        signatures.GlyphMetrics
+            Sizes of progressbar string representation.
+        """
+        name_counts = collections.Counter(sector.name for sector in self._storage)
+        return _sum_glyph_metrics(name_counts.items())
+
     @property
     def sectors(self) -> typing.MutableSequence[SectorT]:
         """
@@ -248,3 +303,403 @@ class Progressbar(SupportsKind1["Progressbar[typing.Any]", SectorT], abc_progres
             Sequence of sectors.
         """
         return self._storage
+
+
+class CompactProgressbar(
+    SupportsKind1["CompactProgressbar[typing.Any]", SectorT],
+    abc_progressbars.ProgressbarAware[SectorT],
+):
+    """Implementation of abc_progressbars.ProgressbarAware[SectorT], that stores
+    only filled count, length, signature and replaced sector names.
+
+    Memory per progressbar does not depend on its length, because sectors are
+    materialized lazily on access.
+
+    !!! warning
+        Sectors are materialized on every access, so changes made directly to them
+        (e.g. `#!py progressbar[0].change_name(...)`) are not reflected in progressbar.
+        Use `replace_display_name_for()` instead.
+
+    !!! info
+        Filled count is clamped to `[0, length]`, so string representation
+        always has `length` sectors.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import multibar
+        ...
+        >>> writer = multibar.ProgressbarWriter(progressbar_cls=multibar.CompactProgressbar)
+        >>> progressbar = writer.write(50, 100, length=100_000)  # No sectors are allocated.
+        >>> progressbar.replace_display_name_for(0, "<")
+        >>> progressbar[0].name
+        '<'
+        ```
+    """
+
+    __slots__ = ("_signature", "_length", "_filled", "_overrides", "_sector_cls", "_reversed")
+
+    def __init__(
+        self,
+        signature: typing.Optional[signatures.ProgressbarSignatureProtocol] = None,
+        /,
+        *,
+        length: int = 0,
+        filled: int = 0,
+        sector_cls: typing.Optional[typing.Type[abc_sectors.AbstractSector]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        signature : typing.Optional[signatures.ProgressbarSignatureProtocol] = None, /
+            Signature to derive sector names from. If None, all sector names
+            are stored as replaced names.
+        length : int = 0, *
+            Length of the progressbar.
+        filled : int = 0, *
+            Count of filled sectors, clamped to `[0, length]`.
+        sector_cls : typing.Optional[typing.Type[abc_sectors.AbstractSector]] = None, *
+            Sector cls to materialize sectors with.
+        """
+        self._signature = signature
+        self._length = length
+        # Chained comparison is cheaper than clamping, and writers pass in-range counts.
+        self._filled = filled if 0 <= filled <= length else min(max(filled, 0), length)
+        self._overrides: dict[int, str] = {}
+        self._sector_cls = sector_cls
+        self._reversed = False
+
+    def __len__(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Sectors count.
+        """
+        return self._length
+
+    def __getitem__(self, item: typing.Any) -> typing.Any:
+        """Returns sector object if item is instance of int,
+        or sequence of sectors if item is instance of slice.
+
+        Returns
+        -------
+        typing.Any
+            Any value depending on context and implementation.
+            If item is instance of (int, slice), will return sequence
+            of sectors or sector object.
+        """
+        if isinstance(item, slice):
+            return [self._materialize(i) for i in range(*item.indices(self._length))]
+        if not isinstance(item, int):
+            return NotImplemented
+        return self._materialize(self._normalize_position(item))
+
+    def __iter__(self) -> typing.Iterator[SectorT]:
+        """Returns iterator over lazily materialized sectors."""
+        return map(self._materialize, range(self._length))
+
+    def __reversed__(self) -> typing.Iterator[SectorT]:
+        """Reverses progressbar in-place the same way as `Progressbar` does,
+        and returns iterator over lazily materialized sectors.
+
+        !!! info
+            Only the order flag is flipped, so it takes constant time.
+        """
+        self._reversed = not self._reversed
+        return iter(self)
+
+    def __repr__(self) -> str:
+        """Returns string representation of progressbar."""
+        on_filled, on_unfilled = self._glyphs()
+        filled, length = self._filled, self._length
+
+        if not self._overrides:
+            if self._reversed:
+                return on_unfilled * (length - filled) + on_filled * filled
+            return on_filled * filled + on_unfilled * (length - filled)
+
+        names = [on_filled] * filled + [on_unfilled] * (length - filled)
+        for position, name in self._overrides.items():
+            names[position] = name
+        if self._reversed:
+            names.reverse()
+        return "".join(names)
+
+    @property
+    def glyph_metrics(self) -> signatures.GlyphMetrics:
+        """
+        !!! info
+            Sizes are derived from filled count and cached sizes of signature
+            chars, so it takes constant time for any progressbar length.
+
+        Returns
+        -------
+        signatures.GlyphMetrics
+            Sizes of progressbar string representation.
+        """
+        on_filled, on_unfilled = self._glyphs()
+        filled = self._filled
+        name_counts: collections.Counter[str] = collections.Counter()
+        name_counts[on_filled] += filled
+        name_counts[on_unfilled] += max(self._length - filled, 0)
+
+        for position, name in self._overrides.items():
+            name_counts[on_filled if position < filled else on_unfilled] -= 1
+            name_counts[name] += 1
+
+        return _sum_glyph_metrics(name_counts.items())
+
+    def _glyphs(self) -> tuple[str, str]:
+        if self._signature is None:
+            return "", ""
+        middle = self._signature.middle
+        return middle.on_filled, middle.on_unfilled
+
+    def _normalize_position(self, position: int, /) -> int:
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError("progressbar index out of range")
+        return position
+
+    def _source_position(self, position: int, /) -> int:
+        # Filled count and replaced names are stored in the order before reversal.
+        return self._length - 1 - position if self._reversed else position
+
+    def _name_at(self, position: int, /) -> str:
+        try:
+            return self._overrides[position]
+        except KeyError:
+            on_filled, on_unfilled = self._glyphs()
+            return on_filled if position < self._filled else on_unfilled
+
+    def _materialize(self, position: int, /) -> SectorT:
+        sector_cls = utils.none_or(sectors_.Sector, self._sector_cls)
+        # Reversed sectors keep their positions, as in `Progressbar`.
+        position = self._source_position(position)
+        return typing.cast(SectorT, sector_cls(self._name_at(position), position < self._filled, position))
+
+    def map(  # type: ignore[override]
+        self: Kind1[_CompactInstanceKind, SectorT],
+        callback: typing.Callable[[SectorT], _NewValueType],
+        /,
+    ) -> Progressbar[_NewValueType]:
+        """Applies callback for every sector in progressbar.
+
+        !!! info
+            Returns new `Progressbar` object, because sectors returned
+            by callback cannot be stored compactly.
+
+        Returns
+        -------
+        Progressbar[_NewValueType]
+            New instace of progressbar with your sector objects.
+        """
+        compact = typing.cast(CompactProgressbar[SectorT], self)
+        return Progressbar.set_new_sectors(callback(s) for s in compact)
+
+    @classmethod
+    def set_new_sectors(
+        cls,
+        new_value: typing.Iterable[_NewValueType],
+        /,
+    ) -> CompactProgressbar[_NewValueType]:
+        """Sets new sectors in progressbar.
+
+        !!! warning
+            Filled sectors must precede unfilled ones,
+            see `add_sector()` for details.
+
+        Parameters
+        ----------
+        new_value : collections.abc.Iterable[_NewValueType], /
+            Iterable over new sector objects.
+
+        Returns
+        -------
+        CompactProgressbar[_NewValueType]
+            New instace of progressbar with your sector objects.
+        """
+        bar = typing.cast(CompactProgressbar[_NewValueType], cls())
+        for new_sector in new_value:
+            bar.add_sector(new_sector)
+        return bar
+
+    def for_each(self, consumer: typing.Callable[[SectorT], typing.Any], /) -> None:
+        """Pass each lazily materialized sector to a given consumer.
+
+        Parameters
+        ----------
+        consumer : typing.Callable[[SectorT], typing.Any], /
+            Function to apply for progressbar sectors.
+
+        Returns
+        -------
+        None
+        """
+        for position in range(self._length):
+            consumer(self._materialize(position))
+
+    def add_sector(self: _CompactInstanceKind, sector: abc_sectors.AbstractSector, /) -> _CompactInstanceKind:
+        """Adds sector to progressbar.
+
+        Parameters
+        ----------
+        sector : SectorT, /
+            Sector to add.
+
+        Raises
+        ------
+        ValueError
+            If filled sector is added after unfilled one, or progressbar is reversed.
+
+        Returns
+        -------
+        Self
+            The progressbar object to allow fluent-style.
+        """
+        if self._reversed:
+            raise ValueError("Sectors cannot be added to reversed compact progressbar.")
+
+        position = self._length
+        if sector.is_filled:
+            if self._filled != position:
+                raise ValueError("Filled sectors of compact progressbar must precede unfilled ones.")
+            self._filled += 1
+
+        if self._sector_cls is None:
+            self._sector_cls = type(sector)
+
+        self._length += 1
+        if sector.name != self._name_at(position):
+            self._overrides[position] = sector.name
+
+        return self
+
+    def set_filled(self, filled: int, /) -> range:
+        """Sets count of filled sectors in constant time.
+
+        Parameters
+        ----------
+        filled : int, /
+            New count of filled sectors, clamped to `[0, length]`.
+
+        Returns
+        -------
+        range
+            Range of flipped sector positions.
+        """
+        filled = min(max(filled, 0), self._length)
+        old_filled, self._filled = self._filled, filled
+        low, high = min(old_filled, filled), max(old_filled, filled)
+        if self._reversed:
+            return range(self._length - high, self._length - low)
+        return range(low, high)
+
+    def replace_display_name_for(self, sector_pos: int, new_display_name: str, /) -> CompactProgressbar[SectorT]:
+        """Replaces sector display name.
+
+        Parameters
+        ----------
+        sector_pos : int, /
+            To find sector by index to change.
+        new_display_name : str, /
+            New display name value.
+
+        Returns
+        -------
+        Self
+            The progressbar object to allow fluent-style.
+        """
+        self._overrides[self._source_position(self._normalize_position(sector_pos))] = new_display_name
+        return self
+
+    def replace_sector(self, sector_pos: int, sector: abc_sectors.AbstractSector, /) -> CompactProgressbar[SectorT]:
+        """Replaces sector object, only its display name is stored.
+
+        Parameters
+        ----------
+        sector_pos : int, /
+            To find sector by index to replace.
+        sector : SectorT, /
+            New sector object.
+
+        Raises
+        ------
+        ValueError
+            If filled state of sector differs from filled state of its position,
+            use `set_filled()` to change filled count instead.
+
+        Returns
+        -------
+        Self
+            The progressbar object to allow fluent-style.
+        """
+        position = self._source_position(self._normalize_position(sector_pos))
+        if sector.is_filled != (position < self._filled):
+            raise ValueError("Filled sectors of compact progressbar must precede unfilled ones.")
+
+        self._overrides.pop(position, None)
+        if sector.name != self._name_at(position):
+            self._overrides[position] = sector.name
+        return self
+
+    @property
+    def length(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Length of the progressbar.
+        """
+        return self._length
+
+    @property
+    def filled(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Count of filled sectors.
+        """
+        return self._filled
+
+    @property
+    def signature(self) -> typing.Optional[signatures.ProgressbarSignatureProtocol]:
+        """
+        Returns
+        -------
+        typing.Optional[signatures.ProgressbarSignatureProtocol]
+            Signature that sector names are derived from.
+        """
+        return self._signature
+
+    @property
+    def overrides(self) -> typing.Mapping[int, str]:
+        """
+        Returns
+        -------
+        typing.Mapping[int, str]
+            Replaced sector names by their positions before reversal.
+        """
+        return self._overrides
+
+    @property
+    def is_reversed(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            Whether progressbar was reversed by `reversed()` odd number of times.
+        """
+        return self._reversed
+
+    @property
+    def sectors(self) -> typing.MutableSequence[SectorT]:
+        """
+        Returns
+        -------
+        collections.abc.Sequence[SectorT]
+            New list of lazily materialized sectors.
+        """
+        return list(self)
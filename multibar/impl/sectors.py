@@ -16,15 +16,18 @@
 """Implementation of progressbar sector interfaces."""
 from __future__ import annotations
 
-__all__ = ("Sector",)
+__all__ = ("Sector", "FrozenSector")
 
 import typing
+import weakref
 
 from multibar.api import sectors
 
 if typing.TYPE_CHECKING:
     from multibar.api import progressbars
 
+_FrozenSectorT = typing.TypeVar("_FrozenSectorT", bound="FrozenSector")
+
 
 class Sector(sectors.AbstractSector):
     """Implementation of sectors.AbstractSector.
@@ -34,6 +37,8 @@ class Sector(sectors.AbstractSector):
         plugin.
     """
 
+    __slots__ = ()
+
     def add_to_progressbar(self: Sector, progressbar: progressbars.ProgressbarAware[Sector], /) -> Sector:
         """Adds sector self to progressbar.
 
@@ -95,3 +100,129 @@ class Sector(sectors.AbstractSector):
             Sector position in the progressbar.
         """
         return self._position
+
+
+_INTERNED_SECTORS: weakref.WeakValueDictionary[
+    tuple[typing.Type[FrozenSector], str, bool], FrozenSector
+] = weakref.WeakValueDictionary()
+"""Interned frozen sectors by their (cls, name, is_filled) key."""
+
+
+class FrozenSector(sectors.AbstractSector):
+    """Immutable flyweight implementation of sectors.AbstractSector.
+
+    Constructor works as interning factory: sectors with the same name and filled
+    value are shared, so progressbar of any length stores only two distinct sectors.
+
+    !!! warning
+        Since one object is shared between positions, `position` is always `-1`.
+        Position of frozen sector is its index in the progressbar.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import multibar
+        ...
+        >>> writer = multibar.ProgressbarWriter(sector_cls=multibar.FrozenSector)
+        >>> progressbar = writer.write(50, 100)
+        >>> progressbar[0] is progressbar[1]
+        True
+        ```
+    """
+
+    __slots__ = ("__weakref__",)
+
+    def __new__(
+        cls: typing.Type[_FrozenSectorT],
+        name: str,
+        is_filled: bool,
+        position: int = -1,
+    ) -> _FrozenSectorT:
+        key = (cls, name, is_filled)
+        sector = _INTERNED_SECTORS.get(key)
+        if sector is None:
+            sector = super().__new__(cls)
+            # Initialized only once, `__init__` is a no-op for interned sectors.
+            sectors.AbstractSector.__init__(sector, name, is_filled, -1)
+            sector = _INTERNED_SECTORS.setdefault(key, sector)
+        return typing.cast(_FrozenSectorT, sector)
+
+    def __init__(self, name: str, is_filled: bool, position: int = -1) -> None:
+        """
+        Parameters
+        ----------
+        name : str
+            Sector display name.
+        is_filled : bool
+            Sector filled value.
+        position : int = -1
+            Ignored, because frozen sectors are shared between positions.
+        """
+
+    def add_to_progressbar(
+        self: _FrozenSectorT,
+        progressbar: progressbars.ProgressbarAware[_FrozenSectorT],
+        /,
+    ) -> _FrozenSectorT:
+        """Adds sector self to progressbar.
+
+        Parameters
+        ----------
+        progressbar : progressbars.ProgressbarAware[SelfT], /
+            Progressbar to add self for.
+
+        Returns
+        -------
+        Self
+            The sector object to allow fluent-style.
+        """
+        progressbar.add_sector(self)
+        return self
+
+    def change_name(self, new_display_name: str, /) -> FrozenSector:
+        """Returns interned sector with new display name.
+
+        !!! info
+            Sector itself is not changed. Progressbar implementations
+            replace sector with returned one in `replace_display_name_for()`.
+
+        Parameters
+        ----------
+        new_display_name : str, /
+            New display name to set.
+
+        Returns
+        -------
+        FrozenSector
+            Interned sector with new display name.
+        """
+        return type(self)(new_display_name, self._is_filled)
+
+    @property
+    def name(self) -> str:
+        """
+        Returns
+        -------
+        str
+            Sector display name.
+        """
+        return self._name
+
+    @property
+    def is_filled(self) -> bool:
+        """
+        Returns
+        -------
+        str
+            Sector filled value.
+        """
+        return self._is_filled
+
+    @property
+    def position(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Always `-1`, see class documentation.
+        """
+        return self._position
@@ -20,9 +20,71 @@ __all__ = (
     "SimpleSignature",
     "SignatureSegment",
     "SquareEmojiSignature",
+    "FrozenSignatureSegment",
+    "FrozenSimpleSignature",
+    "FrozenSquareEmojiSignature",
+    "SignatureRegistry",
+    "SIGNATURES",
+    "signature_key",
+    "glyph_metrics",
 )
 
 import dataclasses
+import functools
+import threading
+import typing
+import unicodedata
+
+from multibar.api import signatures
+
+SignatureValueKey = tuple[str, str, str, str, str, str]
+"""Chars of signature `start`, `end` & `middle` segments, by which signatures are interned."""
+
+
+_ZERO_WIDTH_CATEGORIES: typing.Final[frozenset[str]] = frozenset(("Mn", "Me", "Cf", "Cc"))
+"""Unicode categories of combining marks, format & control chars, that take no terminal cells."""
+
+
+@functools.lru_cache(maxsize=1024)
+def glyph_metrics(text: str, /) -> signatures.GlyphMetrics:
+    """Returns cached sizes of text.
+
+    !!! info
+        Wide & fullwidth East Asian chars (including emoji) take two cells,
+        combining marks, format & control chars (e.g. zero width joiner or
+        emoji variation selector) take no cells, any other char takes one.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> from multibar.impl.signatures import glyph_metrics
+        ...
+        >>> glyph_metrics("🟧")
+        GlyphMetrics(display_width=2, encoded_size=4, char_count=1)
+        >>> glyph_metrics(":orange_square:")
+        GlyphMetrics(display_width=15, encoded_size=15, char_count=15)
+        ```
+
+    Parameters
+    ----------
+    text : str, /
+        Text to measure, usually signature segment char.
+
+    Returns
+    -------
+    signatures.GlyphMetrics
+        Sizes of text.
+    """
+    if text.isascii() and text.isprintable():
+        # Printable ASCII text is measured without per-char lookups.
+        return signatures.GlyphMetrics(len(text), len(text), len(text))
+
+    display_width = 0
+    for char in text:
+        if unicodedata.category(char) in _ZERO_WIDTH_CATEGORIES:
+            continue
+        display_width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+    return signatures.GlyphMetrics(display_width, len(text.encode("utf-8")), len(text))
 
 
 @dataclasses.dataclass
@@ -35,6 +97,26 @@ class SignatureSegment:
     on_unfilled: str
     """On unfilled state."""
 
+    @property
+    def filled_metrics(self) -> signatures.GlyphMetrics:
+        """
+        Returns
+        -------
+        signatures.GlyphMetrics
+            Cached sizes of on filled state.
+        """
+        return glyph_metrics(self.on_filled)
+
+    @property
+    def unfilled_metrics(self) -> signatures.GlyphMetrics:
+        """
+        Returns
+        -------
+        signatures.GlyphMetrics
+            Cached sizes of on unfilled state.
+        """
+        return glyph_metrics(self.on_unfilled)
+
 
 @dataclasses.dataclass
 class SimpleSignature:
@@ -68,3 +150,285 @@ class SquareEmojiSignature:
         default=SignatureSegment(on_filled=":orange_square:", on_unfilled=":black_large_square:")
     )
     """Progressbar middle char (between start and and)."""
+
+
+class FrozenSignatureSegment(typing.NamedTuple):
+    """Immutable, hashable and slotted variant of `SignatureSegment`."""
+
+    on_filled: str
+    """On filled state."""
+
+    on_unfilled: str
+    """On unfilled state."""
+
+    @property
+    def filled_metrics(self) -> signatures.GlyphMetrics:
+        """
+        Returns
+        -------
+        signatures.GlyphMetrics
+            Cached sizes of on filled state.
+        """
+        return glyph_metrics(self.on_filled)
+
+    @property
+    def unfilled_metrics(self) -> signatures.GlyphMetrics:
+        """
+        Returns
+        -------
+        signatures.GlyphMetrics
+            Cached sizes of on unfilled state.
+        """
+        return glyph_metrics(self.on_unfilled)
+
+
+class FrozenSimpleSignature(typing.NamedTuple):
+    """Immutable, hashable and slotted variant of `SimpleSignature`.
+
+    Equal frozen signatures are interchangeable, so caches may key on them
+    by value (see `SignatureRegistry`) instead of object identity.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import multibar
+        ...
+        >>> signature = multibar.FrozenSimpleSignature.from_signature(multibar.SimpleSignature())
+        >>> signature == multibar.FrozenSimpleSignature()
+        True
+        ```
+    """
+
+    start: FrozenSignatureSegment = FrozenSignatureSegment(on_filled="<", on_unfilled="-")
+    """Progressbar start char."""
+
+    end: FrozenSignatureSegment = FrozenSignatureSegment(on_filled=">", on_unfilled="-")
+    """Progressbar end char."""
+
+    middle: FrozenSignatureSegment = FrozenSignatureSegment(on_filled="+", on_unfilled="-")
+    """Progressbar middle char (between start and and)."""
+
+    @classmethod
+    def from_signature(cls, signature: signatures.ProgressbarSignatureProtocol, /) -> FrozenSimpleSignature:
+        """Alternative constructor, that freezes chars of any signature.
+
+        Parameters
+        ----------
+        signature : signatures.ProgressbarSignatureProtocol, /
+            Signature to freeze.
+
+        Returns
+        -------
+        FrozenSimpleSignature
+            Frozen copy of signature.
+        """
+        return cls(
+            start=FrozenSignatureSegment(signature.start.on_filled, signature.start.on_unfilled),
+            end=FrozenSignatureSegment(signature.end.on_filled, signature.end.on_unfilled),
+            middle=FrozenSignatureSegment(signature.middle.on_filled, signature.middle.on_unfilled),
+        )
+
+
+class FrozenSquareEmojiSignature(typing.NamedTuple):
+    """Immutable, hashable and slotted variant of `SquareEmojiSignature`."""
+
+    start: FrozenSignatureSegment = FrozenSignatureSegment(
+        on_filled=":small_orange_diamond:", on_unfilled=":black_large_square:"
+    )
+    """Progressbar start char."""
+
+    end: FrozenSignatureSegment = FrozenSignatureSegment(
+        on_filled=":small_orange_diamond:", on_unfilled=":black_large_square:"
+    )
+    """Progressbar end char."""
+
+    middle: FrozenSignatureSegment = FrozenSignatureSegment(
+        on_filled=":orange_square:", on_unfilled=":black_large_square:"
+    )
+    """Progressbar middle char (between start and and)."""
+
+
+FrozenSignatureType = typing.Union[FrozenSimpleSignature, FrozenSquareEmojiSignature]
+"""Frozen signature variants."""
+
+
+def _value_key(signature: signatures.ProgressbarSignatureProtocol, /) -> SignatureValueKey:
+    start, end, middle = signature.start, signature.end, signature.middle
+    return (
+        start.on_filled,
+        start.on_unfilled,
+        end.on_filled,
+        end.on_unfilled,
+        middle.on_filled,
+        middle.on_unfilled,
+    )
+
+
+class SignatureRegistry:
+    """Registry, that interns equal signatures and gives each a stable small integer id.
+
+    Ids are given in registration order, starting from zero, and never reused,
+    so per-signature precomputed data can be attached to them.
+
+    !!! info
+        Signatures are interned by their chars, so mutable signatures are
+        registered by a frozen copy of their current state.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> import multibar
+        ...
+        >>> registry = multibar.SignatureRegistry()
+        >>> registry.register(multibar.SimpleSignature())
+        0
+        >>> registry.register(multibar.FrozenSimpleSignature())
+        0
+        >>> registry.attachments(0)["note"] = "precomputed data"
+        ```
+    """
+
+    __slots__ = ("_ids", "_signatures", "_attachments", "_lock")
+
+    def __init__(self) -> None:
+        self._ids: dict[SignatureValueKey, int] = {}
+        self._signatures: list[FrozenSignatureType] = []
+        self._attachments: list[dict[str, typing.Any]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Returns
+        -------
+        int
+            Count of registered signatures.
+        """
+        return len(self._signatures)
+
+    def __contains__(self, signature: typing.Any, /) -> bool:
+        """
+        Parameters
+        ----------
+        signature : typing.Any, /
+            Signature to check.
+
+        Returns
+        -------
+        bool
+            True if equal signature is registered.
+        """
+        try:
+            return _value_key(signature) in self._ids
+        except AttributeError:
+            return False
+
+    def register(self, signature: signatures.ProgressbarSignatureProtocol, /) -> int:
+        """Registers signature, if equal signature is not registered yet.
+
+        Parameters
+        ----------
+        signature : signatures.ProgressbarSignatureProtocol, /
+            Signature to register.
+
+        Returns
+        -------
+        int
+            Stable id of signature.
+        """
+        key = _value_key(signature)
+        signature_id = self._ids.get(key)
+        if signature_id is not None:
+            return signature_id
+
+        with self._lock:
+            signature_id = self._ids.get(key)
+            if signature_id is None:
+                if not isinstance(signature, (FrozenSimpleSignature, FrozenSquareEmojiSignature)):
+                    signature = FrozenSimpleSignature.from_signature(signature)
+
+                signature_id = len(self._signatures)
+                self._signatures.append(signature)
+                self._attachments.append({})
+                self._ids[key] = signature_id
+
+        return signature_id
+
+    def intern(self, signature: signatures.ProgressbarSignatureProtocol, /) -> FrozenSignatureType:
+        """Returns the only frozen instance of signature.
+
+        Parameters
+        ----------
+        signature : signatures.ProgressbarSignatureProtocol, /
+            Signature to intern.
+
+        Returns
+        -------
+        FrozenSignatureType
+            Registered frozen signature, equal to given one.
+        """
+        return self._signatures[self.register(signature)]
+
+    def get(self, signature_id: int, /) -> typing.Optional[FrozenSignatureType]:
+        """Returns registered signature by its id.
+
+        Parameters
+        ----------
+        signature_id : int, /
+            Id of signature.
+
+        Returns
+        -------
+        typing.Optional[FrozenSignatureType]
+            Registered signature or None, if id is not registered.
+        """
+        if 0 <= signature_id < len(self._signatures):
+            return self._signatures[signature_id]
+        return None
+
+    def attachments(self, signature_id: int, /) -> dict[str, typing.Any]:
+        """Returns mutable mapping of data, that is attached to signature id.
+
+        Parameters
+        ----------
+        signature_id : int, /
+            Id of signature.
+
+        Raises
+        ------
+        KeyError
+            If signature id is not registered.
+
+        Returns
+        -------
+        dict[str, typing.Any]
+            Data attached to signature, such as precomputed glyph widths.
+        """
+        if not 0 <= signature_id < len(self._attachments):
+            raise KeyError(signature_id)
+        return self._attachments[signature_id]
+
+
+SIGNATURES = SignatureRegistry()
+"""Process-wide signature registry."""
+
+
+def signature_key(signature: signatures.ProgressbarSignatureProtocol, /) -> int:
+    """Returns key of signature for caches.
+
+    Frozen signatures are keyed by their registry id, so equal frozen signatures
+    share cache entries. Other signatures may be mutated, so they are keyed by `id()`.
+
+    !!! info
+        Registry ids are turned negative, so they never collide with `id()`.
+
+    Parameters
+    ----------
+    signature : signatures.ProgressbarSignatureProtocol, /
+        Signature to get key of.
+
+    Returns
+    -------
+    int
+        Cache key of signature.
+    """
+    if isinstance(signature, (FrozenSimpleSignature, FrozenSquareEmojiSignature)):
+        return -1 - SIGNATURES.register(signature)
+    return id(signature)
@@ -18,21 +18,88 @@ from __future__ import annotations
 
 __all__ = ("ProgressbarWriter",)
 
+import collections.abc
+import itertools
 import typing
 
 from multibar import utils
 from multibar.api import sectors as abc_sectors
 from multibar.api import writers as abc_writers
 
+from . import caches
 from . import calculation_service as math_operations
-from . import progressbars, sectors, signatures
+from . import hooks, progressbars, sectors, signatures
 
 if typing.TYPE_CHECKING:
+    from multibar import types as progress_types
+    from multibar.api import caches as abc_caches
     from multibar.api import calculation_service as abc_math_operations
     from multibar.api import progressbars as abc_progressbars
     from multibar.api import signatures as abc_signatures
 
 
+_BOUND_RENDER_FUNCTIONS_MAXSIZE: typing.Final[int] = 16
+"""Maximum count of render functions, that writer keeps by progressbar lengths."""
+
+
+def _filled_boundary(progressbar: abc_progressbars.ProgressbarAware[typing.Any], /) -> int:
+    # Filled sectors precede unfilled ones, so boundary is found by binary search.
+    low, high = 0, len(progressbar)
+    while low < high:
+        middle = (low + high) // 2
+        if progressbar[middle].is_filled:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _sectors_count(filled: int, length: int, /) -> int:
+    # Out of range progressbar is longer than `length`, because every
+    # filled sector and every unfilled one up to `length` are written.
+    return max(filled, 0) + max(length - filled, 0)
+
+
+def _capped_names(
+    sig: abc_signatures.ProgressbarSignatureProtocol,
+    filled: int,
+    length: int,
+    start_filled: bool,
+    end_filled: bool,
+    /,
+) -> list[str]:
+    names = [sig.middle.on_filled] * filled + [sig.middle.on_unfilled] * (length - filled)
+    if names:
+        # Single sector gets `end` char, as WRITER_HOOKS replace `start` char with it.
+        names[0] = sig.start.on_filled if start_filled else sig.start.on_unfilled
+        names[-1] = sig.end.on_filled if end_filled else sig.end.on_unfilled
+    return names
+
+
+def _render_capped(
+    sig: abc_signatures.ProgressbarSignatureProtocol,
+    filled: int,
+    length: int,
+    start_filled: bool,
+    end_filled: bool,
+    /,
+) -> str:
+    # Out of range progressbar is longer than `length`, the same as without caps.
+    length = _sectors_count(filled, length)
+    end_name = sig.end.on_filled if end_filled else sig.end.on_unfilled
+    if length < 2:
+        return end_name if length == 1 else ""
+
+    start_name = sig.start.on_filled if start_filled else sig.start.on_unfilled
+    inner_filled = max(0, min(filled, length - 1) - 1)
+    return (
+        start_name
+        + sig.middle.on_filled * inner_filled
+        + sig.middle.on_unfilled * (length - 2 - inner_filled)
+        + end_name
+    )
+
+
 class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
     """Implementation of abc_writers.ProgressbarWriterAware.
 
@@ -41,7 +108,20 @@ class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
         plugin.
     """
 
-    __slots__ = ("_signature", "_sector_cls", "_progressbar_cls", "_calculation_service")
+    __slots__ = (
+        "_signature",
+        "_sector_cls",
+        "_progressbar_cls",
+        "_calculation_service",
+        "_render_cache",
+        "_render_tables",
+        "_render_functions",
+        "_writes_compact",
+        "_writes_flyweights",
+        "_capped",
+        "_first_fill",
+        "_last_fill",
+    )
 
     def __init__(
         self,
@@ -52,6 +132,12 @@ class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
         ] = None,
         signature: typing.Optional[abc_signatures.ProgressbarSignatureProtocol] = None,
         calculation_service: typing.Optional[typing.Type[abc_math_operations.AbstractCalculationService]] = None,
+        render_cache: typing.Optional[
+            abc_caches.RenderCacheAware[progress_types.RenderCacheKeyType, caches.RenderSnapshot]
+        ] = None,
+        capped: bool = False,
+        first_fill: float = hooks.FIRST_FILL,
+        last_fill: float = hooks.LAST_FILL,
     ) -> None:
         """
         Parameters
@@ -59,22 +145,55 @@ class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
         sector_cls: typing.Optional[typing.Type[abc_sectors.AbstractSector]] = None
             Progressbar sector cls for writer.
         progressbar_cls: typing.Optional[typing.Type[ProgressbarT_co]] = None
-            Progressbar cls for writer.
+            Progressbar cls for writer. If it is subclass of `CompactProgressbar`,
+            progressbars are written in constant time and memory.
         signature: typing.Optional[abc_signatures.ProgressbarSignatureProtocol] = None
             Progressbar signature for writer.
         calculation_service: typing.Optional[typing.Type[abc_math_operations.AbstractCalculationService]] = None
             Math operations for writer.
+        render_cache: typing.Optional[abc_caches.RenderCacheAware[...]] = None
+            Cache of rendered snapshots for writer. If None, every write
+            renders progressbar from scratch.
+
+            !!! info
+                Cache is used only if `sector_cls` is subclass of `FrozenSector`,
+                because mutable sectors cannot be shared between progressbars,
+                so caching would only add lookups to every write.
+
+            !!! warning
+                Snapshots are keyed by signature identity, so if you mutate
+                signature in-place, you should clear the cache manually.
+        capped: bool = False
+            If True, progressbar `start` & `end` chars are picked while progressbar
+            is written, so `multibar.WRITER_HOOKS` are not needed.
+        first_fill: float = hooks.FIRST_FILL
+            Progress percentage from which `start` char is filled in capped mode.
+        last_fill: float = hooks.LAST_FILL
+            Progress percentage from which `end` char is filled in capped mode.
         """
         self._signature = utils.none_or(signatures.SimpleSignature(), signature)
         self._sector_cls = utils.none_or(sectors.Sector, sector_cls)
         self._progressbar_cls = utils.none_or(progressbars.Progressbar[abc_sectors.AbstractSector], progressbar_cls)
         self._calculation_service = utils.none_or(math_operations.ProgressbarCalculationService, calculation_service)
+        self._render_cache = render_cache
+        # Progressbar cls may be a generic alias like `Progressbar[Sector]`.
+        progressbar_origin = typing.get_origin(self._progressbar_cls) or self._progressbar_cls
+        self._writes_compact = issubclass(progressbar_origin, progressbars.CompactProgressbar)
+        self._writes_flyweights = issubclass(self._sector_cls, sectors.FrozenSector)
+        self._render_tables: dict[int, caches.RenderTable] = {}
+        self._capped = capped
+        self._first_fill = first_fill
+        self._last_fill = last_fill
+        self._render_functions: dict[int, progress_types.RenderFunctionType] = {}
 
     @classmethod
     def from_signature(
         cls,
         signature: abc_signatures.ProgressbarSignatureProtocol,
         /,
+        *,
+        precompute_lengths: collections.abc.Iterable[int] = (),
+        capped: bool = False,
     ) -> ProgressbarWriter:
         """Alternative constructor from signature.
 
@@ -82,18 +201,25 @@ class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
         ----------
         signature : abc_signatures.ProgressbarSignatureProtocol, /
             Signature to init.
+        precompute_lengths : collections.abc.Iterable[int] = (), *
+            Progressbar lengths to precompute render tables for.
+            See `bind_signature()` for details.
+        capped : bool = False, *
+            If True, progressbar `start` & `end` chars are rendered by writer.
 
         Returns
         -------
         ProgressbarWriterAware[sectors.AbstractSector]
             Instance of progressbar writer.
         """
-        return cls(
+        writer = cls(
             sector_cls=None,
             progressbar_cls=None,
             signature=signature,
             calculation_service=None,
+            capped=capped,
         )
+        return writer.bind_signature(signature, precompute_lengths=precompute_lengths)
 
     @typing.final
     def write(
@@ -120,23 +246,798 @@ class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
         abc_progressbars.ProgressbarAware[sectors.AbstractSector]
             Progressbar object.
         """
+        calculation_service = self._calculation_service(start_value, end_value, length)
+        if self._capped:
+            return self._write_capped(*self._calculate_capped(calculation_service, length), length)
+
+        return self._write_filled(calculation_service.filled_count(), length)
+
+    @typing.final
+    def update(
+        self,
+        progressbar: abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector],
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        capped: typing.Optional[bool] = None,
+    ) -> range:
+        """Updates written progressbar in-place without any hooks or checks.
+
+        Only sectors between old and new filled boundaries are flipped, and
+        progressbar `start` & `end` chars are replaced only if they changed,
+        so update costs O(delta) instead of writing new progressbar.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> writer = multibar.ProgressbarWriter()
+            >>> progressbar = writer.write(25, 100, length=4)
+            >>> writer.update(progressbar, 75, 100)
+            range(1, 3)
+            >>> progressbar
+            +++-
+            ```
+
+        Parameters
+        ----------
+        progressbar : abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector], /
+            Progressbar to update, length of progressbar is not changed, so
+            out of range progress fills it entirely or empties it.
+        start_value : int, /
+            New start value (current progress).
+        end_value : int, /
+            New end value (needed progress).
+        capped : typing.Optional[bool] = None, *
+            If True, re-applies progressbar `start` & `end` chars the same way as
+            `multibar.WRITER_HOOKS` does, but with writer fill thresholds.
+            If None, writer `capped` mode is used.
+
+        Returns
+        -------
+        range
+            Range of changed sector positions, including replaced `start` & `end` chars.
+        """
+        length = len(progressbar)
+        if not length:
+            return range(0)
+
+        calculation_service = self._calculation_service(start_value, end_value, length)
+        # Length of progressbar is kept, so out of range progress fills it entirely or empties it.
+        filled = min(max(calculation_service.filled_count(), 0), length)
+        sig = self._signature
+
+        if isinstance(progressbar, progressbars.CompactProgressbar):
+            changed = progressbar.set_filled(filled)
+        else:
+            old_filled = _filled_boundary(progressbar)
+            changed = range(min(old_filled, filled), max(old_filled, filled))
+            sector_cls = self._sector_cls
+            name = sig.middle.on_filled if filled > old_filled else sig.middle.on_unfilled
+            is_filled = filled > old_filled
+            for sector_index in changed:
+                progressbar.replace_sector(sector_index, sector_cls(name, is_filled, sector_index))
+
+        if not utils.none_or(self._capped, capped):
+            return changed
+
+        percentage = calculation_service.progress_percents
+        # Empty range is widened only by `start` & `end` chars that actually changed.
+        first, last = (changed.start, changed.stop) if changed else (length, 0)
+
+        start_name = sig.start.on_filled if percentage >= self._first_fill else sig.start.on_unfilled
+        if progressbar[0].name != start_name:
+            progressbar.replace_display_name_for(0, start_name)
+            first, last = 0, max(last, 1)
+
+        end_name = sig.end.on_filled if percentage >= self._last_fill else sig.end.on_unfilled
+        if progressbar[-1].name != end_name:
+            progressbar.replace_display_name_for(-1, end_name)
+            first, last = min(first, length - 1), length
+
+        if first >= last:
+            return changed
+
+        return range(first, last)
+
+    @typing.final
+    def write_str(
+        self,
+        start_value: int,
+        end_value: int,
+        /,
+        *,
+        length: int = 20,
+    ) -> str:
+        """Writes progress straight to string without any hooks or checks.
+        Unlike `write()`, does not allocate any sector or progressbar objects.
+
+        !!! note
+            Result is equal to `repr(writer.write(...))` for default progressbar
+            and sector implementations.
+
+        !!! info
+            If there is no precomputed render table for `length`, progress is
+            rendered by function from `caches.compile_render_function()`.
+            In capped mode, `start` & `end` chars are rendered as well.
+
+        Parameters
+        ----------
+        start_value : int, /
+            Start value (current progress).
+        end_value : int, /
+            End value (needed progress).
+        length : int, *
+            Length of progressbar.
+
+        Returns
+        -------
+        str
+            String representation of progressbar.
+        """
+        table = self._render_tables.get(length)
+        if self._capped:
+            filled, start_filled, end_filled = self._calculate_capped(
+                self._calculation_service(start_value, end_value, length), length
+            )
+            if table is not None and 0 <= filled <= length:
+                return table.get_capped(filled, start_filled=start_filled, end_filled=end_filled)
+            return _render_capped(self._signature, filled, length, start_filled, end_filled)
+
+        if table is not None or length < 1:
+            # Table clamps filled count and render function requires positive length, so
+            # out of range progresses and lengths are rendered (or fail) like `write()` does.
+            filled = self._calculation_service(start_value, end_value, length).filled_count()
+            if table is not None and 0 <= filled <= length:
+                return table.get(filled)
+
+            middle = self._signature.middle
+            return middle.on_filled * filled + middle.on_unfilled * (length - filled)
+
+        render = self._render_functions.get(length)
+        if render is None:
+            if len(self._render_functions) >= _BOUND_RENDER_FUNCTIONS_MAXSIZE:
+                self._render_functions.clear()
+
+            render = self._render_functions[length] = caches.compile_render_function(
+                self._signature,
+                length=length,
+                calculation_cls=self._calculation_service,
+            )
+
+        return render(start_value, end_value)
+
+    @typing.overload
+    def write_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def write_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def write_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[typing.Any]], list[str]]:
+        """Writes batch of progresses without any hooks or checks.
+
+        Filled counts are computed in one pass, then every distinct
+        filled count is rendered only once and shared between rows.
+
+        !!! info
+            Rows share rendered strings (`as_str=True`) or frozen sectors (`FrozenSector`),
+            and compact progressbars are written in constant time. Mutable sectors cannot be
+            shared, so with them every row still allocates its own `length` sectors.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> writer = multibar.ProgressbarWriter()
+            >>> writer.write_many([25, 50, 75], [100, 100, 100], length=4, as_str=True)
+            ['+---', '++--', '+++-']
+            ```
+
+        Parameters
+        ----------
+        start_values : collections.abc.Iterable[int], /
+            Start values (current progresses).
+        end_values : collections.abc.Iterable[int], /
+            End values (needed progresses), paired with start values.
+        length : int, *
+            Length of progressbars.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        if self._capped:
+            return self._write_many_capped(
+                self._calculate_capped_many(start_values, end_values, length), length, as_str
+            )
+
+        return self._write_many_filled(self._calculate_filled_counts(start_values, end_values, length), length, as_str)
+
+    @typing.final
+    def write_ratio(
+        self,
+        ratio: float,
+        /,
+        *,
+        length: int = 20,
+    ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+        """Writes progress from ratio without any hooks or checks.
+
+        Unlike `write()`, ratio is not divided again, so producers, that already
+        have it, do not need to convert it back to start & end values.
+
+        !!! info
+            Ratio is clamped to `[0, 1]`, so out-of-range progress gives
+            empty or full progressbar.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> writer = multibar.ProgressbarWriter()
+            >>> writer.write_ratio(0.5, length=4)
+            ++--
+            ```
+
+        Parameters
+        ----------
+        ratio : float, /
+            Progress ratio, from 0 to 1.
+        length : int, *
+            Length of progressbar.
+
+        Returns
+        -------
+        abc_progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar object.
+        """
+        filled, percentage = self._calculate_scaled(ratio, 1, length)
+        if self._capped:
+            return self._write_capped(filled, percentage >= self._first_fill, percentage >= self._last_fill, length)
+
+        return self._write_filled(filled, length)
+
+    @typing.final
+    def write_percent(
+        self,
+        percent: float,
+        /,
+        *,
+        length: int = 20,
+    ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+        """Writes progress from percentage without any hooks or checks.
+
+        Unlike `write()`, percentage is not divided again, so producers, that already
+        have it, do not need to convert it back to start & end values.
+
+        !!! info
+            Percentage is clamped to `[0, 100]`, so out-of-range progress gives
+            empty or full progressbar.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> writer = multibar.ProgressbarWriter()
+            >>> writer.write_percent(50, length=4)
+            ++--
+            ```
+
+        Parameters
+        ----------
+        percent : float, /
+            Progress percentage, from 0 to 100.
+        length : int, *
+            Length of progressbar.
+
+        Returns
+        -------
+        abc_progressbars.ProgressbarAware[sectors.AbstractSector]
+            Progressbar object.
+        """
+        filled, percentage = self._calculate_scaled(percent, 100, length)
+        if self._capped:
+            return self._write_capped(filled, percentage >= self._first_fill, percentage >= self._last_fill, length)
+
+        return self._write_filled(filled, length)
+
+    @typing.overload
+    def write_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def write_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def write_ratio_many(
+        self,
+        ratios: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[typing.Any]], list[str]]:
+        """Writes batch of progresses from ratios without any hooks or checks.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> writer = multibar.ProgressbarWriter()
+            >>> writer.write_ratio_many([0.25, 0.5, 0.75], length=4, as_str=True)
+            ['+---', '++--', '+++-']
+            ```
+
+        Parameters
+        ----------
+        ratios : collections.abc.Iterable[float], /
+            Progress ratios, arrays are computed in one vectorized expression.
+        length : int, *
+            Length of progressbars.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        return self._write_scaled_many(ratios, 1, length, as_str)
+
+    @typing.overload
+    def write_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[False] = False,
+    ) -> list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]]:
+        ...
+
+    @typing.overload
+    def write_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: typing.Literal[True],
+    ) -> list[str]:
+        ...
+
+    def write_percent_many(
+        self,
+        percents: collections.abc.Iterable[float],
+        /,
+        *,
+        length: int = 20,
+        as_str: bool = False,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[typing.Any]], list[str]]:
+        """Writes batch of progresses from percentages without any hooks or checks.
+
+        ??? example "Expand example of usage"
+            ```py
+            >>> import multibar
+            ...
+            >>> writer = multibar.ProgressbarWriter()
+            >>> writer.write_percent_many([25, 50, 75], length=4, as_str=True)
+            ['+---', '++--', '+++-']
+            ```
+
+        Parameters
+        ----------
+        percents : collections.abc.Iterable[float], /
+            Progress percentages, arrays are computed in one vectorized expression.
+        length : int, *
+            Length of progressbars.
+        as_str : bool = False, *
+            If True, returns string representations instead of progressbar objects.
+
+        Returns
+        -------
+        typing.Union[list[abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]], list[str]]
+            Progressbar objects or their string representations.
+        """
+        return self._write_scaled_many(percents, 100, length, as_str)
+
+    def _calculate_scaled(self, value: float, scale: int, length: int, /) -> tuple[int, float]:
+        # Progress is `value / scale`, where scale is 1 for ratios and 100 for percentages.
+        # Scaled progresses have no end value to overflow, so they are clamped to the scale.
+        value = min(max(value, 0), scale)
+        if self._calculation_service is math_operations.ProgressbarCalculationService:
+            percentage = value * (100 // scale)
+            return round(percentage / (100 / length)), percentage
+
+        calculation_service = self._calculation_service(value, scale, length)
+        return calculation_service.filled_count(), calculation_service.progress_percents
+
+    def _calculate_scaled_many(
+        self,
+        values: collections.abc.Iterable[float],
+        scale: int,
+        length: int,
+        /,
+    ) -> tuple[list[int], typing.Optional[list[float]]]:
+        # Percentages are computed only for `start` & `end` chars of capped mode.
+        # Scaled progresses are clamped to the scale same as by `_calculate_scaled()`.
+        if self._calculation_service is math_operations.ProgressbarCalculationService:
+            multiplier, step = 100 // scale, 100 / length
+            if hasattr(values, "__array__"):
+                import numpy
+
+                percentages = numpy.clip(values, 0, scale) * multiplier
+                filled_counts = numpy.rint(percentages / step).astype(numpy.int64).tolist()
+                return filled_counts, percentages.tolist() if self._capped else None
+
+            percentages_ = [min(max(value, 0), scale) * multiplier for value in values]
+            filled_counts_ = [round(percentage / step) for percentage in percentages_]
+            return filled_counts_, percentages_ if self._capped else None
+
+        calculation_services = [self._calculation_service(min(max(value, 0), scale), scale, length) for value in values]
+        return (
+            [calculation_service.filled_count() for calculation_service in calculation_services],
+            [calculation_service.progress_percents for calculation_service in calculation_services],
+        )
+
+    def _write_scaled_many(
+        self,
+        values: collections.abc.Iterable[float],
+        scale: int,
+        length: int,
+        as_str: bool,
+        /,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[typing.Any]], list[str]]:
+        filled_counts, percentages = self._calculate_scaled_many(values, scale, length)
+        if percentages is not None and self._capped:
+            first_fill, last_fill = self._first_fill, self._last_fill
+            keys = [
+                (filled, percentage >= first_fill, percentage >= last_fill)
+                for filled, percentage in zip(filled_counts, percentages)
+            ]
+            return self._write_many_capped(keys, length, as_str)
+
+        return self._write_many_filled(filled_counts, length, as_str)
+
+    def _calculate_filled_counts(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        length: int,
+        /,
+    ) -> list[int]:
+        if self._calculation_service is math_operations.ProgressbarCalculationService:
+            if hasattr(start_values, "__array__") and hasattr(end_values, "__array__"):
+                # Arrays are computed in one vectorized expression.
+                vectorized = math_operations.VectorizedCalculationService(start_values, end_values, length)
+                return typing.cast("list[int]", vectorized.filled_counts().tolist())
+
+            # Inlined `ProgressbarCalculationService.filled_count()`, keeps the same
+            # order of float operations, so rounding is exactly the same.
+            step = 100 / length
+            return [round(start / end * 100 / step) for start, end in zip(start_values, end_values)]
+
+        calculation_cls = self._calculation_service
+        return [calculation_cls(start, end, length).filled_count() for start, end in zip(start_values, end_values)]
+
+    def _calculate_capped(
+        self,
+        calculation_service: abc_math_operations.AbstractCalculationService,
+        length: int,
+        /,
+    ) -> tuple[int, bool, bool]:
+        percentage = calculation_service.progress_percents
+        if type(calculation_service) is math_operations.ProgressbarCalculationService:
+            # Inlined `filled_count()` with the same float operations,
+            # so progress percentage is computed only once.
+            filled = round(percentage / (100 / length))
+        else:
+            filled = calculation_service.filled_count()
+
+        return filled, percentage >= self._first_fill, percentage >= self._last_fill
+
+    def _calculate_capped_many(
+        self,
+        start_values: collections.abc.Iterable[int],
+        end_values: collections.abc.Iterable[int],
+        length: int,
+        /,
+    ) -> list[tuple[int, bool, bool]]:
+        first_fill, last_fill = self._first_fill, self._last_fill
+        if self._calculation_service is math_operations.ProgressbarCalculationService:
+            if hasattr(start_values, "__array__") and hasattr(end_values, "__array__"):
+                vectorized = math_operations.VectorizedCalculationService(start_values, end_values, length)
+                percentages = vectorized.progress_percents
+                return list(
+                    zip(
+                        vectorized.filled_counts().tolist(),
+                        (percentages >= first_fill).tolist(),
+                        (percentages >= last_fill).tolist(),
+                    )
+                )
+
+            step = 100 / length
+            keys = []
+            for start, end in zip(start_values, end_values):
+                percentage = start / end * 100
+                keys.append((round(percentage / step), percentage >= first_fill, percentage >= last_fill))
+            return keys
+
+        calculation_cls = self._calculation_service
+        return [
+            self._calculate_capped(calculation_cls(start, end, length), length)
+            for start, end in zip(start_values, end_values)
+        ]
+
+    def _write_filled(
+        self,
+        filled: int,
+        length: int,
+        /,
+    ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
         sig = self._signature
         sector_cls = self._sector_cls
+
+        if self._writes_compact:
+            # Compact progressbar is written in constant time.
+            return self._progressbar_cls(  # type: ignore[call-arg]
+                sig,
+                length=length if 0 <= filled <= length else _sectors_count(filled, length),
+                filled=filled,
+                sector_cls=sector_cls,
+            )
+
         progressbar = self._progressbar_cls()
-        calculation_service = self._calculation_service(start_value, end_value, length)
+        if self._writes_flyweights:
+            if self._render_cache is not None:
+                # Cached frozen sectors are shared between all progressbars.
+                for sector in self._get_snapshot(filled, length).sectors:
+                    progressbar.add_sector(sector)
+                return progressbar
+
+            # Frozen sectors are shared between positions, so only two of them are interned.
+            filled_sector = sector_cls(sig.middle.on_filled, True, -1)
+            unfilled_sector = sector_cls(sig.middle.on_unfilled, False, -1)
+            for sector in itertools.chain(
+                itertools.repeat(filled_sector, filled),
+                itertools.repeat(unfilled_sector, length - filled),
+            ):
+                progressbar.add_sector(sector)
+            return progressbar
 
-        for sector_index in calculation_service.calculate_filled_indexes():
+        for sector_index in range(filled):
             progressbar.add_sector(sector_cls(sig.middle.on_filled, True, sector_index))
 
-        for sector_index in calculation_service.calculate_unfilled_indexes():
+        for sector_index in range(filled, length):
             progressbar.add_sector(sector_cls(sig.middle.on_unfilled, False, sector_index))
 
         return progressbar
 
+    def _write_many_filled(
+        self,
+        filled_counts: collections.abc.Sequence[int],
+        length: int,
+        as_str: bool,
+        /,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[typing.Any]], list[str]]:
+        if as_str:
+            table = self._render_tables.get(length)
+            middle = self._signature.middle
+            renders: dict[int, str] = {}
+            for filled in set(filled_counts):
+                # Table clamps filled count, so out of range progresses are rendered like `write()` does.
+                if table is not None and 0 <= filled <= length:
+                    renders[filled] = table.get(filled)
+                else:
+                    renders[filled] = middle.on_filled * filled + middle.on_unfilled * (length - filled)
+            return [renders[filled] for filled in filled_counts]
+
+        sig = self._signature
+        sector_cls = self._sector_cls
+        progressbars_: list[abc_progressbars.ProgressbarAware[typing.Any]] = []
+
+        if self._writes_compact:
+            compact_cls = typing.cast(typing.Type[progressbars.CompactProgressbar[typing.Any]], self._progressbar_cls)
+            progressbars_.extend(
+                compact_cls(
+                    sig,
+                    length=length if 0 <= filled <= length else _sectors_count(filled, length),
+                    filled=filled,
+                    sector_cls=sector_cls,
+                )
+                for filled in filled_counts
+            )
+            return progressbars_
+
+        # Every row gets its own progressbar, but sectors of the same filled
+        # count are either shared (flyweights) or built from one snapshot.
+        if self._writes_flyweights:
+            shared_sectors = {
+                filled: (
+                    self._get_snapshot(filled, length)
+                    if self._render_cache is not None
+                    else caches.RenderSnapshot.from_signature(sig, length=length, filled=filled, sector_cls=sector_cls)
+                ).sectors
+                for filled in set(filled_counts)
+            }
+            for filled in filled_counts:
+                progressbar = self._progressbar_cls()
+                for sector in shared_sectors[filled]:
+                    progressbar.add_sector(sector)
+                progressbars_.append(progressbar)
+            return progressbars_
+
+        snapshots = {
+            filled: caches.RenderSnapshot.from_signature(sig, length=length, filled=filled)
+            for filled in set(filled_counts)
+        }
+        for filled in filled_counts:
+            progressbar = self._progressbar_cls()
+            for position, name in enumerate(snapshots[filled].names):
+                progressbar.add_sector(sector_cls(name, position < filled, position))
+            progressbars_.append(progressbar)
+
+        return progressbars_
+
+    def _write_capped(
+        self,
+        filled: int,
+        start_filled: bool,
+        end_filled: bool,
+        length: int,
+        /,
+    ) -> abc_progressbars.ProgressbarAware[abc_sectors.AbstractSector]:
+        sig = self._signature
+        sector_cls = self._sector_cls
+
+        if self._writes_compact:
+            length = _sectors_count(filled, length)
+            progressbar = self._progressbar_cls(  # type: ignore[call-arg]
+                sig,
+                length=length,
+                filled=filled,
+                sector_cls=sector_cls,
+            )
+            if length > 0:
+                # Compact progressbar keeps `start` & `end` chars as two name overrides.
+                progressbar.replace_display_name_for(0, sig.start.on_filled if start_filled else sig.start.on_unfilled)
+                progressbar.replace_display_name_for(-1, sig.end.on_filled if end_filled else sig.end.on_unfilled)
+            return progressbar
+
+        names = _capped_names(sig, filled, length, start_filled, end_filled)
+        progressbar = self._progressbar_cls()
+        if self._writes_flyweights:
+            # Only middle sectors are shared, `start` & `end` sectors are interned separately.
+            filled_sector = sector_cls(sig.middle.on_filled, True, -1)
+            unfilled_sector = sector_cls(sig.middle.on_unfilled, False, -1)
+            last_position = len(names) - 1
+            for position, name in enumerate(names):
+                if position == 0 or position == last_position:
+                    progressbar.add_sector(sector_cls(name, position < filled, -1))
+                else:
+                    progressbar.add_sector(filled_sector if position < filled else unfilled_sector)
+            return progressbar
+
+        for position, name in enumerate(names):
+            progressbar.add_sector(sector_cls(name, position < filled, position))
+        return progressbar
+
+    def _write_many_capped(
+        self,
+        keys: collections.abc.Sequence[tuple[int, bool, bool]],
+        length: int,
+        as_str: bool,
+        /,
+    ) -> typing.Union[list[abc_progressbars.ProgressbarAware[typing.Any]], list[str]]:
+        sig = self._signature
+
+        if as_str:
+            table = self._render_tables.get(length)
+            renders: dict[tuple[int, bool, bool], str] = {}
+            for filled, start_filled, end_filled in set(keys):
+                renders[filled, start_filled, end_filled] = (
+                    table.get_capped(filled, start_filled=start_filled, end_filled=end_filled)
+                    if table is not None and 0 <= filled <= length
+                    else _render_capped(sig, filled, length, start_filled, end_filled)
+                )
+            return [renders[key] for key in keys]
+
+        progressbars_: list[abc_progressbars.ProgressbarAware[typing.Any]] = []
+        if self._writes_compact:
+            progressbars_.extend(self._write_capped(*key, length) for key in keys)
+            return progressbars_
+
+        # Names are computed once for every distinct filled count & `start` & `end` chars.
+        sector_cls = self._sector_cls
+        names = {key: _capped_names(sig, key[0], length, key[1], key[2]) for key in set(keys)}
+
+        if self._writes_flyweights:
+            shared_sectors = {
+                key: [sector_cls(name, position < key[0], -1) for position, name in enumerate(key_names)]
+                for key, key_names in names.items()
+            }
+            for key in keys:
+                progressbar = self._progressbar_cls()
+                for sector in shared_sectors[key]:
+                    progressbar.add_sector(sector)
+                progressbars_.append(progressbar)
+            return progressbars_
+
+        for key in keys:
+            filled = key[0]
+            progressbar = self._progressbar_cls()
+            for position, name in enumerate(names[key]):
+                progressbar.add_sector(sector_cls(name, position < filled, position))
+            progressbars_.append(progressbar)
+
+        return progressbars_
+
+    def _get_snapshot(self, filled: int, length: int, /) -> caches.RenderSnapshot:
+        assert self._render_cache is not None
+        sig = self._signature
+        # Snapshot holds strong reference to signature, so its id
+        # cannot be reused while the entry is alive.
+        key = (signatures.signature_key(sig), length, filled, id(self._sector_cls))
+
+        snapshot = self._render_cache.get(key)
+        if snapshot is None:
+            snapshot = self._render_cache.put(
+                key,
+                caches.RenderSnapshot.from_signature(sig, length=length, filled=filled, sector_cls=self._sector_cls),
+            )
+
+        return snapshot
+
     def bind_signature(
         self,
         signature: abc_signatures.ProgressbarSignatureProtocol,
         /,
+        *,
+        precompute_lengths: collections.abc.Iterable[int] = (),
     ) -> ProgressbarWriter:
         """Sets new progressbar signature.
 
@@ -144,6 +1045,13 @@ class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
         ----------
         signature : abc_signatures.ProgressbarSignatureProtocol, /
             New signature to set.
+        precompute_lengths : collections.abc.Iterable[int] = (), *
+            Progressbar lengths to precompute render tables for.
+            Tables are shared through `caches.RENDER_TABLES`, so
+            they are built once per process.
+
+            !!! info
+                Render tables for previous signature are dropped.
 
         Returns
         -------
@@ -151,6 +1059,15 @@ class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
             Progressbar writer object to allow fluent-style.
         """
         self._signature = signature
+        self._render_functions = {}
+        self._render_tables = {
+            length: caches.RenderTable.for_signature(
+                signature,
+                length=length,
+                calculation_cls=self._calculation_service,
+            )
+            for length in precompute_lengths
+        }
         return self
 
     @property
@@ -192,3 +1109,55 @@ class ProgressbarWriter(abc_writers.ProgressbarWriterAware):
             Calculation cls.
         """
         return self._calculation_service
+
+    @property
+    def render_cache(
+        self,
+    ) -> typing.Optional[abc_caches.RenderCacheAware[progress_types.RenderCacheKeyType, caches.RenderSnapshot]]:
+        """
+        Returns
+        -------
+        typing.Optional[abc_caches.RenderCacheAware[...]]
+            Cache of rendered snapshots, if configured.
+        """
+        return self._render_cache
+
+    @property
+    def render_tables(self) -> collections.abc.Mapping[int, caches.RenderTable]:
+        """
+        Returns
+        -------
+        collections.abc.Mapping[int, caches.RenderTable]
+            Precomputed render tables of bound signature by progressbar length.
+        """
+        return self._render_tables
+
+    @property
+    def capped(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            Whether progressbar `start` & `end` chars are rendered by writer.
+        """
+        return self._capped
+
+    @property
+    def first_fill(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Progress percentage from which `start` char is filled in capped mode.
+        """
+        return self._first_fill
+
+    @property
+    def last_fill(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Progress percentage from which `end` char is filled in capped mode.
+        """
+        return self._last_fill
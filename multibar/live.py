@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module implements live rendering of progressbars in console."""
+from __future__ import annotations
+
+__all__ = ("FrameCompositor", "LiveRenderer")
+
+import collections.abc
+import sys
+import time
+import typing
+
+from returns.io import IO
+
+from . import utils
+from .impl import clients as clients_
+
+if typing.TYPE_CHECKING:
+    from multibar.api import clients
+
+_CLEAR_LINE: typing.Final[str] = "\x1b[2K"
+"""ANSI sequence that clears current line."""
+
+_CURSOR_PREVIOUS_LINE: typing.Final[str] = "\x1b[{}F"
+"""ANSI sequence that moves cursor to the beginning of N-th previous line."""
+
+_CURSOR_NEXT_LINE: typing.Final[str] = "\x1b[{}E"
+"""ANSI sequence that moves cursor to the beginning of N-th next line."""
+
+
+class FrameCompositor:
+    """Class that lays out progressbars into frames and draws them in place.
+
+    Every frame is emitted with a single `write()` call, and only lines
+    whose content changed since the previous frame are rewritten via
+    cursor movement.
+
+    !!! warning
+        Frame height never shrinks: lines that are missing in the next
+        frame are cleared, but remain in place.
+
+    ??? example "Expand example of usage"
+        ```py
+        from multibar.live import FrameCompositor
+
+        compositor = FrameCompositor()
+        compositor.draw(compositor.layout([("shard-1", "+++---", 50.0), ("shard-2", "++++++", 100.0)]))
+        compositor.draw(compositor.layout([("shard-1", "++++--", 66.6), ("shard-2", "++++++", 100.0)]))  # Rewrites 1 line.
+        compositor.close()
+        ```
+    """
+
+    __slots__ = ("_stream", "_show_labels", "_show_percentage", "_lines", "_cursor_row")
+
+    def __init__(
+        self,
+        *,
+        stream: typing.Optional[typing.TextIO] = None,
+        show_labels: bool = True,
+        show_percentage: bool = True,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        stream : typing.Optional[typing.TextIO] = None, *
+            Stream to draw frames in, `sys.stdout` by default.
+        show_labels : bool = True, *
+            If True, lays out labels before progressbars.
+        show_percentage : bool = True, *
+            If True, lays out percentage after progressbars.
+        """
+        self._stream = utils.none_or(sys.stdout, stream)
+        self._show_labels = show_labels
+        self._show_percentage = show_percentage
+        self._lines: list[str] = []
+        self._cursor_row = 0
+
+    def layout(self, rows: collections.abc.Iterable[tuple[str, str, float]], /) -> list[str]:
+        """Lays out rows into frame lines with aligned labels.
+
+        Parameters
+        ----------
+        rows : collections.abc.Iterable[tuple[str, str, float]], /
+            Rows of label, string representation of progressbar and progress percentage.
+
+        Returns
+        -------
+        list[str]
+            Frame lines.
+        """
+        rows = list(rows)
+        label_width = max((len(label) for label, _, _ in rows), default=0) if self._show_labels else 0
+        lines: list[str] = []
+
+        for label, progressbar, percentage in rows:
+            line = progressbar
+            if label_width:
+                line = label.ljust(label_width) + " " + line
+            if self._show_percentage:
+                line += f" {percentage:5.1f}%"
+            lines.append(line)
+
+        return lines
+
+    def draw(self, lines: collections.abc.Sequence[str], /) -> int:
+        """Draws frame, rewriting only changed lines.
+
+        Parameters
+        ----------
+        lines : collections.abc.Sequence[str], /
+            Frame lines.
+
+        Returns
+        -------
+        int
+            Count of rewritten lines, frame is not written if it equals to 0.
+        """
+        old_lines = self._lines
+        old_height, height = len(old_lines), max(len(old_lines), len(lines))
+        frame: list[str] = []
+        rewritten = 0
+        row = self._cursor_row
+
+        for index in range(height):
+            line = lines[index] if index < len(lines) else ""
+            if index < old_height:
+                if old_lines[index] == line:
+                    continue
+                if index < row:
+                    frame.append(_CURSOR_PREVIOUS_LINE.format(row - index))
+                elif index > row:
+                    frame.append(_CURSOR_NEXT_LINE.format(index - row))
+                else:
+                    frame.append("\r")
+                frame.append(_CLEAR_LINE + line)
+                old_lines[index] = line
+            else:
+                # New lines are appended below the last drawn line.
+                if old_height and row < old_height - 1:
+                    frame.append(_CURSOR_NEXT_LINE.format(old_height - 1 - row))
+                    row = old_height - 1
+                frame.append(("\n" if index else "\r") + line)
+                old_lines.append(line)
+            row = index
+            rewritten += 1
+
+        if frame:
+            self._stream.write("".join(frame))
+            self._stream.flush()
+            self._cursor_row = row
+
+        return rewritten
+
+    def close(self) -> IO[None]:
+        """Moves cursor below drawn frame and forgets it.
+
+        Returns
+        -------
+        IO[None]
+            Moves cursor in console.
+        """
+        if self._lines:
+            row = self._cursor_row
+            last_row = len(self._lines) - 1
+            self._stream.write((_CURSOR_NEXT_LINE.format(last_row - row) if row < last_row else "") + "\n")
+            self._stream.flush()
+            self._lines.clear()
+            self._cursor_row = 0
+
+        return IO(None)
+
+    @property
+    def lines(self) -> collections.abc.Sequence[str]:
+        """
+        Returns
+        -------
+        collections.abc.Sequence[str]
+            Lines of the last drawn frame.
+        """
+        return self._lines
+
+
+class LiveRenderer:
+    """Class that owns progressbars and redraws them in place.
+
+    Redraws are capped at `fps` frames per second, updates between frames
+    are coalesced, so only the latest progress of every progressbar is rendered.
+    Frames are drawn by `FrameCompositor`, so only changed lines are rewritten.
+
+    ??? example "Expand example of usage"
+        ```py
+        from multibar.live import LiveRenderer
+
+        with LiveRenderer(fps=10) as renderer:
+            for i in range(1_000_000):
+                renderer.update("download", i, 1_000_000)  # Redraws at most 10 times per second.
+        ```
+    """
+
+    __slots__ = (
+        "_client",
+        "_compositor",
+        "_length",
+        "_interval",
+        "_clock",
+        "_next_frame_at",
+        "_pending",
+        "_rows",
+    )
+
+    def __init__(
+        self,
+        client: typing.Optional[clients.ProgressbarClientAware] = None,
+        /,
+        *,
+        fps: float = 10.0,
+        length: int = 20,
+        compositor: typing.Optional[FrameCompositor] = None,
+        clock: typing.Optional[typing.Callable[[], float]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        client : typing.Optional[clients.ProgressbarClientAware] = None, /
+            Client to generate progressbars with, `ProgressbarClient()` by default.
+        fps : float = 10.0, *
+            Maximum count of frames per second.
+        length : int = 20, *
+            Length of progressbars.
+        compositor : typing.Optional[FrameCompositor] = None, *
+            Compositor to draw frames with, `FrameCompositor()` by default.
+        clock : typing.Optional[typing.Callable[[], float]] = None, *
+            Monotonic clock in seconds, `time.monotonic` by default.
+
+        Raises
+        ------
+        ValueError
+            If `fps` is not positive.
+        """
+        if fps <= 0:
+            raise ValueError("Frames per second must be more than 0.")
+
+        self._client = utils.none_or(clients_.ProgressbarClient(), client)
+        self._compositor = utils.none_or(FrameCompositor(), compositor)
+        self._length = length
+        self._interval = 1 / fps
+        self._clock = utils.none_or(time.monotonic, clock)
+        self._next_frame_at = 0.0
+        self._pending: dict[collections.abc.Hashable, tuple[int, int]] = {}
+        self._rows: dict[collections.abc.Hashable, tuple[str, str, float]] = {}
+
+    def __enter__(self) -> LiveRenderer:
+        return self
+
+    def __exit__(self, *_: typing.Any) -> None:
+        self.close()
+
+    def update(self, key: collections.abc.Hashable, start_value: int, end_value: int, /) -> None:
+        """Updates progress of progressbar, that will be drawn in the next frame.
+
+        !!! info
+            New keys are drawn below already drawn progressbars,
+            `str(key)` is used as label.
+
+        Parameters
+        ----------
+        key : collections.abc.Hashable, /
+            Progressbar identifier.
+        start_value : int, /
+            Start value (current progress).
+        end_value : int, /
+            End value (needed progress).
+
+        Returns
+        -------
+        None
+        """
+        self._pending[key] = (start_value, end_value)
+        if self._clock() >= self._next_frame_at:
+            self.refresh()
+
+    def refresh(self) -> IO[None]:
+        """Draws frame with pending updates regardless of frames per second cap.
+
+        Returns
+        -------
+        IO[None]
+            Displays frame in console.
+        """
+        client, length = self._client, self._length
+        get_percentage = client.writer.calculation_cls.get_progress_percentage
+        for key, (start_value, end_value) in self._pending.items():
+            self._rows[key] = (
+                str(key),
+                client.get_progress_str(start_value, end_value, length=length),
+                get_percentage(start_value, end_value),
+            )
+
+        self._pending.clear()
+        compositor = self._compositor
+        compositor.draw(compositor.layout(self._rows.values()))
+        self._next_frame_at = self._clock() + self._interval
+        return IO(None)
+
+    def close(self) -> IO[None]:
+        """Draws pending updates and moves cursor below drawn progressbars.
+
+        Returns
+        -------
+        IO[None]
+            Displays frame in console.
+        """
+        if self._pending:
+            self.refresh()
+
+        self._rows.clear()
+        return self._compositor.close()
+
+    @property
+    def fps(self) -> float:
+        """
+        Returns
+        -------
+        float
+            Maximum count of frames per second.
+        """
+        return 1 / self._interval
+
+    @property
+    def compositor(self) -> FrameCompositor:
+        """
+        Returns
+        -------
+        FrameCompositor
+            Compositor that draws frames.
+        """
+        return self._compositor
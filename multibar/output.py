@@ -19,15 +19,21 @@ from __future__ import annotations
 __all__ = (
     "PrinterAware",
     "TermcolorPrinter",
+    "BufferedPrinter",
     "print",
     "new_line",
     "print_success",
     "print_warning",
     "print_heading",
     "print_error",
+    "flush",
+    "batch",
 )
 
 import abc
+import collections.abc
+import contextlib
+import sys
 import typing
 
 import termcolor
@@ -143,6 +149,16 @@ class PrinterAware(abc.ABC):
         """
         ...
 
+    def flush(self) -> IO[None]:
+        """Flushes buffered output, if printer buffers it.
+
+        Returns
+        -------
+        IO[None]
+            Displays buffered text in console.
+        """
+        return IO(None)
+
 
 class TermcolorPrinter(PrinterAware):
     """Implementation of printer interface."""
@@ -186,6 +202,119 @@ class TermcolorPrinter(PrinterAware):
         return IO(None)
 
 
+class BufferedPrinter(PrinterAware):
+    """Implementation of printer interface, that accumulates output in memory
+    and writes it to the stream at once.
+
+    ANSI prefix and suffix are built only once per `(color, bold)` combination.
+
+    !!! info
+        Output is flushed when `flush_threshold` lines are buffered, or explicitly
+        via `flush()`. `multibar.output` functions flush printer after every call,
+        or once on exit from `output.batch()`, so headings and broken contract
+        reports are written with a single call.
+
+    ??? example "Expand example of usage"
+        ```py
+        from multibar import output, settings
+
+        settings.settings.configure(PRINTER=output.BufferedPrinter())
+        ```
+    """
+
+    __slots__ = ("_stream", "_flush_threshold", "_buffer", "_buffered_lines", "_styles")
+
+    def __init__(self, stream: typing.Optional[typing.TextIO] = None, /, *, flush_threshold: int = 64) -> None:
+        """
+        Parameters
+        ----------
+        stream : typing.Optional[typing.TextIO] = None, /
+            Stream to write output in, current `sys.stdout` by default.
+        flush_threshold : int = 64, *
+            Count of buffered lines, after which output is flushed.
+        """
+        self._stream = stream
+        self._flush_threshold = flush_threshold
+        self._buffer: list[str] = []
+        self._buffered_lines = 0
+        self._styles: dict[tuple[typing.Optional[str], bool], tuple[str, str]] = {}
+
+    def _style(self, color: typing.Optional[str], bold: bool, /) -> tuple[str, str]:
+        try:
+            return self._styles[color, bold]
+        except KeyError:
+            # Derived from termcolor, so colors are disabled the same way.
+            prefix, _, suffix = termcolor.colored("\0", color, attrs=["bold"] if bold else None).partition("\0")
+            style = self._styles[color, bold] = (prefix, suffix)
+            return style
+
+    def print(
+        self,
+        text: str = "",
+        *,
+        bold: bool = False,
+        color: typing.Optional[str] = None,
+        newline: bool = True,
+    ) -> IO[None]:
+        """Prints text in console.
+
+        !!! note
+            Documentation duplicated for mkdocs auto-reference
+            plugin.
+
+        Parameters
+        ----------
+        text : str = ""
+            Text to print.
+        bold : bool = False
+            If true, will make text bold.
+        color : typing.Optional[str] = None
+            Changes text output color.
+        newline : bool = True
+            If true, will print new line after `text`.
+
+        Returns
+        -------
+        IO[None]
+            Displays text in console.
+        """
+        prefix, suffix = self._style(color, bold)
+        self._buffer.append(prefix + text + suffix + "\n" if newline else prefix + text + suffix)
+        self._buffered_lines += newline + text.count("\n")
+
+        if self._buffered_lines >= self._flush_threshold:
+            self.flush()
+
+        return IO(None)
+
+    def flush(self) -> IO[None]:
+        """Writes buffered output to the stream.
+
+        Returns
+        -------
+        IO[None]
+            Displays buffered text in console.
+        """
+        if self._buffer:
+            stream = utils.none_or(sys.stdout, self._stream)
+            stream.write("".join(self._buffer))
+            stream.flush()
+            self._buffer.clear()
+            self._buffered_lines = 0
+
+        return IO(None)
+
+    @property
+    def buffer(self) -> collections.abc.Sequence[str]:
+        """
+        Returns
+        -------
+        collections.abc.Sequence[str]
+            Buffered output chunks.
+        """
+        return self._buffer
+
+
 _PRINTER_STATE: typing.Final[PrinterAware] = TermcolorPrinter()
 
 
@@ -202,6 +331,46 @@ class Output:
         maintain the logic of the project.
     """
 
+    def __init__(self) -> None:
+        self._batch_depth = 0
+
+    @contextlib.contextmanager
+    def batch(self) -> typing.Iterator[None]:
+        """Context manager that flushes printer only once on exit, even if nested.
+
+        ??? example "Expand example of usage"
+            ```py
+            from multibar import output
+
+            with output.batch():
+                output.print_heading("Report", level=1)
+                output.print_success("Checks passed: N.")  # Printer is flushed after this line.
+            ```
+
+        Returns
+        -------
+        typing.Iterator[None]
+            Context manager.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self.flush()
+
+    def flush(self) -> IO[None]:
+        """Flushes printer output, unless it is inside of `batch()`.
+
+        Returns
+        -------
+        IO[None]
+            Displays buffered text in console.
+        """
+        if not self._batch_depth:
+            self.printer.flush()
+        return IO(None)
+
     def print(
         self,
         text: str = "",
@@ -235,7 +404,7 @@ class Output:
             color=color,
             newline=newline,
         )
-        return IO(None)
+        return self.flush()
 
     def new_line(self) -> IO[None]:
         """Prints new line in console.
@@ -246,7 +415,7 @@ class Output:
             Displays text in console.
         """
         self.printer.print()
-        return IO(None)
+        return self.flush()
 
     def print_heading(
         self,
@@ -279,14 +448,15 @@ class Output:
         line_char, show_line_above = HEADING_MAP[level]
         heading_line = line_char * len(text)
 
-        if show_line_above:
-            self.printer.print(heading_line, bold=True, color=color)
+        with self.batch():
+            if show_line_above:
+                self.printer.print(heading_line, bold=True, color=color)
 
-        self.printer.print(text, bold=True, color=color)
-        self.printer.print(heading_line, bold=True, color=color)
+            self.printer.print(text, bold=True, color=color)
+            self.printer.print(heading_line, bold=True, color=color)
 
-        if indent:
-            self.printer.print()
+            if indent:
+                self.printer.print()
 
         return IO(None)
 
@@ -306,7 +476,7 @@ class Output:
             Displays text in console.
         """
         self.printer.print(text, color=COLORS[SUCCESS], bold=bold)
-        return IO(None)
+        return self.flush()
 
     def print_error(self, text: str, /, *, bold: bool = True) -> IO[None]:
         """Prints text as error.
@@ -324,7 +494,7 @@ class Output:
             Displays text in console.
         """
         self.printer.print(text, color=COLORS[ERROR], bold=bold)
-        return IO(None)
+        return self.flush()
 
     def print_warning(self, text: str, /) -> IO[None]:
         """Prints text as warning.
@@ -340,7 +510,7 @@ class Output:
             Displays text in console.
         """
         self.printer.print(text, color=COLORS[WARNING])
-        return IO(None)
+        return self.flush()
 
     def update_printer(self) -> None:
         """Updates cache for printer cached_property.
@@ -405,3 +575,9 @@ print_error = _output.print_error
 
 print_warning = _output.print_warning
 """Prints text as warning."""
+
+flush = _output.flush
+"""Flushes printer output."""
+
+batch = _output.batch
+"""Flushes printer only once for all output inside of context manager."""
@@ -16,32 +16,52 @@
 """Python-Multibar project types."""
 from __future__ import annotations
 
-__all__ = ("ProgressMetadataType",)
+__all__ = ("ProgressMetadataType", "ProgressBatchMetadataType")
 
+import collections.abc
 import typing
 
-import typing_extensions
-
 if typing.TYPE_CHECKING:
+    import decimal
+    import fractions
+
+    import typing_extensions
+
     from multibar.api import calculation_service, progressbars, sectors, signatures
 
 
-HookSignatureType: typing_extensions.TypeAlias = typing.Callable[..., typing.Optional[bool]]
+HookSignatureType: typing_extensions.TypeAlias = typing.Callable[
+    ..., typing.Union[typing.Optional[bool], typing.Awaitable[typing.Optional[bool]]]
+]
 """Type for hook callable signature.
 
 !!! info
     By default hook callable accepts `*args` and `**kwargs` parameters.
+    Coroutine functions are awaited only by asynchronous clients.
 """
 
+ContractGuardType: typing_extensions.TypeAlias = typing.Callable[[int, int, int], bool]
+"""Type for compiled contract check of `(start_value, end_value, length)`,
+returns True if contract is kept."""
+
+RenderFunctionType: typing_extensions.TypeAlias = typing.Callable[[int, int], str]
+"""Type for compiled render function of `(start_value, end_value)`."""
+
+ExactNumberType: typing_extensions.TypeAlias = typing.Union[int, float, "fractions.Fraction", "decimal.Decimal"]
+"""Type for values, that `ExactCalculationService` computes without float conversion."""
+
+RenderCacheKeyType: typing_extensions.TypeAlias = tuple[int, int, int, int]
+"""Type for render cache keys: `(signature_key(signature), length, filled count, id(sector_cls))`."""
+
 
 class ProgressMetadataType(typing.TypedDict, total=False):
     """Progress metadata type for hooks triggering."""
 
-    start_value: int
-    """Start value (current progress)."""
+    start_value: typing.Union[int, float]
+    """Start value (current progress), ratio or percentage for scaled progresses."""
 
-    end_value: int
-    """End value (needed progress)."""
+    end_value: typing.Union[int, float]
+    """End value (needed progress), 1 or 100 for scaled progresses."""
 
     length: int
     """Length of progressbar."""
@@ -54,3 +74,25 @@ class ProgressMetadataType(typing.TypedDict, total=False):
 
     calculation_service_cls: typing.Type[calculation_service.AbstractCalculationService]
     """Math operations cls."""
+
+
+class ProgressBatchMetadataType(typing.TypedDict, total=False):
+    """Progress metadata type for batch hooks triggering and contract checks."""
+
+    start_values: collections.abc.Sequence[typing.Union[int, float]]
+    """Start values (current progresses), ratios or percentages for scaled progresses."""
+
+    end_values: collections.abc.Sequence[typing.Union[int, float]]
+    """End values (needed progresses), 1 or 100 for scaled progresses."""
+
+    length: int
+    """Length of progressbars."""
+
+    sig: signatures.ProgressbarSignatureProtocol
+    """Progressbars signature."""
+
+    progressbars: typing.Optional[collections.abc.Sequence[progressbars.ProgressbarAware[sectors.AbstractSector]]]
+    """Progressbar instances."""
+
+    calculation_service_cls: typing.Type[calculation_service.AbstractCalculationService]
+    """Math operations cls."""
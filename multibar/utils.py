@@ -16,8 +16,9 @@
 """Python-Multibar project utilities."""
 from __future__ import annotations
 
-__all__ = ("Singleton", "cached_property", "none_or")
+__all__ = ("Singleton", "TrackedList", "cached_property", "none_or", "ratio_progress")
 
+import functools
 import threading
 import typing
 
@@ -30,6 +31,9 @@ _ActualT = typing.TypeVar("_ActualT")
 _AlternativeT = typing.TypeVar("_AlternativeT")
 """Alternative value that will be returned if `_ActualT` is None."""
 
+_ItemT = typing.TypeVar("_ItemT")
+"""Item of tracked list."""
+
 _SINGLETON_LOCK: typing.Final[threading.Lock] = threading.Lock()
 """Lock for accessing to singleton instances."""
 
@@ -64,6 +68,29 @@ def none_or(
     return alternative if actual is None else actual
 
 
+def ratio_progress(ratio: float, length: int, /) -> tuple[int, int]:
+    """Converts ratio to integer start & end values, that fill the same count
+    of progressbar sectors.
+
+    !!! info
+        Ratio is clamped to `[0, 1]`, so out-of-range ratios give empty
+        or full progressbars.
+
+    Parameters
+    ----------
+    ratio : float, /
+        Progress ratio, from 0 to 1.
+    length : int, /
+        Length of progressbar.
+
+    Returns
+    -------
+    tuple[int, int]
+        Start value (filled sectors count) and end value (progressbar length).
+    """
+    return round(min(max(ratio, 0.0), 1.0) * length), length
+
+
 class cached_property:
     """Simple cached property implementation that sets in `self.__dict__`
     function callback by `function.__name__` key.
@@ -139,6 +166,68 @@ class cached_property:
         del state.__dict__[prop_name]
 
 
+class TrackedList(list[_ItemT]):
+    """List that counts its changes, so owners that expose it can
+    detect mutations made by callers.
+
+    ??? example "Expand example of usage"
+        ```py
+        >>> items = TrackedList([1, 2])
+        >>> items.append(3)
+        >>> items.revision
+        1
+        >>> items == [1, 2, 3]
+        True
+        ```
+
+    Attributes
+    ----------
+    revision : int
+        Counter of list changes.
+    """
+
+    __slots__ = ("revision",)
+
+    def __init__(self, iterable: typing.Iterable[_ItemT] = (), /) -> None:
+        """
+        Parameters
+        ----------
+        iterable : typing.Iterable[_ItemT] = (), /
+            Initial items.
+        """
+        super().__init__(iterable)
+        self.revision = 0
+
+
+def _tracked(method: typing.Callable[..., typing.Any], /) -> typing.Callable[..., typing.Any]:
+    @functools.wraps(method)
+    def wrapper(self: TrackedList[typing.Any], *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        self.revision += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _method_name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+):
+    # Every mutating method of list bumps revision before changing it.
+    setattr(TrackedList, _method_name, _tracked(getattr(list, _method_name)))
+
+del _method_name
+
+
 class Singleton(type):
     """Metaclass that implements Singleton pattern.
 
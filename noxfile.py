@@ -1,3 +1,4 @@
+import os
 import typing
 
 import nox
@@ -5,9 +6,10 @@ import nox
 MAIN_PKG: typing.Final[str] = "multibar"
 TESTS_PKG: typing.Final[str] = "tests"
 EXAMPLES_PKG: typing.Final[str] = "examples"
+BENCHMARKS_PKG: typing.Final[str] = "benchmarks"
 
-NOX_PKGS: typing.Final[tuple[str, ...]] = (MAIN_PKG, TESTS_PKG, EXAMPLES_PKG)
-RUN_BLACK_ON_PKGS: typing.Final[tuple[str, ...]] = (MAIN_PKG, EXAMPLES_PKG)
+NOX_PKGS: typing.Final[tuple[str, ...]] = (MAIN_PKG, TESTS_PKG, EXAMPLES_PKG, BENCHMARKS_PKG)
+RUN_BLACK_ON_PKGS: typing.Final[tuple[str, ...]] = (MAIN_PKG, EXAMPLES_PKG, BENCHMARKS_PKG)
 
 BASE_REQUIREMENTS: typing.Final[tuple[str, ...]] = ("-r", "requirements.txt")
 DEV_REQUIREMENTS: typing.Final[tuple[str, ...]] = ("-r", "dev-requirements.txt")
@@ -36,9 +38,26 @@ def reformat_code(session: nox.Session) -> None:
 
 @nox.session(reuse_venv=True)
 def mypy(session: nox.Session) -> None:
-    """Checks `multibar` package for type-hint errors."""
+    """Checks `multibar` and `benchmarks` packages for type-hint errors."""
 
     session.install(*DEV_REQUIREMENTS)
     session.install(*BASE_REQUIREMENTS)
 
-    session.run("mypy", "-p", "multibar", "--config", "pyproject.toml")
+    session.run("mypy", "-p", MAIN_PKG, "--config", "pyproject.toml")
+    session.run("mypy", BENCHMARKS_PKG, "--config", "pyproject.toml")
+
+
+@nox.session(reuse_venv=True)
+def benchmark(session: nox.Session) -> None:
+    """Runs benchmarks and fails on regressions against `benchmarks/baseline.json`.
+
+    Baseline holds absolute timings of the machine it was recorded on, so regenerate it
+    locally before comparing: `nox -s benchmark -- --update`.
+    """
+
+    session.install(*DEV_REQUIREMENTS)
+    session.install(*BASE_REQUIREMENTS)
+
+    results = os.path.join(session.create_tmp(), "benchmarks.json")
+    session.run("pytest", BENCHMARKS_PKG, "--benchmark-group-by=param", f"--benchmark-json={results}")
+    session.run("python", os.path.join(BENCHMARKS_PKG, "compare.py"), results, *session.posargs)
@@ -13,11 +13,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from hamcrest import assert_that, equal_to
+from hamcrest import assert_that, equal_to, instance_of
 
 from multibar.impl.clients import ProgressbarClient
 from multibar.impl.hooks import WRITER_HOOKS
+from multibar.impl.progressbars import CompactProgressbar, Progressbar
 from multibar.impl.signatures import SimpleSignature
+from multibar.impl.writers import ProgressbarWriter
 
 SIG = SimpleSignature()  # Default signature
 
@@ -37,3 +39,65 @@ def test_progress_writer_hook() -> None:
     assert_that(progressbar[3].name, equal_to(SIG.middle.on_unfilled))
     assert_that(progressbar[4].name, equal_to(SIG.middle.on_unfilled))
     assert_that(progressbar[5].name, equal_to(SIG.end.on_unfilled))
+
+
+def test_render_table_matches_writer_hook() -> None:
+    writer = ProgressbarWriter.from_signature(SIG, precompute_lengths=(6,))
+    client = ProgressbarClient(progress_writer=writer)
+    client.set_hooks(WRITER_HOOKS)
+
+    for start_value in range(101):
+        assert_that(
+            writer.render_tables[6].render(start_value, 100),
+            equal_to(repr(client.get_progress(start_value, 100, length=6))),
+        )
+
+
+def test_compact_progressbar_with_writer_hook() -> None:
+    client = ProgressbarClient()
+    client.set_hooks(WRITER_HOOKS)
+
+    compact_client = ProgressbarClient(progress_writer=ProgressbarWriter(progressbar_cls=CompactProgressbar))
+    compact_client.set_hooks(WRITER_HOOKS)
+
+    for start_value in range(101):
+        progressbar = client.get_progress(start_value, 100, length=6)
+        compact_progressbar = compact_client.get_progress(start_value, 100, length=6)
+
+        assert_that(compact_progressbar, instance_of(CompactProgressbar))
+        assert_that(repr(compact_progressbar), equal_to(repr(progressbar)))
+        assert_that(
+            [(s.name, s.is_filled, s.position) for s in compact_progressbar.sectors],
+            equal_to([(s.name, s.is_filled, s.position) for s in progressbar.sectors]),
+        )
+
+
+def test_progress_writer_hook_for_batch() -> None:
+    client = ProgressbarClient()
+    client.set_hooks(WRITER_HOOKS)
+
+    start_values = list(range(101))
+    progressbars = client.get_progress_many(start_values, [100] * len(start_values), length=6)
+
+    assert_that(
+        [repr(progressbar) for progressbar in progressbars],
+        equal_to([repr(client.get_progress(start_value, 100, length=6)) for start_value in start_values]),
+    )
+
+
+def test_update_matches_writer_hook() -> None:
+    for progressbar_cls in (Progressbar, CompactProgressbar):
+        writer = ProgressbarWriter(progressbar_cls=progressbar_cls)
+        client = ProgressbarClient(progress_writer=writer, hooks=WRITER_HOOKS)
+        progressbar = client.get_progress(0, 100, length=6)
+
+        for start_value in (*range(101), *range(100, -1, -7)):
+            previous = [(s.name, s.is_filled) for s in progressbar]
+            changed = writer.update(progressbar, start_value, 100, capped=True)
+            expected = client.get_progress(start_value, 100, length=6)
+
+            assert_that(repr(progressbar), equal_to(repr(expected)))
+            assert_that([s.is_filled for s in progressbar], equal_to([s.is_filled for s in expected]))
+            for position, (sector, old_state) in enumerate(zip(progressbar, previous)):
+                if (sector.name, sector.is_filled) != old_state:
+                    assert_that(position in changed, equal_to(True))
@@ -19,7 +19,7 @@ from hamcrest import assert_that, equal_to, has_length, has_properties, not_
 
 from multibar.api.sectors import AbstractSector
 from multibar.impl.progressbars import Progressbar
-from multibar.impl.sectors import Sector
+from multibar.impl.sectors import FrozenSector, Sector
 
 _T = typing.TypeVar("_T")
 
@@ -110,3 +110,13 @@ def test_map() -> None:
         ),
     )
     assert_that(first_sector.extended_method(), equal_to(len(first_sector._name)))
+
+
+def test_replace_display_name_for_frozen_sectors() -> None:
+    sector = FrozenSector("name", True)
+    progressbar_state = Progressbar()
+    progressbar_state.add_sector(sector).add_sector(sector)
+
+    progressbar_state.replace_display_name_for(0, "new_name")
+    assert_that(progressbar_state[0].name, equal_to("new_name"))
+    assert_that(progressbar_state[1].name, equal_to("name"))
@@ -13,11 +13,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from hamcrest import assert_that, instance_of
+import pytest
+from hamcrest import (
+    assert_that,
+    equal_to,
+    has_length,
+    has_properties,
+    instance_of,
+    is_not,
+)
 
+from multibar.impl.caches import LRURenderCache
 from multibar.impl.calculation_service import ProgressbarCalculationService
-from multibar.impl.progressbars import Progressbar
-from multibar.impl.sectors import Sector
+from multibar.impl.progressbars import CompactProgressbar, Progressbar
+from multibar.impl.sectors import FrozenSector, Sector
 from multibar.impl.signatures import SimpleSignature
 from multibar.impl.writers import ProgressbarWriter
 from tests.impl.calculation_service import FakeCalculationService
@@ -54,3 +63,77 @@ class TestProgressWriterConfiguration:
         progressbar = writer_state.write(50, 100)
 
         assert_that(progressbar, instance_of(Progressbar))
+
+    def test_write_progress_with_render_cache(self) -> None:
+        writer_state = ProgressbarWriter(sector_cls=FrozenSector, render_cache=LRURenderCache(maxsize=8))
+        uncached_writer_state = ProgressbarWriter()
+
+        for start_value in range(100):
+            assert_that(
+                repr(writer_state.write(start_value, 100, length=6)),
+                equal_to(repr(uncached_writer_state.write(start_value, 100, length=6))),
+            )
+
+        # Progressbar of length 6 can be rendered only in 7 different ways.
+        assert_that(writer_state.render_cache.stats(), has_properties({"misses": 7, "hits": 93}))
+
+        # Cached results are independent of each other.
+        first_progressbar = writer_state.write(50, 100, length=6)
+        second_progressbar = writer_state.write(50, 100, length=6)
+        first_progressbar.replace_display_name_for(0, "#")
+        assert_that(repr(second_progressbar), is_not(equal_to(repr(first_progressbar))))
+
+        # Mutable sectors cannot be shared, so cache is not used for them.
+        mutable_writer_state = ProgressbarWriter(render_cache=LRURenderCache(maxsize=8))
+        mutable_writer_state.write(50, 100, length=6)
+        assert_that(mutable_writer_state.render_cache, has_length(0))
+
+    def test_write_str(self) -> None:
+        writers = (
+            ProgressbarWriter(),
+            ProgressbarWriter(render_cache=LRURenderCache(maxsize=8)),
+            ProgressbarWriter.from_signature(SimpleSignature(), precompute_lengths=(6,)),
+        )
+
+        for writer_state in writers:
+            for start_value in range(101):
+                assert_that(
+                    writer_state.write_str(start_value, 100, length=6),
+                    equal_to(repr(writer_state.write(start_value, 100, length=6))),
+                )
+
+    def test_write_many(self) -> None:
+        start_values = range(101)
+        end_values = [100] * 101
+        writers = (
+            ProgressbarWriter(),
+            ProgressbarWriter(render_cache=LRURenderCache(maxsize=8)),
+            ProgressbarWriter(sector_cls=FrozenSector),
+            ProgressbarWriter(progressbar_cls=CompactProgressbar),
+            ProgressbarWriter.from_signature(SimpleSignature(), precompute_lengths=(6,)),
+        )
+
+        for writer_state in writers:
+            expected = [repr(writer_state.write(s, e, length=6)) for s, e in zip(start_values, end_values)]
+            progressbars = writer_state.write_many(start_values, end_values, length=6)
+
+            assert_that([repr(progressbar) for progressbar in progressbars], equal_to(expected))
+            # Iterables are accepted as well as sequences.
+            assert_that(
+                writer_state.write_many(iter(start_values), iter(end_values), length=6, as_str=True),
+                equal_to(expected),
+            )
+
+        # Progressbars are independent of each other.
+        first_progressbar, second_progressbar = ProgressbarWriter().write_many([50, 50], [100, 100], length=6)
+        first_progressbar.replace_display_name_for(0, "#")
+        assert_that(repr(second_progressbar), equal_to("+++---"))
+
+    def test_write_many_with_arrays(self) -> None:
+        numpy = pytest.importorskip("numpy")
+        writer_state = ProgressbarWriter()
+
+        assert_that(
+            writer_state.write_many(numpy.arange(101), numpy.full(101, 100), length=6, as_str=True),
+            equal_to(writer_state.write_many(range(101), [100] * 101, length=6, as_str=True)),
+        )
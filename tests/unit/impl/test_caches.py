@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import typing
+
+import pytest
+from hamcrest import (
+    assert_that,
+    equal_to,
+    has_length,
+    has_properties,
+    instance_of,
+    is_,
+    is_in,
+    not_,
+)
+
+from multibar.api.caches import CacheStats, RenderCacheAware
+from multibar.impl.caches import (
+    RENDER_FUNCTIONS,
+    RENDER_TABLES,
+    LRURenderCache,
+    RenderSnapshot,
+    RenderTable,
+    compile_render_function,
+)
+from multibar.impl.calculation_service import ProgressbarCalculationService
+from multibar.impl.sectors import FrozenSector
+from multibar.impl.signatures import SimpleSignature, SquareEmojiSignature
+from tests.pyhamcrest import subclass_of
+
+
+class TestLRURenderCache:
+    def test_base(self) -> None:
+        cache_state: LRURenderCache[str, int] = LRURenderCache(maxsize=2)
+
+        assert_that(LRURenderCache, subclass_of(RenderCacheAware))
+        assert_that(cache_state, has_length(0))
+        assert_that(cache_state.maxsize, equal_to(2))
+        assert_that(cache_state.stats(), instance_of(CacheStats))
+
+    def test_hits_and_misses(self) -> None:
+        cache_state: LRURenderCache[str, int] = LRURenderCache(maxsize=2)
+
+        assert_that(cache_state.get("first"), is_(None))
+        cache_state.put("first", 1)
+        assert_that(cache_state.get("first"), equal_to(1))
+
+        assert_that(
+            cache_state.stats(),
+            has_properties(
+                {
+                    "hits": 1,
+                    "misses": 1,
+                    "currsize": 1,
+                    "hit_ratio": 0.5,
+                },
+            ),
+        )
+
+    def test_lru_eviction(self) -> None:
+        cache_state: LRURenderCache[str, int] = LRURenderCache(maxsize=2)
+        cache_state.put("first", 1)
+        cache_state.put("second", 2)
+
+        # Touching "first" makes "second" least recently used.
+        cache_state.get("first")
+        cache_state.put("third", 3)
+
+        assert_that("first", is_in(cache_state))
+        assert_that("second", not_(is_in(cache_state)))
+        assert_that(cache_state.stats().evictions, equal_to(1))
+
+        cache_state.clear()
+        assert_that(cache_state, has_length(0))
+        assert_that(cache_state.stats().evictions, equal_to(0))
+
+
+def test_render_snapshot() -> None:
+    snapshot = RenderSnapshot.from_signature(SimpleSignature(), length=6, filled=2)
+
+    assert_that(repr(snapshot), equal_to("++----"))
+    assert_that(snapshot, has_length(6))
+    assert_that(snapshot.names, instance_of(tuple))
+    assert_that(snapshot.sectors, has_length(0))
+
+    frozen_snapshot = RenderSnapshot.from_signature(SimpleSignature(), length=6, filled=2, sector_cls=FrozenSector)
+    assert_that([sector.name for sector in frozen_snapshot.sectors], equal_to(list(frozen_snapshot.names)))
+    assert_that(frozen_snapshot.sectors[0], is_(frozen_snapshot.sectors[1]))
+
+
+class TestRenderTable:
+    def test_base(self) -> None:
+        table = RenderTable(SimpleSignature(), length=6)
+
+        # Progressbar of length 6 can be rendered only in 7 different ways.
+        assert_that(table, has_length(7))
+        assert_that(table.get(0), equal_to("------"))
+        assert_that(table.get(6), equal_to("++++++"))
+        assert_that(table.get_capped(3, start_filled=True, end_filled=False), equal_to("<++---"))
+        assert_that(table.render(50, 100, capped=False), equal_to("+++---"))
+        assert_that(table.render(100, 100), equal_to("<++++>"))
+
+    def test_out_of_range(self) -> None:
+        table = RenderTable(SimpleSignature(), length=6)
+
+        # Negative progress is rendered empty and overfilled progress is rendered full.
+        assert_that(table.get(-3), equal_to(table.get(0)))
+        assert_that(table.get(10), equal_to(table.get(6)))
+        assert_that(
+            table.get_capped(10, start_filled=True, end_filled=True),
+            equal_to(table.get_capped(6, start_filled=True, end_filled=True)),
+        )
+        assert_that(table.render(-10, 100), equal_to(table.render(0, 100)))
+        assert_that(table.render(150, 100, capped=False), equal_to("++++++"))
+
+    def test_shared_tables(self) -> None:
+        signature = SimpleSignature()
+        table = RenderTable.for_signature(signature, length=6)
+
+        assert_that(RenderTable.for_signature(signature, length=6), is_(table))
+        assert_that(RenderTable.for_signature(signature, length=7), not_(is_(table)))
+        assert_that((id(signature), 6, id(table._calculation_cls)), is_in(RENDER_TABLES))
+
+
+class TestCompileRenderFunction:
+    @pytest.mark.parametrize("signature", [SimpleSignature(), SquareEmojiSignature()])
+    @pytest.mark.parametrize("calculation_cls", [None, type("Service", (ProgressbarCalculationService,), {})])
+    def test_renders_by_filled_count(self, signature: SimpleSignature, calculation_cls: typing.Any) -> None:
+        render = compile_render_function(signature, length=7, calculation_cls=calculation_cls)
+        on_filled, on_unfilled = signature.middle.on_filled, signature.middle.on_unfilled
+
+        # Out of range progresses are rendered the same way as in-range ones.
+        for start_value in (-10, *range(0, 101), 150):
+            filled = ProgressbarCalculationService(start_value, 100, 7).filled_count()
+            assert_that(render(start_value, 100), equal_to(on_filled * filled + on_unfilled * (7 - filled)))
+
+    def test_shared_functions(self) -> None:
+        signature = SimpleSignature()
+        render = compile_render_function(signature, length=6)
+
+        assert_that(compile_render_function(signature, length=6), is_(render))
+        assert_that(compile_render_function(signature, length=7), not_(is_(render)))
+        assert_that((id(signature), 6, id(ProgressbarCalculationService)), is_in(RENDER_FUNCTIONS))
+
+    def test_invalid_length(self) -> None:
+        with pytest.raises(ValueError):
+            compile_render_function(SimpleSignature(), length=0)
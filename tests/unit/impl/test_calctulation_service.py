@@ -14,11 +14,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import collections.abc
+import decimal
+import fractions
 
-from hamcrest import assert_that, equal_to, has_length, has_properties, instance_of
+import pytest
+from hamcrest import (
+    assert_that,
+    close_to,
+    equal_to,
+    has_length,
+    has_properties,
+    instance_of,
+)
 
 from multibar.api.calculation_service import AbstractCalculationService
-from multibar.impl.calculation_service import ProgressbarCalculationService
+from multibar.impl.calculation_service import (
+    ExactCalculationService,
+    ProgressbarCalculationService,
+    VectorizedCalculationService,
+)
 
 
 def test_percentage() -> None:
@@ -50,3 +64,79 @@ def test_calculation_service() -> None:
 
     assert_that(list(first_part), has_length(calc_service.length_value // 2))
     assert_that(list(second_part), has_length(calc_service.length_value // 2))
+
+
+@pytest.mark.parametrize("length", [1, 3, 7, 10, 20, 100])
+@pytest.mark.parametrize("end_value", [7, 100, 1_000])
+def test_vectorized_calculation_service(length: int, end_value: int) -> None:
+    numpy = pytest.importorskip("numpy")
+
+    # Includes values, that hit rounding ties (e.g. 5 / 100 for length 10).
+    start_values = numpy.arange(0, end_value + 1)
+    calc_service = VectorizedCalculationService(start_values, numpy.full_like(start_values, end_value), length)
+
+    assert_that(
+        calc_service.filled_counts().tolist(),
+        equal_to(
+            [ProgressbarCalculationService(start, end_value, length).filled_count() for start in range(end_value + 1)]
+        ),
+    )
+
+
+def test_vectorized_calculation_service_zero_division() -> None:
+    numpy = pytest.importorskip("numpy")
+
+    with pytest.raises(ZeroDivisionError):
+        VectorizedCalculationService(numpy.array([1]), numpy.array([0]), 20).filled_counts()
+
+
+@pytest.mark.parametrize("length", [1, 3, 7, 10, 20, 100])
+@pytest.mark.parametrize("end_value", [7, 100, 1_000])
+def test_exact_calculation_service(length: int, end_value: int) -> None:
+    for start_value in range(end_value + 1):
+        calc_service = ExactCalculationService(start_value, end_value, length)
+        filled = round(fractions.Fraction(start_value * length, end_value))
+
+        assert_that(calc_service.filled_count(), equal_to(filled))
+        assert_that(list(calc_service.calculate_filled_indexes()), equal_to(list(range(filled))))
+        assert_that(list(calc_service.calculate_unfilled_indexes()), equal_to(list(range(filled, length))))
+        assert_that(
+            calc_service.progress_percents,
+            close_to(ProgressbarCalculationService.get_progress_percentage(start_value, end_value), 1e-9),
+        )
+
+
+def test_exact_calculation_service_huge_integers() -> None:
+    # Float division rounds this progress down to the previous sector.
+    start_value, end_value = 380362675421028446, 15214507016841137782
+    assert_that(ProgressbarCalculationService(start_value, end_value, 20).filled_count(), equal_to(0))
+    assert_that(ExactCalculationService(start_value, end_value, 20).filled_count(), equal_to(1))
+
+    # Ties are rounded half to even.
+    assert_that(ExactCalculationService(2**60, 2**63, 4).filled_count(), equal_to(0))
+    assert_that(ExactCalculationService(3 * 2**60, 2**63, 4).filled_count(), equal_to(2))
+    assert_that(ExactCalculationService(2**60 + 1, 2**63, 4).filled_count(), equal_to(1))
+
+
+@pytest.mark.parametrize(
+    ("start_value", "end_value"),
+    [
+        (fractions.Fraction(1, 3), fractions.Fraction(2, 3)),
+        (decimal.Decimal("0.1"), decimal.Decimal("0.2")),
+        (decimal.Decimal("1E+30"), 2 * 10**30),
+        (fractions.Fraction(-1, 2), -1),
+    ],
+)
+def test_exact_calculation_service_rationals(start_value: object, end_value: object) -> None:
+    calc_service = ExactCalculationService(start_value, end_value, 20)  # type: ignore[arg-type]
+
+    assert_that(calc_service.filled_count(), equal_to(10))
+    assert_that(calc_service.progress_percents, equal_to(50.0))
+
+
+def test_exact_calculation_service_zero_division() -> None:
+    with pytest.raises(ZeroDivisionError):
+        ExactCalculationService(1, 0, 20).filled_count()
+
+    with pytest.raises(ZeroDivisionError):
+        ExactCalculationService(decimal.Decimal(1), fractions.Fraction(0), 20).filled_count()
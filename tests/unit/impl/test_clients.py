@@ -13,12 +13,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import typing
 from functools import partial
 
 import pytest
 from hamcrest import (
     assert_that,
     calling,
+    equal_to,
     greater_than,
     has_length,
     has_properties,
@@ -27,12 +30,15 @@ from hamcrest import (
     raises,
 )
 
-from multibar.api.clients import ProgressbarClientAware
-from multibar.api.contracts import ContractManagerAware
+from multibar.api.clients import AsyncProgressbarClientAware, ProgressbarClientAware
+from multibar.api.contracts import ContractCheck, ContractManagerAware
 from multibar.api.hooks import HooksAware
 from multibar.api.writers import ProgressbarWriterAware
 from multibar.errors import TerminatedContractError
-from multibar.impl.clients import ProgressbarClient
+from multibar.impl.clients import AsyncProgressbarClient, ProgressbarClient
+from multibar.impl.contracts import PROGRESS_RANGE_CONTRACT, WriteProgressContract
+from multibar.impl.hooks import WRITER_HOOKS, Hooks
+from tests.impl.contracts import FakeRestrictedProgressbarContract
 from tests.utils import ConsoleOutputInterceptor
 
 
@@ -51,6 +57,32 @@ class TestProgressbarClient:
             ),
         )
 
+    def test_interface_defaults(self) -> None:
+        client = ProgressbarClient().set_hooks(WRITER_HOOKS)
+
+        # Default implementations of interface give the same results as optimized ones.
+        assert_that(
+            ProgressbarClientAware.get_progress_str(client, 50, 100, length=6),
+            equal_to(client.get_progress_str(50, 100, length=6)),
+        )
+        assert_that(
+            ProgressbarClientAware.get_progress_many(client, [0, 50, 100], [100] * 3, length=6, as_str=True),
+            equal_to(client.get_progress_many([0, 50, 100], [100] * 3, length=6, as_str=True)),
+        )
+        assert_that(repr(ProgressbarClientAware.compile(client)(50, 100, length=6)), equal_to("<++---"))
+
+        with pytest.raises(TerminatedContractError):
+            ProgressbarClientAware.get_progress_many(client, [0, 100], [100, 50])
+
+        assert_that(
+            repr(ProgressbarClientAware.get_progress_percent(client, 50, length=6)),
+            equal_to(repr(client.get_progress_percent(50, length=6))),
+        )
+        assert_that(
+            ProgressbarClientAware.get_progress_ratio_many(client, [-0.5, 0.5, 1.5], length=6, as_str=True),
+            equal_to(client.get_progress_many([0, 50, 100], [100] * 3, length=6, as_str=True)),
+        )
+
     def test_base_contracts(self) -> None:
         client = ProgressbarClient()
 
@@ -62,3 +94,197 @@ class TestProgressbarClient:
             assert_that(calling(partial(client.get_progress, 100, 50)), not_(raises(TerminatedContractError)))
 
         assert_that(output_warnings, has_length(greater_than(0)))
+
+    def test_get_progress_str(self) -> None:
+        client = ProgressbarClient()
+        assert_that(client.get_progress_str(50, 100, length=6), equal_to("+++---"))
+
+        with pytest.raises(TerminatedContractError):
+            client.get_progress_str(100, 50)
+
+        client.set_hooks(WRITER_HOOKS)
+        assert_that(
+            client.get_progress_str(50, 100, length=6),
+            equal_to(repr(client.get_progress(50, 100, length=6))),
+        )
+
+    def test_get_progress_many(self) -> None:
+        client = ProgressbarClient()
+        assert_that(
+            client.get_progress_many([0, 50, 100], [100, 100, 100], length=6, as_str=True),
+            equal_to(["------", "+++---", "++++++"]),
+        )
+        assert_that(
+            [repr(progressbar) for progressbar in client.get_progress_many(iter([50]), iter([100]), length=6)],
+            equal_to(["+++---"]),
+        )
+
+        with pytest.raises(TerminatedContractError):
+            client.get_progress_many([0, 100], [100, 50])
+
+        client.set_hooks(WRITER_HOOKS)
+        assert_that(
+            client.get_progress_many([0, 50, 100], [100, 100, 100], length=6, as_str=True),
+            equal_to([client.get_progress_str(start_value, 100, length=6) for start_value in (0, 50, 100)]),
+        )
+
+    def test_get_progress_scaled(self) -> None:
+        client = ProgressbarClient()
+        expected = repr(client.get_progress(50, 100, length=6))
+
+        assert_that(repr(client.get_progress_ratio(0.5, length=6)), equal_to(expected))
+        assert_that(repr(client.get_progress_percent(50, length=6)), equal_to(expected))
+        assert_that(
+            client.get_progress_percent_many([0, 50, 100], length=6, as_str=True),
+            equal_to(["------", "+++---", "++++++"]),
+        )
+        assert_that(
+            [repr(progressbar) for progressbar in client.get_progress_ratio_many(iter([0.5]), length=6)],
+            equal_to([expected]),
+        )
+
+        with pytest.raises(TerminatedContractError):
+            client.get_progress_percent(101)
+
+        with pytest.raises(TerminatedContractError):
+            client.get_progress_ratio_many([0.5, 1.5])
+
+        client.contract_manager.subscribe(PROGRESS_RANGE_CONTRACT)
+        with pytest.raises(TerminatedContractError):
+            client.get_progress_ratio(-0.1)
+
+    def test_compile(self) -> None:
+        client = ProgressbarClient()
+        get_progress = client.compile()
+        assert_that(repr(get_progress(50, 100, length=6)), equal_to(repr(client.get_progress(50, 100, length=6))))
+
+        with pytest.raises(TerminatedContractError):
+            get_progress(100, 50)
+
+        client.contract_manager.subscribe(FakeRestrictedProgressbarContract())
+        with pytest.raises(TerminatedContractError):
+            get_progress(10, 100, length=21)
+
+    def test_compile_rebuilds_on_hooks_changes(self) -> None:
+        client = ProgressbarClient()
+        get_progress = client.compile()
+        calls: list[tuple[str, object]] = []
+
+        client.hooks.add_pre_execution(lambda *_, metadata: calls.append(("pre", metadata["progressbar"])))
+        get_progress(50, 100)
+        assert_that(calls, equal_to([("pre", None)]))
+
+        client.set_hooks(
+            Hooks().add_post_execution(lambda *_, metadata: calls.append(("post", metadata["progressbar"])))
+        )
+        progressbar = get_progress(50, 100)
+        assert_that(calls[1:], equal_to([("post", progressbar)]))
+
+        # Broken contract triggers on-error hooks, then progressbar is written as by get_progress().
+        client.hooks.add_on_error(lambda *args, **kwargs: calls.append(("error", None)))
+        progressbar = get_progress(100, 50)
+        assert_that(calls[2:], equal_to([("error", None), ("post", progressbar)]))
+
+        # Hooks changed through hook lists rebuild pipeline as well.
+        client.hooks.post_execution_hooks.clear()
+        get_progress(50, 100)
+        assert_that(calls[4:], has_length(0))
+
+    def test_compile_rebuilds_on_contracts_changes(self) -> None:
+        client = ProgressbarClient()
+        get_progress = client.compile()
+        get_progress(10, 100, length=21)
+
+        # Contracts appended through contracts list are checked by compiled pipeline.
+        client.contract_manager.contracts.append(FakeRestrictedProgressbarContract())
+        with pytest.raises(TerminatedContractError):
+            get_progress(10, 100, length=21)
+
+    def test_compile_checks_overridden_contracts(self) -> None:
+        class EvenLengthContract(WriteProgressContract):
+            def check(self, *args: typing.Any, **kwargs: typing.Any) -> ContractCheck:
+                if kwargs["metadata"]["length"] % 2:
+                    return ContractCheck.terminated(errors=["Odd length."], metadata=kwargs["metadata"])
+                return super().check(*args, **kwargs)
+
+        contract = EvenLengthContract()
+        assert_that(contract.compile_check(), equal_to(None))
+
+        client = ProgressbarClient()
+        client.contract_manager.subscribe(contract)
+        with pytest.raises(TerminatedContractError):
+            client.compile()(50, 100, length=5)
+
+
+class TestAsyncProgressbarClient:
+    def test_base(self) -> None:
+        client = AsyncProgressbarClient()
+        assert_that(client, instance_of(AsyncProgressbarClientAware))
+        assert_that(
+            client,
+            has_properties(
+                {
+                    "hooks": instance_of(HooksAware),
+                    "writer": instance_of(ProgressbarWriterAware),
+                    "contract_manager": instance_of(ContractManagerAware),
+                }
+            ),
+        )
+
+    def test_sync_hooks_do_not_await(self) -> None:
+        client = AsyncProgressbarClient()
+        client.set_hooks(WRITER_HOOKS)
+
+        # Coroutine that never suspends finishes on the first step.
+        coroutine = client.get_progress(50, 100, length=6)
+        with pytest.raises(StopIteration) as stop:
+            coroutine.send(None)
+
+        assert_that(
+            repr(stop.value.value),
+            equal_to(repr(ProgressbarClient(hooks=WRITER_HOOKS).get_progress(50, 100, length=6))),
+        )
+
+    def test_async_hooks_run_concurrently(self) -> None:
+        client = AsyncProgressbarClient()
+        started: list[int] = []
+        both_started = asyncio.Event()
+
+        def make_hook(i: int) -> typing.Callable[..., typing.Awaitable[None]]:
+            async def hook(*_: typing.Any, **__: typing.Any) -> None:
+                started.append(i)
+                if len(started) == 2:
+                    both_started.set()
+                # Would time out if hooks were awaited one by one.
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+
+            return hook
+
+        client.hooks.add_post_execution(make_hook(1)).add_post_execution(make_hook(2))
+        assert_that(asyncio.run(client.get_progress_str(50, 100, length=6)), equal_to("+++---"))
+        assert_that(sorted(started), equal_to([1, 2]))
+
+    def test_async_contracts(self) -> None:
+        class AsyncRestrictedProgressbarContract(FakeRestrictedProgressbarContract):
+            async def check(self, *args: typing.Any, **kwargs: typing.Any) -> ContractCheck:  # type: ignore[override]
+                await asyncio.sleep(0)
+                return super().check(*args, **kwargs)
+
+        client = AsyncProgressbarClient()
+        client.contract_manager.subscribe(AsyncRestrictedProgressbarContract())
+        assert_that(asyncio.run(client.get_progress_str(50, 100, length=6)), equal_to("+++---"))
+
+        with pytest.raises(TerminatedContractError):
+            asyncio.run(client.get_progress(50, 100, length=20 + 1))
+
+        errors: list[Exception] = []
+
+        async def on_error(*args: typing.Any, **_: typing.Any) -> None:
+            errors.append(args[-1])
+
+        client.hooks.add_on_error(on_error)
+        asyncio.run(client.get_progress(50, 100, length=20 + 1))
+        assert_that(errors, has_length(1))
+
+        with pytest.raises(TerminatedContractError):
+            asyncio.run(AsyncProgressbarClient().get_progress(100, 50))
@@ -31,7 +31,11 @@ from hamcrest import (
 
 from multibar.api.contracts import ContractAware, ContractManagerAware
 from multibar.errors import TerminatedContractError, UnsignedContractError
-from multibar.impl.contracts import ContractManager
+from multibar.impl.contracts import (
+    PROGRESS_RANGE_CONTRACT,
+    WRITE_PROGRESS_CONTRACT,
+    ContractManager,
+)
 from tests.impl.contracts import FAKE_RESTRICTED_PROGRESSBAR_CONTRACT
 from tests.utils import ConsoleOutputInterceptor
 
@@ -104,3 +108,46 @@ class TestContractManager:
             )
 
         assert_that(output_warnings, has_length(greater_than(0)))
+
+    def test_check_contracts_many(self) -> None:
+        contract_manager = ContractManager()
+        contract_manager.subscribe(FAKE_RESTRICTED_PROGRESSBAR_CONTRACT)
+        contract_manager.subscribe(WRITE_PROGRESS_CONTRACT)
+        batch_metadata = {
+            "start_values": [0, 50, 100],
+            "end_values": [100, 100, 100],
+            "length": 20,
+        }
+
+        assert_that(
+            calling(partial(contract_manager.check_contracts_many, metadata=batch_metadata)),
+            not_(raises(TerminatedContractError)),
+        )
+
+        # Default ContractAware.check_many() checks every item.
+        with pytest.raises(TerminatedContractError):
+            contract_manager.check_contracts_many(metadata={**batch_metadata, "length": 20 + 1})
+
+        # WriteProgressContract.check_many() checks whole batch in one pass.
+        with pytest.raises(TerminatedContractError):
+            contract_manager.check_contracts_many(metadata={**batch_metadata, "end_values": [100, 10, 100]})
+
+    def test_progress_range_contract(self) -> None:
+        contract_manager = ContractManager()
+        contract_manager.subscribe(PROGRESS_RANGE_CONTRACT)
+        metadata = {"start_value": 0, "end_value": 100, "length": 20}
+
+        assert_that(
+            calling(partial(contract_manager.check_contracts, metadata=metadata)),
+            not_(raises(TerminatedContractError)),
+        )
+        assert_that(PROGRESS_RANGE_CONTRACT.compile_check()(-1, 100, 20), equal_to(False))  # type: ignore[misc]
+
+        for broken_metadata in ({**metadata, "start_value": -1}, {**metadata, "start_value": 101}):
+            with pytest.raises(TerminatedContractError):
+                contract_manager.check_contracts(metadata=broken_metadata)
+
+        with pytest.raises(TerminatedContractError):
+            contract_manager.check_contracts_many(
+                metadata={"start_values": [0, -0.5], "end_values": [1, 1], "length": 20},
+            )
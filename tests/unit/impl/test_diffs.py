@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import typing
+
+import pytest
+from hamcrest import assert_that, equal_to, has_length, instance_of
+
+from multibar.api.diffs import ProgressbarDifferAware, SectorChange
+from multibar.impl.clients import ProgressbarClient
+from multibar.impl.diffs import ProgressbarDiffer
+from multibar.impl.hooks import WRITER_HOOKS
+from multibar.impl.progressbars import CompactProgressbar, Progressbar
+from multibar.impl.signatures import SimpleSignature
+from multibar.impl.writers import ProgressbarWriter
+
+
+class _NotIterableCompactProgressbar(CompactProgressbar[typing.Any]):
+    def __iter__(self) -> typing.NoReturn:
+        raise AssertionError("Sectors must not be walked.")
+
+
+def _apply(
+    progressbar: Progressbar[typing.Any],
+    changes: tuple[SectorChange, ...],
+) -> list[tuple[str, bool]]:
+    states = [(s.name, s.is_filled) for s in progressbar]
+    for change in changes:
+        for position in change.positions:
+            states[position] = (change.name, change.is_filled)
+    return states
+
+
+class TestProgressbarDiffer:
+    def test_base(self) -> None:
+        assert_that(ProgressbarDiffer(), instance_of(ProgressbarDifferAware))
+
+    @pytest.mark.parametrize("progressbar_cls", [Progressbar, CompactProgressbar])
+    def test_diff(self, progressbar_cls: typing.Type[Progressbar[typing.Any]]) -> None:
+        differ = ProgressbarDiffer()
+        client = ProgressbarClient(progress_writer=ProgressbarWriter(progressbar_cls=progressbar_cls))
+        client.set_hooks(WRITER_HOOKS)
+
+        for old_value in range(0, 101, 5):
+            for new_value in range(0, 101, 5):
+                old = client.get_progress(old_value, 100, length=10)
+                new = client.get_progress(new_value, 100, length=10)
+                changes = differ.diff(old, new)
+
+                assert_that(_apply(old, changes), equal_to([(s.name, s.is_filled) for s in new]))
+                assert_that(sum(len(change.positions) for change in changes) <= len(new), equal_to(True))
+                if old_value == new_value:
+                    assert_that(changes, has_length(0))
+
+    def test_diff_compact_progressbars_without_walk(self) -> None:
+        sig = SimpleSignature()
+        old = _NotIterableCompactProgressbar(sig, length=10**7, filled=10**6)
+        new = _NotIterableCompactProgressbar(sig, length=10**7, filled=3 * 10**6)
+        new.replace_display_name_for(0, sig.start.on_filled)
+
+        assert_that(
+            ProgressbarDiffer().diff(old, new),
+            equal_to(
+                (
+                    SectorChange(range(0, 1), sig.start.on_filled, True),
+                    SectorChange(range(10**6, 3 * 10**6), sig.middle.on_filled, True),
+                )
+            ),
+        )
+
+    def test_diff_different_lengths(self) -> None:
+        writer = ProgressbarWriter()
+        changes = ProgressbarDiffer().diff(writer.write(50, 100, length=2), writer.write(50, 100, length=4))
+        assert_that(
+            changes,
+            equal_to((SectorChange(range(0, 2), "+", True), SectorChange(range(2, 4), "-", False))),
+        )
@@ -13,13 +13,48 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from hamcrest import assert_that, has_length
+import inspect
+import time
+import typing
 
-from multibar.impl.hooks import Hooks
+import pytest
+from hamcrest import (
+    assert_that,
+    empty,
+    equal_to,
+    greater_than,
+    greater_than_or_equal_to,
+    has_length,
+    has_properties,
+    instance_of,
+)
+
+from multibar.impl.clients import ProgressbarClient
+from multibar.impl.hooks import Hooks, per_item_hook
 from tests.utils import ConsoleOutputInterceptor
 
 
 class TestHooks:
+    def test_hook_lists(self) -> None:
+        hooks = Hooks()
+
+        # Same expectations as in tests/bdd/steps/hooks_step.py
+        assert_that(
+            hooks,
+            has_properties(
+                {
+                    "pre_execution_hooks": equal_to([]),
+                    "post_execution_hooks": equal_to([]),
+                    "on_error_hooks": equal_to([]),
+                },
+            ),
+        )
+        assert_that(hooks.pre_execution_hooks, instance_of(list))
+
+        revision = hooks.revision
+        hooks.on_error_hooks.append(lambda *args, **kwargs: None)
+        assert_that(hooks.revision, greater_than(revision))
+
     def test_trigger_all_hook_callbacks(self) -> None:
         hooks = Hooks()
 
@@ -43,3 +78,101 @@ class TestHooks:
             hooks.trigger_post_execution()
 
         assert_that(on_post_execution, has_length(1))
+
+    def test_trigger_many_hook_callbacks(self) -> None:
+        hooks = Hooks()
+        batch_calls: list[dict[str, object]] = []
+        item_calls: list[tuple[int, int]] = []
+
+        hooks.add_pre_execution(lambda *args, **kwargs: batch_calls.append(kwargs["metadata"]))
+        hooks.add_post_execution(
+            per_item_hook(
+                lambda *args, **kwargs: item_calls.append(
+                    (kwargs["metadata"]["start_value"], kwargs["metadata"]["progressbar"])
+                )
+            )
+        )
+
+        metadata = {
+            "calculation_service_cls": None,
+            "progressbars": None,
+            "start_values": [1, 2, 3],
+            "end_values": [3, 3, 3],
+            "length": 3,
+            "sig": None,
+        }
+        hooks.trigger_pre_execution_many(metadata=metadata)
+        assert_that(batch_calls, equal_to([metadata]))
+
+        hooks.trigger_post_execution_many(metadata={**metadata, "progressbars": ["a", "b", "c"]})
+        assert_that(item_calls, equal_to([(1, "a"), (2, "b"), (3, "c")]))
+
+    def test_gather_closes_coroutines_on_error(self) -> None:
+        hooks = Hooks()
+        coroutines: list[typing.Coroutine[typing.Any, typing.Any, None]] = []
+
+        async def async_hook(*args: typing.Any, **kwargs: typing.Any) -> None:
+            pass
+
+        def failing_hook(*args: typing.Any, **kwargs: typing.Any) -> None:
+            raise ValueError("Hook failed")
+
+        hooks.add_post_execution(lambda *args, **kwargs: coroutines.append(async_hook()) or coroutines[-1])
+        hooks.add_post_execution(failing_hook)
+
+        with pytest.raises(ValueError, match="Hook failed"):
+            hooks.gather_post_execution()
+
+        assert_that(coroutines, has_length(1))
+        assert_that(inspect.getcoroutinestate(coroutines[0]), equal_to(inspect.CORO_CLOSED))
+
+    def test_stats(self) -> None:
+        def slow_hook(*args: object, **kwargs: object) -> None:
+            time.sleep(0.001)
+
+        def failing_hook(*args: object, **kwargs: object) -> None:
+            raise ValueError
+
+        fast_hook = lambda *args, **kwargs: None  # noqa: E731
+        hooks = Hooks().add_pre_execution(fast_hook).add_post_execution(slow_hook).add_on_error(failing_hook)
+        hooks.trigger_pre_execution()
+        assert_that(hooks.stats(), empty())
+
+        hooks.enable_stats()
+        for _ in range(3):
+            hooks.trigger_pre_execution()
+            hooks.trigger_post_execution()
+
+        with pytest.raises(ValueError):
+            hooks.trigger_on_error()
+
+        slow_stats, *other_stats = hooks.stats()
+        assert_that(
+            (slow_stats.callback, slow_stats.stage, slow_stats.calls), equal_to((slow_hook, "post_execution", 3))
+        )
+        assert_that(slow_stats.total_ns, greater_than_or_equal_to(3_000_000))
+        assert_that(slow_stats.mean_ns, greater_than_or_equal_to(1_000_000))
+        assert_that(slow_stats.total_ns, greater_than_or_equal_to(slow_stats.max_ns))
+        assert_that(
+            sorted((hook_stats.stage, hook_stats.calls) for hook_stats in other_stats),
+            equal_to([("on_error", 1), ("pre_execution", 3)]),
+        )
+
+        hooks.disable_stats()
+        assert_that(hooks.collect_stats, equal_to(False))
+        assert_that(hooks.stats(), empty())
+        assert_that(Hooks(collect_stats=True).collect_stats, equal_to(True))
+
+    def test_stats_of_batch_triggers(self) -> None:
+        batch_hook = lambda *args, **kwargs: None  # noqa: E731
+        item_hook = per_item_hook(lambda *args, **kwargs: None)
+        hooks = Hooks(collect_stats=True).add_pre_execution(batch_hook).add_post_execution(item_hook)
+
+        client = ProgressbarClient(hooks=hooks)
+        client.get_progress_many([25, 50, 75], [100] * 3, length=4)
+
+        # Per-item hooks are recorded once per every progressbar.
+        assert_that(
+            {(hook_stats.callback, hook_stats.stage): hook_stats.calls for hook_stats in hooks.stats()},
+            equal_to({(batch_hook, "pre_execution"): 1, (item_hook, "post_execution"): 3}),
+        )
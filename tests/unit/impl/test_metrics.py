@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from hamcrest import assert_that, calling, equal_to, raises
+
+from multibar.errors import TerminatedContractError
+from multibar.impl.clients import ProgressbarClient
+from multibar.impl.hooks import Hooks
+from multibar.impl.metrics import (
+    CLIENT_STAGE_SECONDS,
+    CONTRACT_TERMINATIONS_TOTAL,
+    ON_ERROR_INVOCATIONS_TOTAL,
+    InMemoryMetricsSink,
+    to_prometheus_text,
+)
+
+
+class TestInMemoryMetricsSink:
+    def test_counters(self) -> None:
+        sink = InMemoryMetricsSink()
+        sink.increment("calls_total")
+        sink.increment("calls_total", 2)
+        sink.increment("calls_total", labels={"b": "2", "a": "1"})
+
+        assert_that(
+            sink.counters(),
+            equal_to({("calls_total", ()): 3, ("calls_total", (("a", "1"), ("b", "2"))): 1}),
+        )
+
+    def test_histograms(self) -> None:
+        sink = InMemoryMetricsSink(buckets=(1.0, 2.0))
+        for value in (0.5, 1.0, 1.5, 3.0):
+            sink.observe("latency_seconds", value)
+
+        snapshot = sink.histograms()[("latency_seconds", ())]
+        assert_that(snapshot.cumulative_counts, equal_to((2, 3, 4)))
+        assert_that((snapshot.count, snapshot.sum), equal_to((4, 6.0)))
+
+        sink.clear()
+        assert_that((sink.counters(), sink.histograms()), equal_to(({}, {})))
+
+    def test_invalid_buckets(self) -> None:
+        assert_that(calling(InMemoryMetricsSink).with_args(buckets=()), raises(ValueError))
+        assert_that(calling(InMemoryMetricsSink).with_args(buckets=(2.0, 1.0)), raises(ValueError))
+
+
+def test_to_prometheus_text() -> None:
+    sink = InMemoryMetricsSink(buckets=(0.5,))
+    sink.increment("errors_total", labels={"contract": 'Quoted"Name'})
+    sink.observe("stage_seconds", 0.25, labels={"stage": "write"})
+
+    assert_that(
+        to_prometheus_text(sink).splitlines(),
+        equal_to(
+            [
+                "# TYPE multibar_errors_total counter",
+                'multibar_errors_total{contract="Quoted\\"Name"} 1',
+                "# TYPE multibar_stage_seconds histogram",
+                'multibar_stage_seconds_bucket{stage="write",le="0.5"} 1',
+                'multibar_stage_seconds_bucket{stage="write",le="+Inf"} 1',
+                'multibar_stage_seconds_sum{stage="write"} 0.25',
+                'multibar_stage_seconds_count{stage="write"} 1',
+            ]
+        ),
+    )
+    assert_that(to_prometheus_text(InMemoryMetricsSink()), equal_to(""))
+
+
+def test_client_metrics() -> None:
+    sink = InMemoryMetricsSink()
+    client = ProgressbarClient(metrics=sink)
+    client.get_progress(50, 100)
+    client.get_progress(100, 100)
+
+    stage_counts = {labels: snapshot.count for (name, labels), snapshot in sink.histograms().items()}
+    assert_that(
+        stage_counts,
+        equal_to({(("stage", stage),): 2 for stage in ("metadata", "contracts", "pre_hooks", "write", "post_hooks")}),
+    )
+
+    client.hooks.add_on_error(lambda *args, **kwargs: None)
+    client.get_progress(100, 50)
+    client.set_hooks(Hooks())
+    with pytest.raises(TerminatedContractError):
+        client.get_progress(100, 50)
+
+    assert_that(
+        sink.counters(),
+        equal_to(
+            {
+                (CONTRACT_TERMINATIONS_TOTAL, (("contract", "WriteProgressContract"),)): 2,
+                (ON_ERROR_INVOCATIONS_TOTAL, ()): 1,
+            }
+        ),
+    )
+    assert_that({name for name, _ in sink.histograms()}, equal_to({CLIENT_STAGE_SECONDS}))
+
+
+def test_client_metrics_of_every_method() -> None:
+    sink = InMemoryMetricsSink()
+    client = ProgressbarClient(metrics=sink)
+    client.get_progress_str(50, 100)
+    client.get_progress_many([25, 50], [100, 100], as_str=True)
+    client.get_progress_ratio(0.5)
+    client.get_progress_percent_many([25, 50])
+
+    stage_counts = {labels: snapshot.count for (name, labels), snapshot in sink.histograms().items()}
+    # String paths without post-execution hooks do not trigger them.
+    assert_that(
+        stage_counts,
+        equal_to(
+            {
+                **{(("stage", stage),): 4 for stage in ("metadata", "contracts", "pre_hooks", "write")},
+                (("stage", "post_hooks"),): 2,
+            }
+        ),
+    )
@@ -17,10 +17,14 @@ import collections.abc
 import typing
 from unittest.mock import Mock
 
-from hamcrest import assert_that, has_length, has_properties, instance_of
+import pytest
+from hamcrest import assert_that, equal_to, has_length, has_properties, instance_of
 
 from multibar.api.progressbars import ProgressbarAware
-from multibar.impl.progressbars import Progressbar
+from multibar.api.signatures import GlyphMetrics
+from multibar.impl.progressbars import CompactProgressbar, Progressbar
+from multibar.impl.sectors import Sector
+from multibar.impl.signatures import SignatureSegment, SimpleSignature, glyph_metrics
 from tests.pyhamcrest import subclass_of
 
 
@@ -60,3 +64,105 @@ class TestProgressbars:
 
         progressbar.add_sector(Mock())
         assert_that(progressbar.sectors, has_length(1))
+
+    def test_glyph_metrics(self) -> None:
+        progressbar = Progressbar()
+        for position, name in enumerate(("🟧", "🟧", "-", "-")):
+            progressbar.add_sector(Sector(name, position < 2, position))
+
+        assert_that(progressbar.glyph_metrics, equal_to(glyph_metrics(repr(progressbar))))
+        assert_that(progressbar, has_properties({"display_width": 6, "encoded_size": 10}))
+
+        # Metrics follow every change, including sectors changed in place.
+        progressbar.replace_display_name_for(-1, "漢")
+        assert_that(progressbar, has_properties({"display_width": 7, "encoded_size": 12}))
+        progressbar.add_sector(Sector("-", False, 4))
+        assert_that(progressbar.glyph_metrics, equal_to(GlyphMetrics(8, 13, 5)))
+        progressbar.replace_sector(0, Sector("-", False, 0))
+        assert_that(progressbar.glyph_metrics, equal_to(GlyphMetrics(7, 10, 5)))
+        progressbar[0].change_name("漢")
+        progressbar.sectors.append(Sector("-", False, 5))
+        assert_that(progressbar.glyph_metrics, equal_to(glyph_metrics(repr(progressbar))))
+
+
+class TestCompactProgressbar:
+    def test_base(self) -> None:
+        progressbar_state = CompactProgressbar(SimpleSignature(), length=6, filled=2)
+
+        assert_that(CompactProgressbar, subclass_of(ProgressbarAware))
+        assert_that(progressbar_state, has_length(6))
+        assert_that(repr(progressbar_state), equal_to("++----"))
+        assert_that(progressbar_state[1], has_properties({"name": "+", "is_filled": True, "position": 1}))
+        assert_that(progressbar_state[-1], has_properties({"name": "-", "is_filled": False, "position": 5}))
+        assert_that(progressbar_state[1:3], has_length(2))
+
+        with pytest.raises(IndexError):
+            progressbar_state[6]
+
+    def test_replace_display_name_for(self) -> None:
+        progressbar_state = CompactProgressbar(SimpleSignature(), length=6, filled=2)
+        progressbar_state.replace_display_name_for(0, "<").replace_display_name_for(-1, ">")
+
+        assert_that(repr(progressbar_state), equal_to("<+--->"))
+        assert_that(progressbar_state.overrides, equal_to({0: "<", 5: ">"}))
+        assert_that([s.name for s in progressbar_state.sectors], equal_to(["<", "+", "-", "-", "-", ">"]))
+
+    def test_add_sector(self) -> None:
+        progressbar_state = CompactProgressbar(SimpleSignature())
+        progressbar_state.add_sector(Sector("+", True, 0)).add_sector(Sector("#", False, 1))
+
+        assert_that(progressbar_state, has_properties({"filled": 1, "length": 2, "overrides": {1: "#"}}))
+
+        with pytest.raises(ValueError):
+            progressbar_state.add_sector(Sector("+", True, 2))
+
+    def test_replace_sector(self) -> None:
+        progressbar_state = CompactProgressbar(SimpleSignature(), length=6, filled=2)
+        progressbar_state.replace_sector(1, Sector("#", True, 1))
+        assert_that(progressbar_state.overrides, equal_to({1: "#"}))
+
+        progressbar_state.replace_sector(1, Sector("+", True, 1))
+        assert_that(progressbar_state.overrides, equal_to({}))
+
+        with pytest.raises(ValueError):
+            progressbar_state.replace_sector(1, Sector("-", False, 1))
+
+    def test_clamped_filled(self) -> None:
+        progressbar_state = CompactProgressbar(SimpleSignature(), length=6, filled=8)
+        assert_that(repr(progressbar_state), equal_to("++++++"))
+
+        assert_that(progressbar_state.set_filled(-2), equal_to(range(0, 6)))
+        assert_that(repr(progressbar_state), equal_to("------"))
+        assert_that(progressbar_state.filled, equal_to(0))
+
+    def test_reversed(self) -> None:
+        progressbar = Progressbar()
+        for position, name in enumerate(("<", "+", "-", "-", "-", ">")):
+            progressbar.add_sector(Sector(name, position < 2, position))
+        progressbar_state = CompactProgressbar(SimpleSignature(), length=6, filled=2)
+        progressbar_state.replace_display_name_for(0, "<").replace_display_name_for(-1, ">")
+
+        def _state(bar: typing.Any) -> list[tuple[str, bool, int]]:
+            return [(sector.name, sector.is_filled, sector.position) for sector in bar]
+
+        # Both progressbars are reversed in-place.
+        assert_that(_state(reversed(progressbar_state)), equal_to(_state(reversed(progressbar))))
+        assert_that(repr(progressbar_state), equal_to(">---+<"))
+        assert_that(_state(progressbar_state), equal_to(_state(progressbar)))
+
+        progressbar_state.replace_display_name_for(0, "#")
+        assert_that(repr(progressbar_state), equal_to("#---+<"))
+        assert_that(progressbar_state.set_filled(4), equal_to(range(2, 4)))
+        assert_that(repr(progressbar_state), equal_to("#-+++<"))
+
+        with pytest.raises(ValueError):
+            progressbar_state.add_sector(Sector("-", False, 6))
+
+    @pytest.mark.parametrize("filled", [0, 2, 6, 8])
+    def test_glyph_metrics(self, filled: int) -> None:
+        signature = SimpleSignature(middle=SignatureSegment(on_filled="🟧", on_unfilled="⬛"))
+        progressbar_state = CompactProgressbar(signature, length=6, filled=filled)
+        assert_that(progressbar_state.glyph_metrics, equal_to(glyph_metrics(repr(progressbar_state))))
+
+        progressbar_state.replace_display_name_for(0, "<").replace_display_name_for(-1, ":orange_square:")
+        assert_that(progressbar_state.glyph_metrics, equal_to(glyph_metrics(repr(progressbar_state))))
@@ -15,10 +15,10 @@
 # limitations under the License.
 import typing
 
-from hamcrest import assert_that, equal_to, has_properties, instance_of, not_
+from hamcrest import assert_that, equal_to, has_properties, instance_of, is_, not_
 
 from multibar.api.sectors import AbstractSector
-from multibar.impl.sectors import Sector
+from multibar.impl.sectors import FrozenSector, Sector
 from tests.pyhamcrest import subclass_of
 
 
@@ -49,3 +49,23 @@ class TestSectors:
         sector_state.change_name(new_name)
         assert_that(sector_state.name, not_(equal_to(sector_name)))
         assert_that(sector_state.name, equal_to(new_name))
+
+
+class TestFrozenSectors:
+    def test_base(self) -> None:
+        assert_that(FrozenSector, subclass_of(AbstractSector))
+        assert_that(FrozenSector("name", True, 0), has_properties({"name": "name", "is_filled": True, "position": -1}))
+        assert_that(hasattr(Sector("name", True, 0), "__dict__"), is_(False))
+
+    def test_interning(self) -> None:
+        sector_state = FrozenSector("name", True, 0)
+
+        assert_that(FrozenSector("name", True, 1), is_(sector_state))
+        assert_that(FrozenSector("name", False, 0), not_(is_(sector_state)))
+
+    def test_change_name(self) -> None:
+        sector_state = FrozenSector("name", True, 0)
+        new_sector_state = sector_state.change_name("new_name")
+
+        assert_that(sector_state.name, equal_to("name"))
+        assert_that(new_sector_state, is_(FrozenSector("new_name", True)))
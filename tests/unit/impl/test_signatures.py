@@ -15,13 +15,26 @@
 # limitations under the License.
 from unittest.mock import Mock
 
-from hamcrest import assert_that, instance_of
+import pytest
+from hamcrest import assert_that, equal_to, instance_of, is_not, none, same_instance
 
 from multibar.api.signatures import (
+    GlyphMetrics,
     ProgressbarSignatureProtocol,
     SignatureSegmentProtocol,
 )
-from multibar.impl.signatures import SignatureSegment, SimpleSignature
+from multibar.impl.caches import RenderTable
+from multibar.impl.signatures import (
+    FrozenSignatureSegment,
+    FrozenSimpleSignature,
+    FrozenSquareEmojiSignature,
+    SignatureRegistry,
+    SignatureSegment,
+    SimpleSignature,
+    SquareEmojiSignature,
+    glyph_metrics,
+    signature_key,
+)
 
 
 class TestSignatures:
@@ -30,3 +43,75 @@ class TestSignatures:
 
     def test_simple_signature_base(self) -> None:
         assert_that(SimpleSignature(Mock(), Mock(), Mock()), instance_of(ProgressbarSignatureProtocol))
+
+    def test_frozen_signatures(self) -> None:
+        assert_that(FrozenSignatureSegment("+", "-"), instance_of(SignatureSegmentProtocol))
+        assert_that(FrozenSimpleSignature(), instance_of(ProgressbarSignatureProtocol))
+
+        frozen_signature = FrozenSquareEmojiSignature()
+        assert_that(hash(frozen_signature), equal_to(hash(FrozenSquareEmojiSignature())))
+        assert_that(FrozenSimpleSignature.from_signature(SquareEmojiSignature()), equal_to(frozen_signature))
+
+        with pytest.raises(AttributeError):
+            frozen_signature.start = FrozenSignatureSegment("+", "-")  # type: ignore[misc]
+
+        with pytest.raises(AttributeError):
+            frozen_signature.__dict__
+
+    @pytest.mark.parametrize(
+        ("text", "metrics"),
+        [
+            ("+", GlyphMetrics(1, 1, 1)),
+            (":orange_square:", GlyphMetrics(15, 15, 15)),
+            ("🟧", GlyphMetrics(2, 4, 1)),
+            ("漢字", GlyphMetrics(4, 6, 2)),
+            ("e\u0301", GlyphMetrics(1, 3, 2)),
+            ("⬛\ufe0f", GlyphMetrics(2, 6, 2)),
+        ],
+    )
+    def test_glyph_metrics(self, text: str, metrics: GlyphMetrics) -> None:
+        assert_that(glyph_metrics(text), equal_to(metrics))
+        assert_that(glyph_metrics(text), same_instance(glyph_metrics(text)))
+
+        segment = FrozenSignatureSegment(on_filled=text, on_unfilled="-")
+        assert_that(segment.filled_metrics, equal_to(metrics))
+        assert_that(SignatureSegment(on_filled="-", on_unfilled=text).unfilled_metrics, equal_to(metrics))
+
+
+class TestSignatureRegistry:
+    def test_register(self) -> None:
+        registry = SignatureRegistry()
+        # Default segments are shared between instances, so mutated one is passed explicitly.
+        mutable_signature = SimpleSignature(middle=SignatureSegment("+", "-"))
+
+        assert_that(registry.register(mutable_signature), equal_to(0))
+        assert_that(registry.register(FrozenSimpleSignature()), equal_to(0))
+        assert_that(registry.register(SquareEmojiSignature()), equal_to(1))
+        assert_that(len(registry), equal_to(2))
+
+        # Mutable signatures are registered by frozen copy of their state.
+        mutable_signature.middle.on_filled = "#"
+        assert_that(mutable_signature in registry, equal_to(False))
+        assert_that(registry.get(0), equal_to(FrozenSimpleSignature()))
+        assert_that(registry.get(2), none())
+
+    def test_intern_and_attachments(self) -> None:
+        registry = SignatureRegistry()
+        interned = registry.intern(FrozenSimpleSignature())
+
+        assert_that(registry.intern(SimpleSignature()), same_instance(interned))
+        registry.attachments(0)["widths"] = (1, 1)
+        assert_that(registry.attachments(registry.register(interned)), equal_to({"widths": (1, 1)}))
+
+        with pytest.raises(KeyError):
+            registry.attachments(1)
+
+    def test_signature_key(self) -> None:
+        mutable_signature = SimpleSignature()
+        assert_that(signature_key(mutable_signature), equal_to(id(mutable_signature)))
+        assert_that(signature_key(FrozenSimpleSignature()), equal_to(signature_key(FrozenSimpleSignature())))
+
+        # Equal frozen signatures share process-wide render tables.
+        table = RenderTable.for_signature(FrozenSimpleSignature(), length=5)
+        assert_that(RenderTable.for_signature(FrozenSimpleSignature(), length=5), same_instance(table))
+        assert_that(RenderTable.for_signature(SimpleSignature(), length=5), is_not(same_instance(table)))
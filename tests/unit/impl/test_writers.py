@@ -13,11 +13,30 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import fractions
+import typing
 from unittest.mock import Mock
 
-from hamcrest import assert_that, has_properties, instance_of, is_, is_not
+import pytest
+from hamcrest import (
+    assert_that,
+    equal_to,
+    has_entry,
+    has_length,
+    has_properties,
+    instance_of,
+    is_,
+    is_not,
+)
 
 from multibar.api.writers import ProgressbarWriterAware
+from multibar.impl.caches import LRURenderCache, RenderTable
+from multibar.impl.calculation_service import ExactCalculationService
+from multibar.impl.clients import ProgressbarClient
+from multibar.impl.hooks import WRITER_HOOKS, Hooks
+from multibar.impl.progressbars import CompactProgressbar
+from multibar.impl.sectors import FrozenSector
+from multibar.impl.signatures import SimpleSignature, SquareEmojiSignature
 from multibar.impl.writers import ProgressbarWriter
 from tests.pyhamcrest import subclass_of
 
@@ -39,6 +58,38 @@ class TestProgressbarWriter:
             ),
         )
 
+    def test_interface_defaults(self) -> None:
+        writer_state = ProgressbarWriter(signature=SimpleSignature())
+        start_values, end_values = [0, 25, 50, 100], [100] * 4
+
+        # Default implementations of interface give the same results as optimized ones.
+        assert_that(ProgressbarWriterAware.write_str(writer_state, 50, 100, length=6), equal_to("+++---"))
+        assert_that(
+            ProgressbarWriterAware.write_many(writer_state, start_values, end_values, length=4, as_str=True),
+            equal_to(writer_state.write_many(start_values, end_values, length=4, as_str=True)),
+        )
+        assert_that(
+            [repr(p) for p in ProgressbarWriterAware.write_many(writer_state, start_values, end_values, length=4)],
+            equal_to(writer_state.write_many(start_values, end_values, length=4, as_str=True)),
+        )
+
+        progressbar = writer_state.write(25, 100, length=4)
+        assert_that(ProgressbarWriterAware.update(writer_state, progressbar, 75, 100), equal_to(range(1, 3)))
+        assert_that(repr(progressbar), equal_to("+++-"))
+        assert_that(ProgressbarWriterAware.update(writer_state, progressbar, 75, 100), has_length(0))
+
+        assert_that(repr(ProgressbarWriterAware.write_ratio(writer_state, 0.5, length=4)), equal_to("++--"))
+        assert_that(repr(ProgressbarWriterAware.write_percent(writer_state, 150, length=4)), equal_to("++++"))
+        assert_that(
+            ProgressbarWriterAware.write_ratio_many(writer_state, [-0.5, 0.25, 1], length=4, as_str=True),
+            equal_to(writer_state.write_ratio_many([-0.5, 0.25, 1], length=4, as_str=True)),
+        )
+        assert_that(
+            [repr(p) for p in ProgressbarWriterAware.write_percent_many(writer_state, [25, 75], length=4)],
+            equal_to(["+---", "+++-"]),
+        )
+        assert_that(ProgressbarWriterAware.capped.fget(writer_state), equal_to(False))  # type: ignore[attr-defined]
+
     def test_alternative_constructors(self) -> None:
         writer_state = ProgressbarWriter.from_signature(Mock())
         assert_that(writer_state, instance_of(ProgressbarWriter))
@@ -51,3 +102,204 @@ class TestProgressbarWriter:
 
         writer_state.bind_signature(mock_signature)
         assert_that(writer_state.signature, is_(mock_signature))
+
+    def test_bind_signature_with_precomputed_tables(self) -> None:
+        writer_state = ProgressbarWriter.from_signature(SimpleSignature(), precompute_lengths=(10, 20))
+        assert_that(writer_state.render_tables, has_entry(20, instance_of(RenderTable)))
+
+        # Tables of previous signature are dropped.
+        writer_state.bind_signature(SimpleSignature())
+        assert_that(writer_state.render_tables, has_length(0))
+
+    @pytest.mark.parametrize("capped", [False, True])
+    def test_write_many_out_of_range(self, capped: bool) -> None:
+        writer = ProgressbarWriter.from_signature(SimpleSignature(), precompute_lengths=(10,), capped=capped)
+        start_values = [-20, 0, 50, 100, 150]
+        expected = [repr(writer.write(value, 100, length=10)) for value in start_values]
+
+        # Out of range progresses bypass render table, that would clamp them.
+        assert_that(writer.write_many(start_values, [100] * 5, length=10, as_str=True), equal_to(expected))
+
+    @pytest.mark.parametrize("capped", [False, True])
+    def test_write_str_out_of_range(self, capped: bool) -> None:
+        writers = (
+            ProgressbarWriter(signature=SimpleSignature(), capped=capped),
+            ProgressbarWriter.from_signature(SimpleSignature(), precompute_lengths=(10,), capped=capped),
+        )
+
+        for writer in writers:
+            for start_value in (-20, 150):
+                assert_that(
+                    writer.write_str(start_value, 100, length=10),
+                    equal_to(repr(writer.write(start_value, 100, length=10))),
+                )
+
+            # Zero length fails the same way as in `write()`.
+            with pytest.raises(ZeroDivisionError):
+                writer.write(50, 100, length=0)
+            with pytest.raises(ZeroDivisionError):
+                writer.write_str(50, 100, length=0)
+
+    @pytest.mark.parametrize("capped", [False, True])
+    def test_compact_parity(self, capped: bool) -> None:
+        writer = ProgressbarWriter(signature=SimpleSignature(), capped=capped)
+        compact_writer = ProgressbarWriter(
+            signature=SimpleSignature(), progressbar_cls=CompactProgressbar, capped=capped
+        )
+
+        def _state(progressbar: typing.Any) -> list[tuple[str, bool]]:
+            return [(sector.name, sector.is_filled) for sector in progressbar]
+
+        for length in (1, 2, 10):
+            for start_value in (-20, 0, 50, 100, 150):
+                progressbar = writer.write(start_value, 100, length=length)
+                compact_progressbar = compact_writer.write(start_value, 100, length=length)
+
+                assert_that(repr(compact_progressbar), equal_to(repr(progressbar)))
+                assert_that(compact_progressbar, has_length(len(progressbar)))
+                assert_that(_state(compact_progressbar), equal_to(_state(progressbar)))
+
+    def test_update(self) -> None:
+        writer = ProgressbarWriter()
+        progressbar = writer.write(25, 100, length=4)
+
+        assert_that(writer.update(progressbar, 75, 100), equal_to(range(1, 3)))
+        assert_that(repr(progressbar), equal_to(repr(writer.write(75, 100, length=4))))
+        assert_that([s.position for s in progressbar], equal_to([0, 1, 2, 3]))
+
+        assert_that(writer.update(progressbar, 0, 100), equal_to(range(0, 3)))
+        assert_that(writer.update(progressbar, 0, 100), has_length(0))
+
+    @pytest.mark.parametrize("progressbar_cls", [None, CompactProgressbar])
+    def test_update_out_of_range(self, progressbar_cls: typing.Any) -> None:
+        writer = ProgressbarWriter(progressbar_cls=progressbar_cls)
+        progressbar = writer.write(50, 100, length=4)
+
+        # Out of range progress is clamped to progressbar length.
+        assert_that(writer.update(progressbar, 150, 100), equal_to(range(2, 4)))
+        assert_that(progressbar, has_length(4))
+        assert_that(repr(progressbar), equal_to("++++"))
+
+        assert_that(writer.update(progressbar, -50, 100), equal_to(range(0, 4)))
+        assert_that(repr(progressbar), equal_to("----"))
+        assert_that(progressbar.glyph_metrics.char_count, equal_to(4))
+
+    def test_update_capped(self) -> None:
+        writer = ProgressbarWriter.from_signature(SimpleSignature())
+        progressbar = writer.write(0, 100, length=10)
+
+        # Unfilled `start` & `end` chars of signature are the same as middle ones.
+        assert_that(writer.update(progressbar, 0, 100, capped=True), has_length(0))
+        assert_that(writer.update(progressbar, 10, 100, capped=True), equal_to(range(0, 1)))
+        assert_that(repr(progressbar), equal_to("<---------"))
+
+        assert_that(writer.update(progressbar, 96, 100, capped=True), equal_to(range(1, 10)))
+        assert_that(repr(progressbar), equal_to("<++++++++-"))
+
+        # Filled count stays the same, only `end` char is replaced.
+        assert_that(writer.update(progressbar, 99, 100, capped=True), equal_to(range(9, 10)))
+        assert_that(repr(progressbar), equal_to("<++++++++>"))
+
+    def test_update_compact_progressbar(self) -> None:
+        writer = ProgressbarWriter(progressbar_cls=CompactProgressbar)
+        progressbar = writer.write(25, 100, length=100_000)
+
+        assert_that(writer.update(progressbar, 26, 100), equal_to(range(25_000, 26_000)))
+        assert_that(progressbar, has_properties({"filled": 26_000, "overrides": has_length(0)}))
+
+    @pytest.mark.parametrize(
+        "writer_kwargs",
+        [
+            {},
+            {"progressbar_cls": CompactProgressbar},
+            {"sector_cls": FrozenSector},
+            {"render_cache": LRURenderCache()},
+        ],
+    )
+    def test_capped(self, writer_kwargs: dict[str, typing.Any]) -> None:
+        signature = SquareEmojiSignature()
+        hooked_client = ProgressbarClient(
+            hooks=Hooks().update(WRITER_HOOKS),
+            progress_writer=ProgressbarWriter.from_signature(signature),
+        )
+        writer = ProgressbarWriter(signature=signature, capped=True, **writer_kwargs)
+
+        for length in (1, 2, 5, 20):
+            for start_value in (0, 2, 3, 50, 96, 97, 100):
+                expected = repr(hooked_client.get_progress(start_value, 100, length=length))
+                assert_that(repr(writer.write(start_value, 100, length=length)), equal_to(expected))
+                assert_that(writer.write_str(start_value, 100, length=length), equal_to(expected))
+
+    def test_capped_many(self) -> None:
+        writer = ProgressbarWriter.from_signature(SimpleSignature(), capped=True)
+        start_values = [0, 3, 50, 97, 100]
+        expected = [writer.write_str(value, 100, length=10) for value in start_values]
+
+        assert_that(writer.write_many(start_values, [100] * 5, length=10, as_str=True), equal_to(expected))
+        assert_that(
+            [repr(progressbar) for progressbar in writer.write_many(start_values, [100] * 5, length=10)],
+            equal_to(expected),
+        )
+
+        writer.bind_signature(SimpleSignature(), precompute_lengths=(10,))
+        assert_that(writer.write_many(start_values, [100] * 5, length=10, as_str=True), equal_to(expected))
+
+    def test_capped_fill_thresholds(self) -> None:
+        writer = ProgressbarWriter(signature=SimpleSignature(), capped=True, first_fill=50, last_fill=100)
+
+        assert_that(writer.write_str(40, 100, length=10), equal_to("-+++------"))
+        assert_that(writer.write_str(50, 100, length=10), equal_to("<++++-----"))
+        assert_that(writer.write_str(99, 100, length=10), equal_to("<++++++++-"))
+        assert_that(writer.write_str(100, 100, length=10), equal_to("<++++++++>"))
+
+        # Writer thresholds are used by capped update as well.
+        progressbar = writer.write(40, 100, length=10)
+        writer.update(progressbar, 99, 100)
+        assert_that(repr(progressbar), equal_to("<++++++++-"))
+
+    @pytest.mark.parametrize("capped", [False, True])
+    def test_write_scaled(self, capped: bool) -> None:
+        writer = ProgressbarWriter.from_signature(SimpleSignature(), capped=capped)
+
+        for start_value in (0, 3, 33, 50, 97, 100):
+            expected = repr(writer.write(start_value, 100, length=10))
+            assert_that(repr(writer.write_percent(start_value, length=10)), equal_to(expected))
+            assert_that(repr(writer.write_ratio(start_value / 100, length=10)), equal_to(expected))
+
+        start_values = [0, 3, 33, 50, 97, 100]
+        expected_many = writer.write_many(start_values, [100] * 6, length=10, as_str=True)
+        assert_that(writer.write_percent_many(start_values, length=10, as_str=True), equal_to(expected_many))
+        assert_that(
+            [repr(progressbar) for progressbar in writer.write_ratio_many([v / 100 for v in start_values], length=10)],
+            equal_to(expected_many),
+        )
+
+    @pytest.mark.parametrize("capped", [False, True])
+    def test_write_scaled_out_of_range(self, capped: bool) -> None:
+        writer = ProgressbarWriter.from_signature(SimpleSignature(), capped=capped)
+        empty, full = repr(writer.write(0, 100, length=10)), repr(writer.write(100, 100, length=10))
+
+        assert_that(repr(writer.write_ratio(-0.5, length=10)), equal_to(empty))
+        assert_that(repr(writer.write_percent(150, length=10)), equal_to(full))
+        assert_that(writer.write_ratio_many([-0.5, 1.5], length=10, as_str=True), equal_to([empty, full]))
+        assert_that(writer.write_percent_many([-50, 150], length=10, as_str=True), equal_to([empty, full]))
+
+    def test_write_scaled_arrays(self) -> None:
+        numpy = pytest.importorskip("numpy")
+        writer = ProgressbarWriter()
+        percents = numpy.arange(0, 101)
+
+        assert_that(
+            writer.write_percent_many(percents, length=7, as_str=True),
+            equal_to(writer.write_percent_many(percents.tolist(), length=7, as_str=True)),
+        )
+        assert_that(
+            writer.write_ratio_many(percents / 100, length=7, as_str=True),
+            equal_to(writer.write_ratio_many((percents / 100).tolist(), length=7, as_str=True)),
+        )
+
+    def test_write_scaled_with_calculation_cls(self) -> None:
+        writer = ProgressbarWriter(calculation_service=ExactCalculationService)
+
+        assert_that(repr(writer.write_ratio(fractions.Fraction(1, 3), length=3)), equal_to("+--"))
+        assert_that(writer.write_percent_many([50, 100], length=2, as_str=True), equal_to(["+-", "++"]))
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import importlib
+import pkgutil
+import subprocess
+import sys
+
+import pytest
+from hamcrest import assert_that, equal_to, has_item, less_than, not_, same_instance
+
+import multibar
+
+IMPORT_TIME_BUDGET_US = 50_000
+"""Budget of cumulative `import multibar` time in microseconds."""
+
+HEAVY_DEPENDENCIES = ("asyncio", "numpy", "returns", "termcolor", "typing_extensions")
+"""Dependencies that must not be imported by `import multibar`."""
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative_times = {}
+    # Lines look like "import time:       self [us] |  cumulative | imported package".
+    for line in process.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        cumulative_times[name.strip()] = int(cumulative)
+    return cumulative_times
+
+
+@pytest.mark.parametrize("package_name", ["multibar.api", "multibar.impl"])
+def test_lazy_exports(package_name: str) -> None:
+    package = importlib.import_module(package_name)
+    for name, submodule in package._EXPORTS.items():
+        assert_that(
+            getattr(importlib.import_module(f"{package_name}.{submodule}"), name), same_instance(getattr(package, name))
+        )
+
+    assert_that(package.__all__, equal_to(tuple(package._EXPORTS)))
+
+
+@pytest.mark.parametrize("package_name", ["multibar.api", "multibar.impl"])
+def test_submodule_names_are_exported(package_name: str) -> None:
+    package = importlib.import_module(package_name)
+    for module_info in pkgutil.iter_modules(package.__path__):
+        submodule = importlib.import_module(f"{package_name}.{module_info.name}")
+        for name in submodule.__all__:
+            # Names are resolved through package `__getattr__`, not through `globals()`.
+            assert_that(package.__getattr__(name), same_instance(getattr(submodule, name)))
+
+
+def test_main_package_exports() -> None:
+    assert_that(multibar.__all__, equal_to(multibar.api.__all__ + multibar.impl.__all__))
+    assert_that(multibar.hooks, same_instance(multibar.impl.hooks))
+    assert_that(multibar.output, same_instance(importlib.import_module("multibar.output")))
+    assert_that(dir(multibar), has_item("ProgressbarClient"))
+
+    with pytest.raises(AttributeError):
+        multibar.missing_attribute
+
+
+def test_import_time_budget() -> None:
+    # Minimum of several runs is less affected by noise.
+    import_times = min((_import_times("import multibar") for _ in range(3)), key=lambda times: times["multibar"])
+
+    assert_that(import_times["multibar"], less_than(IMPORT_TIME_BUDGET_US))
+    for dependency in HEAVY_DEPENDENCIES:
+        assert_that(import_times, not_(has_item(dependency)))
+
+
+def test_writer_does_not_import_console_output() -> None:
+    import_times = _import_times("from multibar import ProgressbarWriter")
+
+    for module_name in ("asyncio", "termcolor", "returns.io", "multibar.output", "multibar.settings"):
+        assert_that(import_times, not_(has_item(module_name)))
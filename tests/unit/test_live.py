@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+from unittest.mock import Mock
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from multibar.live import FrameCompositor, LiveRenderer
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFrameCompositor:
+    def test_layout(self) -> None:
+        compositor = FrameCompositor()
+        assert_that(
+            compositor.layout([("a", "+-", 50.0), ("abc", "++", 100.0)]),
+            equal_to(["a   +-  50.0%", "abc ++ 100.0%"]),
+        )
+        assert_that(
+            FrameCompositor(show_labels=False, show_percentage=False).layout([("a", "+-", 50.0)]),
+            equal_to(["+-"]),
+        )
+
+    def test_draw_only_changed_lines(self) -> None:
+        stream = io.StringIO()
+        compositor = FrameCompositor(stream=stream)
+
+        assert_that(compositor.draw(["a", "b", "c"]), equal_to(3))
+        assert_that(stream.getvalue(), equal_to("\ra\nb\nc"))
+
+        # Unchanged frame is not written at all.
+        stream.seek(0), stream.truncate()
+        assert_that(compositor.draw(["a", "b", "c"]), equal_to(0))
+        assert_that(stream.getvalue(), equal_to(""))
+
+        stream.seek(0), stream.truncate()
+        assert_that(compositor.draw(["A", "b", "c", "d"]), equal_to(2))
+        assert_that(stream.getvalue(), equal_to("\x1b[2F\x1b[2KA\x1b[2E\nd"))
+
+        stream.seek(0), stream.truncate()
+        assert_that(compositor.draw(["A"]), equal_to(3))
+        assert_that(stream.getvalue(), equal_to("\x1b[2F\x1b[2K\x1b[1E\x1b[2K\x1b[1E\x1b[2K"))
+        assert_that(compositor.lines, equal_to(["A", "", "", ""]))
+
+        stream.seek(0), stream.truncate()
+        compositor.close()
+        assert_that(stream.getvalue(), equal_to("\n"))
+        assert_that(compositor.lines, equal_to([]))
+
+    def test_single_write_per_frame(self) -> None:
+        stream = Mock()
+        compositor = FrameCompositor(stream=stream)
+
+        compositor.draw([str(i) for i in range(500)])
+        compositor.draw([str(i) if i % 100 else "changed" for i in range(500)])
+        assert_that(stream.write.call_count, equal_to(2))
+
+
+class TestLiveRenderer:
+    def test_fps_validation(self) -> None:
+        with pytest.raises(ValueError):
+            LiveRenderer(fps=0)
+
+        assert_that(LiveRenderer(fps=25).fps, equal_to(25))
+
+    def test_updates_are_coalesced(self) -> None:
+        stream, clock = io.StringIO(), FakeClock()
+        compositor = FrameCompositor(stream=stream)
+        renderer = LiveRenderer(fps=10, length=4, compositor=compositor, clock=clock)
+
+        renderer.update("bar", 0, 100)  # First update is drawn immediately.
+        for start_value in range(1, 100):
+            renderer.update("bar", start_value, 100)
+
+        assert_that(compositor.lines, equal_to(["bar ----   0.0%"]))
+
+        clock.now = 0.1
+        renderer.update("bar", 50, 100)
+        assert_that(compositor.lines, equal_to(["bar ++--  50.0%"]))
+        assert_that(stream.getvalue(), equal_to("\rbar ----   0.0%\r\x1b[2Kbar ++--  50.0%"))
+
+    def test_multiple_progressbars(self) -> None:
+        stream, clock = io.StringIO(), FakeClock()
+        compositor = FrameCompositor(stream=stream, show_percentage=False)
+
+        with LiveRenderer(fps=10, length=4, compositor=compositor, clock=clock) as renderer:
+            renderer.update("first", 0, 100)
+            renderer.update("second", 100, 100)
+            assert_that(compositor.lines, equal_to(["first ----"]))
+
+            renderer.refresh()
+            assert_that(compositor.lines, equal_to(["first  ----", "second ++++"]))
+
+            renderer.update("first", 100, 100)
+
+        assert_that(
+            stream.getvalue(),
+            equal_to(
+                "\rfirst ----"
+                "\r\x1b[2Kfirst  ----\nsecond ++++"
+                # Only changed line is rewritten.
+                "\x1b[1F\x1b[2Kfirst  ++++"
+                "\x1b[1E\n"
+            ),
+        )
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# cython: language_level=3
+# Copyright 2022 Animatea
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest.mock import Mock
+
+import pytest
+import termcolor
+from hamcrest import assert_that, equal_to, has_length
+
+from multibar import output
+from multibar.api.contracts import ContractCheck
+from multibar.impl.contracts import WRITE_PROGRESS_CONTRACT
+
+
+@pytest.fixture()
+def buffered_stream(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    stream = Mock()
+    # Replaces cached printer of prebound output functions.
+    monkeypatch.setitem(output._output.__dict__, "printer", output.BufferedPrinter(stream))
+    return stream
+
+
+class TestBufferedPrinter:
+    def test_print(self) -> None:
+        stream = Mock()
+        printer = output.BufferedPrinter(stream)
+
+        printer.print("Hello", color="red", bold=True)
+        printer.print("World", newline=False)
+        assert_that(stream.write.call_count, equal_to(0))
+
+        printer.flush()
+        stream.write.assert_called_once_with(
+            termcolor.colored("Hello", "red", attrs=["bold"]) + "\n" + termcolor.colored("World")
+        )
+
+    def test_flush_threshold(self) -> None:
+        stream = Mock()
+        printer = output.BufferedPrinter(stream, flush_threshold=3)
+
+        printer.print("1")
+        printer.print("2\n3")
+        assert_that(printer.buffer, has_length(0))
+        assert_that(stream.write.call_count, equal_to(1))
+
+    def test_heading_is_single_write(self, buffered_stream: Mock) -> None:
+        output.print_heading("Heading", level=1)
+        assert_that(buffered_stream.write.call_count, equal_to(1))
+
+        output.print_success("Success")
+        assert_that(buffered_stream.write.call_count, equal_to(2))
+
+    def test_broken_contract_report_is_single_write(self, buffered_stream: Mock) -> None:
+        check = ContractCheck.terminated(warnings=["Warning."], errors=["First error.", "Second error."])
+        WRITE_PROGRESS_CONTRACT.render_terminated_contract(check, raise_errors=False)
+        assert_that(buffered_stream.write.call_count, equal_to(1))
@@ -15,7 +15,7 @@
 # limitations under the License.
 from hamcrest import assert_that, equal_to, is_in, not_
 
-from multibar.utils import cached_property, none_or
+from multibar.utils import TrackedList, cached_property, none_or
 
 
 class MockClass:
@@ -71,3 +71,18 @@ class TestNoneOr:
         result = none_or(int, cls)
 
         assert_that(result, equal_to(float))
+
+
+class TestTrackedList:
+    def test_mutations_bump_revision(self) -> None:
+        items = TrackedList([3, 1])
+        assert_that((items, items.revision), equal_to(([3, 1], 0)))
+
+        items.append(2)
+        items.sort()
+        items += [4]
+        del items[0]
+        assert_that((items, items.revision), equal_to(([2, 3, 4], 4)))
+
+        # Reading does not change revision.
+        assert_that((items[0], len(items), items.revision), equal_to((2, 3, 4)))